@@ -30,6 +30,7 @@ class Application:
         self.running, self.playing = True, False
         self.UP_KEY, self.DOWN_KEY, self.START_KEY, self.BACK_KEY = False, False, False, False
         self.LEFT_KEY, self.RIGHT_KEY = False, False
+        self.ZOOM_IN_KEY, self.ZOOM_OUT_KEY = False, False
         # background image
         self.bg = pygame.image.load('images/maze_image1.jpg')
 
@@ -58,13 +59,17 @@ class Application:
         if self.playing:
             if self.mode == "Information":
                 game = InfoGame(self.filename_map,
-                                self.display)
+                                self.display, amount_robots=self.game_amount_robots)
             elif self.mode == "Cooperation":
-                game = CoopGame(self.filename_map, self.display)
+                game = CoopGame(self.filename_map, self.display, amount_robots=self.game_amount_robots)
             elif self.mode == "Mute":
-                game = MuteGame(self.filename_map, self.display)
+                game = MuteGame(self.filename_map, self.display, amount_robots=self.game_amount_robots)
             game.load()
         self.display.fill((0, 0, 0))
+        if game is not None:
+            # the game updates only the cells it draws, the rest of the screen is cleared once
+            self.screen.blit(self.display, (0, 0))
+            pygame.display.update()
         while self.playing:
             self.check_events()
             if self.START_KEY:
@@ -74,10 +79,14 @@ class Application:
                 self.playing = False
                 score_screen = True
             if game is not None:
+                self.control_view(game.renderer)
                 game.step()
             steps += 1
-            self.screen.blit(self.display, (0, 0))
-            pygame.display.update()
+            # only the cells drawn in this step are copied to the screen and updated
+            rects = game.renderer.take_dirty_rects()
+            for rect in rects:
+                self.screen.blit(self.display, rect, rect)
+            pygame.display.update(rects)
             self.reset()
             self.clock.tick(20)
         self.display.fill((0, 0, 0))
@@ -91,6 +100,22 @@ class Application:
             self.reset()
             self.clock.tick(15)
 
+    def control_view(self, renderer):
+        """Zooms the view of the game with +/- and pans it with the arrow keys
+        by a quarter of the visible cells."""
+        if renderer is None or renderer.viewport is None:
+            return
+        if self.ZOOM_IN_KEY:
+            renderer.zoom(2)
+        if self.ZOOM_OUT_KEY:
+            renderer.zoom(0.5)
+        step_x = max(1, renderer.viewport.columns // 4)
+        step_y = max(1, renderer.viewport.rows // 4)
+        delta_x = (self.RIGHT_KEY - self.LEFT_KEY) * step_x
+        delta_y = (self.DOWN_KEY - self.UP_KEY) * step_y
+        if delta_x or delta_y:
+            renderer.pan(delta_x, delta_y)
+
     def check_events(self):
         """The check_events method is responsible for handling user input events.
          It loops over all events in the event queue obtained from pygame.event.get().
@@ -117,16 +142,21 @@ class Application:
                     self.LEFT_KEY = True
                 if event.key == pygame.K_RIGHT:
                     self.RIGHT_KEY = True
+                if event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                    self.ZOOM_IN_KEY = True
+                if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    self.ZOOM_OUT_KEY = True
 
     def reset(self):
         """The reset method is used to reset the state of the key
         variables in the Application class. It sets all the key
         variables (UP_KEY, DOWN_KEY, START_KEY, BACK_KEY, LEFT_KEY,
-        RIGHT_KEY) to False. This method is typically
+        RIGHT_KEY, ZOOM_IN_KEY, ZOOM_OUT_KEY) to False. This method is typically
         called after processing user input in order to reset the
         state of the keys for the next iteration or frame of
         the game loop."""
         self.UP_KEY, self.DOWN_KEY, self.START_KEY, self.BACK_KEY, self.LEFT_KEY, self.RIGHT_KEY = False, False, False, False, False, False
+        self.ZOOM_IN_KEY, self.ZOOM_OUT_KEY = False, False
 
     def draw_text(self, text, size, x, y):
         """
@@ -0,0 +1,92 @@
+"""
+Command line benchmark of the game modes.
+
+Runs headless games for every combination of the chosen maps, modes,
+amounts of robots and seeds and reports the measurements as JSON or CSV.
+Example:
+    $ python3 benchmark.py --maps Race Athens --modes Information --robots 1 2 --format csv
+"""
+import argparse
+import csv
+import json
+import sys
+from os import listdir
+from os.path import isfile, join
+
+import settings
+from gamePackage.assignment import ASSIGNMENT_STRATEGIES
+from gamePackage.pathfinders import PATHFINDERS
+from gamePackage.runner import GAME_MODES, RESULT_FIELDS
+from gamePackage.sweep import execute_run, sweep_runs
+
+
+def map_paths(names):
+    """Returns paths of the chosen maps, all maps from settings.MAPS_PATH when names are empty."""
+    if not names:
+        return sorted(join(settings.MAPS_PATH, f) for f in listdir(settings.MAPS_PATH)
+                      if isfile(join(settings.MAPS_PATH, f)))
+    paths = []
+    for name in names:
+        if isfile(name):
+            paths.append(name)
+        elif name.endswith('.txt'):
+            paths.append(join(settings.MAPS_PATH, name))
+        else:
+            paths.append(join(settings.MAPS_PATH, f'{name}.txt'))
+    return paths
+
+
+def add_run_arguments(parser):
+    """Adds the arguments choosing the runs and the report, shared by benchmark.py and sweep.py."""
+    parser.add_argument('--maps', nargs='*', default=[],
+                        help='map names or paths, all maps from the maps directory by default')
+    parser.add_argument('--modes', nargs='*', default=list(GAME_MODES), choices=list(GAME_MODES),
+                        help='game modes to run, all by default')
+    parser.add_argument('--robots', nargs='*', type=int, default=[None],
+                        help='amounts of robots to take from the map, all robots by default')
+    parser.add_argument('--seeds', nargs='*', type=int, default=[0],
+                        help='seeds of the random generator, 0 by default, the games are deterministic '
+                             'so more seeds only repeat the runs')
+    parser.add_argument('--assignments', nargs='*', default=['greedy'], choices=list(ASSIGNMENT_STRATEGIES),
+                        help='assignment strategies of the Information mode, greedy by default')
+    parser.add_argument('--pathfinders', nargs='*', default=['a_star'], choices=list(PATHFINDERS),
+                        help='pathfinders of the Cooperation and Mute games, a_star by default')
+    parser.add_argument('--max-steps', type=int, default=10000,
+                        help='maximal number of steps of one game')
+    parser.add_argument('--format', choices=['json', 'csv'], default='json',
+                        help='format of the report')
+    parser.add_argument('--output', help='file for the report, standard output by default')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the game modes on the maps.')
+    add_run_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def write_report(results, report_format, file, fields=RESULT_FIELDS):
+    """Writes the results as a JSON list or as CSV rows with a header of the fields."""
+    if report_format == 'json':
+        json.dump(results, file, indent=2)
+        file.write('\n')
+    else:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    runs = sweep_runs(map_paths(args.maps), args.modes, args.robots, args.seeds, args.assignments,
+                      args.pathfinders, args.max_steps)
+    results = [execute_run(run)[1] for run in runs]
+
+    if args.output:
+        with open(args.output, 'w', newline='') as file:
+            write_report(results, args.format, file)
+    else:
+        write_report(results, args.format, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
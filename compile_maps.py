@@ -0,0 +1,47 @@
+"""
+Compiles text maps into the binary format of gamePackage.compiled_map.
+
+The compiled maps are written into the cache next to the sources, where
+Game.load finds them, and are compiled again only when a source changed.
+Reports the size of every compiled map and the time of loading it.
+Example:
+    $ python3 compile_maps.py --maps Race Athens
+"""
+import argparse
+import os
+import time
+
+from benchmark import map_paths
+from gamePackage.compiled_map import cached_path, load_map, source_digest
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Compile the maps into the binary format.')
+    parser.add_argument('--maps', nargs='*', default=[],
+                        help='names or paths of the maps, all maps by default')
+    parser.add_argument('--no-distance-field', action='store_true',
+                        help='leave the delivery field out of the compiled maps')
+    parser.add_argument('--force', action='store_true', help='compile the maps even if they are cached')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    for path in map_paths(args.maps):
+        target = cached_path(path, source_digest(path))
+        if args.force and os.path.isfile(target):
+            os.remove(target)
+        cached = os.path.isfile(target)
+        start = time.perf_counter()
+        load_map(path, distance_field=not args.no_distance_field)
+        compile_time = time.perf_counter() - start
+        start = time.perf_counter()
+        load_map(path)
+        load_time = time.perf_counter() - start
+        compiled = 'loaded from the cache' if cached else 'compiled'
+        print(f'{path} -> {target}: {os.path.getsize(target)} bytes, '
+              f'{compiled} in {compile_time:.3f} s, loads in {load_time * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
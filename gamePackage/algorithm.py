@@ -1,10 +1,15 @@
 """
-This module provides various utility functions for heap operations,
-copying objects, and generating random values.
+This module provides the path searching functions used by the robots.
+Every function taking a maze accepts either a Grid or a list of rows of map symbols,
+games pass their Grid so that the static walls are never copied or rebuilt.
 """
 import heapq
-import copy
-import random
+from array import array
+from collections import deque, OrderedDict
+from typing import NamedTuple
+
+from gamePackage.grid import Grid
+from gamePackage.explored_cells import ExploredCells
 
 
 # These lists represent the offsets for the four cardinal directions: up, right, down, and left.
@@ -12,11 +17,60 @@ X = [0, 1, 0, -1]
 Y = [-1, 0, 1, 0]
 
 
+class SearchStats:
+    """
+    Counters of the searches made by the pathfinders, the distance fields
+    and the searches for unexplored cells. a_star_calls counts only the A* searches
+    of the pathfinders (a_star, Jump Point Search and the hierarchical pathfinder),
+    paths answered by a PathCache are not searched and not counted.
+    They are never reset by the games, benchmarks reset them before every run.
+    """
+    def __init__(self):
+        self.searches = 0
+        self.a_star_calls = 0
+        self.nodes_expanded = 0
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        self.searches = 0
+        self.a_star_calls = 0
+        self.nodes_expanded = 0
+
+    def as_dict(self):
+        """
+        :return: A dictionary with the current value of every counter
+        """
+        return {'searches': self.searches, 'a_star_calls': self.a_star_calls,
+                'nodes_expanded': self.nodes_expanded}
+
+
+search_stats = SearchStats()
+
+
+def as_grid(maze):
+    """Returns the maze itself if it is a Grid, otherwise builds a Grid from its rows."""
+    if isinstance(maze, Grid):
+        return maze
+    return Grid.from_rows(maze)
+
+
+def as_position(point):
+    """
+    :return: The position (x, y) of the point, which is either an object with x and y
+     attributes like a Robot or Mazes, or already a plain (x, y) tuple
+    """
+    if isinstance(point, tuple):
+        return point
+    return point.x, point.y
+
+
 def is_valid(pos_x, pos_y, maze):
     """The isValid function checks if a given position (x, y)
     is within the boundaries of the maze and does not
     contain an obstacle denoted by the letter 'X'.
     Returns True if the position is valid, False otherwise."""
+    if isinstance(maze, Grid):
+        return maze.is_open(pos_x, pos_y)
     return 0 <= pos_y < len(maze) and 0 <= pos_x < len(maze[pos_y]) and maze[pos_y][pos_x] != 'X'
 
 
@@ -45,78 +99,299 @@ def manhattan_distance(cell1, cell2):
     return abs(cell1[0] - cell2[0]) + abs(cell1[1] - cell2[1])
 
 
-def a_star(mazer, robot, maze):
+class PathCache:
+    """
+    Class that keeps the most recently used paths between two cells.
+    Paths are only valid for one layout of walls and one pathfinder, so every game has its own cache.
+    Besides exact (start, goal) queries the cache reuses parts of stored paths:
+    any tail of a shortest path is a shortest path from its first cell to the same goal,
+    and any head of it is a shortest path from the same start to its last cell.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize  # Maximal number of stored paths
+        self.hits = 0  # Number of queries answered by the cache
+        self.misses = 0  # Number of queries that needed a search
+        self._paths = OrderedDict()  # (start, goal) -> (path, {cell: index in path}), oldest first
+        self._by_start = {}  # start -> keys of the stored paths from it
+        self._by_goal = {}  # goal -> keys of the stored paths to it
+
+    def __len__(self):
+        return len(self._paths)
+
+    def get(self, start, goal):
+        """
+        Looks up a path from start to goal, both (y, x) cells.
+        :return: A new list of cells from start to goal, or None if no stored path contains it
+        """
+        key = (start, goal)
+        if key in self._paths:
+            self._paths.move_to_end(key)
+            self.hits += 1
+            return list(self._paths[key][0])
+        # a stored path to the same goal passing through the start
+        for stored_key in self._by_goal.get(goal, ()):
+            path, index = self._paths[stored_key]
+            if start in index:
+                self._paths.move_to_end(stored_key)
+                self.hits += 1
+                return list(path[index[start]:])
+        # a stored path from the same start passing through the goal
+        for stored_key in self._by_start.get(start, ()):
+            path, index = self._paths[stored_key]
+            if goal in index:
+                self._paths.move_to_end(stored_key)
+                self.hits += 1
+                return list(path[:index[goal] + 1])
+        self.misses += 1
+        return None
+
+    def put(self, start, goal, path):
+        """Stores a path from start to goal, evicting the least recently used one if full."""
+        key = (start, goal)
+        if key in self._paths:
+            self._paths.move_to_end(key)
+            return
+        path = tuple(path)
+        self._paths[key] = (path, {cell: i for i, cell in enumerate(path)})
+        self._by_start.setdefault(start, set()).add(key)
+        self._by_goal.setdefault(goal, set()).add(key)
+        while len(self._paths) > self.maxsize:
+            (old_start, old_goal), _ = self._paths.popitem(last=False)
+            self._discard(self._by_start, old_start, (old_start, old_goal))
+            self._discard(self._by_goal, old_goal, (old_start, old_goal))
+
+    def clear(self):
+        """Removes all stored paths and resets the counters."""
+        self._paths.clear()
+        self._by_start.clear()
+        self._by_goal.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _discard(index, cell, key):
+        keys = index[cell]
+        keys.discard(key)
+        if not keys:
+            del index[cell]
+
+
+def cached_search(search, start, goal, maze, cache=None):
+    """
+    Runs the search of a pathfinder, e.g. find_path, between two plain (x, y) positions.
+    If a PathCache is given, the path is looked up there first and found paths are stored into it.
+    :return: The cells (y, x) of the path from start to goal, None if there is none
+    """
+    key = ((start[1], start[0]), (goal[1], goal[0]))
+    if cache is not None:
+        path = cache.get(*key)
+        if path is not None:
+            return path
+    path = search(start, goal, maze)
+    if cache is not None and path is not None:
+        cache.put(*key, path)
+    return path
+
+
+def a_star(mazer, robot, maze, cache=None):
     """The aStar function implements the A* search algorithm
     to find the optimal path from the robot's position to
-    the mazer's position in the given maze."""
-    maze = copy.deepcopy(maze)
-    path_length = 0
+    the mazer's position in the given maze.
+    The path is set as robot.path and its length is returned.
+    Both positions may be given as plain (x, y) tuples as well,
+    a tuple instead of a robot only gets the length.
+    If a PathCache is given, the path is looked up there first
+    and found paths are stored into it."""
+    path = cached_search(find_path, as_position(robot), as_position(mazer), maze, cache)
+    if not isinstance(robot, tuple):
+        robot.path = path if path is not None else []
+    return len(path) - 1 if path is not None else None
 
-    queue = []
-    start = (robot.y, robot.x)
-    goal = (mazer.y, mazer.x)
-    # initialize a dictionary to keep track of the f-score of each cell
-    f_scores = {start: manhattan_distance(start, goal)}
 
+def find_path(start, goal, maze):
+    """
+    Finds a shortest path between two plain positions with the A* search algorithm.
+    Args:
+        start (tuple): The position (x, y) the path starts at.
+        goal (tuple): The position (x, y) the path ends at.
+        maze (Grid): The grid representing the layout of the maze.
+    Returns:
+        list: The cells (y, x) of the path from start to goal, None if there is none.
+    """
+    start_x, start_y = start
+    goal_x, goal_y = goal
+    start, goal = (start_y, start_x), (goal_y, goal_x)
+
+    grid = as_grid(maze)
+    search_stats.searches += 1
+    search_stats.a_star_calls += 1
+    if not grid.is_open(start_x, start_y) or not grid.is_open(goal_x, goal_y):
+        return None
+
+    # cells are flat indices of the grid, ordering them is the same as ordering (y, x) tuples
+    width = grid.width
+    start_index = grid.index(start_x, start_y)
+    goal_index = grid.index(goal_x, goal_y)
+
+    queue = []
     # initialize a dictionary to keep track of the g-score of each cell
-    g_scores = {start: 0}
+    g_scores = {start_index: 0}
 
     # initialize a dictionary to keep track of the parent cell of each cell in the optimal path
     parents = {}
 
     # add the start cell to the priority queue with priority equal to its f-score
-    heapq.heappush(queue, (f_scores[start], start))
+    heapq.heappush(queue, (manhattan_distance(start, goal), start_index))
 
     while queue:
         # pop the cell with the lowest f-score from the priority queue
-        _, current_cell = heapq.heappop(queue)
-        if current_cell == goal:
-            path = [goal]
-            while path[-1] != start:
-                path.append(parents[path[-1]])
-                path_length += 1
-            path.reverse()
-            robot.path = path
-            return path_length
-        neighbors = get_neighbors(current_cell, maze)
-
-        for neighbor in neighbors:
-            # calculate the tentative g-score of the neighbor
-            tentative_g_score = g_scores[current_cell] + 1
+        _, current_index = heapq.heappop(queue)
+        search_stats.nodes_expanded += 1
+        if current_index == goal_index:
+            indices = [goal_index]
+            while indices[-1] != start_index:
+                indices.append(parents[indices[-1]])
+            indices.reverse()
+            return [divmod(index, width) for index in indices]
+
+        # calculate the tentative g-score of the neighbors
+        tentative_g_score = g_scores[current_index] + 1
+        for neighbor in grid.neighbors(current_index):
             # if the neighbor has not been visited yet, or the tentative g-score
             # is lower than its previous g-score:
             if neighbor not in g_scores or tentative_g_score < g_scores[neighbor]:
-                # update the g-score and f-score of the neighbor
+                # update the g-score of the neighbor and set its parent to the current cell
                 g_scores[neighbor] = tentative_g_score
-                f_scores[neighbor] = tentative_g_score + manhattan_distance(neighbor, goal)
-
-                # set the parent of the neighbor to the current cell
-                parents[neighbor] = current_cell
+                parents[neighbor] = current_index
 
                 # add the neighbor to the priority queue with priority equal to its f-score
-                heapq.heappush(queue, (f_scores[neighbor], neighbor))
-    robot.path = []
+                pos_y, pos_x = divmod(neighbor, width)
+                f_score = tentative_g_score + abs(pos_y - goal_y) + abs(pos_x - goal_x)
+                heapq.heappush(queue, (f_score, neighbor))
     return None
 
 
+class DistanceField:
+    """
+    Class that holds the distances from every reachable cell to one goal cell,
+    together with the next cell on a shortest path towards the goal.
+    It is computed by a single breadth-first search from the goal, so when the
+    walls do not change all routes to the goal are answered by table lookups.
+    The routes are shortest paths, ties between them are broken close to the way
+    a_star breaks them, but a route may differ from the a_star path of the same length.
+    If targets are given, the search stops as soon as all of them are reached
+    and only the targets are guaranteed to have their distances filled in.
+    """
+    def __init__(self, goal, maze, targets=None):
+        self.grid = as_grid(maze)
+        goal_x, goal_y = as_position(goal)
+        self.goal = (goal_y, goal_x)
+        # flat cell index -> number of moves to the goal, -1 for unreachable cells
+        self.distances = array('i', [-1]) * self.grid.size
+        # flat cell index -> index of the next cell on the way to the goal
+        self.next_hops = array('i', [-1]) * self.grid.size
+        search_stats.searches += 1
+        if not self.grid.is_open(goal_x, goal_y):
+            return
+        goal_index = self.grid.index(goal_x, goal_y)
+        self.distances[goal_index] = 0
+        remaining = None
+        if targets is not None:
+            remaining = {self.grid.index(pos_x, pos_y) for pos_x, pos_y in targets
+                         if self.grid.is_open(pos_x, pos_y)}
+            remaining.discard(goal_index)
+        width = self.grid.width
+        queue = deque([goal_index])
+        while queue and (remaining is None or remaining):
+            current_index = queue.popleft()
+            search_stats.nodes_expanded += 1
+            distance = self.distances[current_index] + 1
+            pos_y, pos_x = divmod(current_index, width)
+            # ties between next hops are broken close to a_star: the cell closer
+            # to the goal by the Manhattan distance first, then the lower index
+            preference = (abs(pos_y - goal_y) + abs(pos_x - goal_x), current_index)
+            for neighbor in self.grid.neighbors(current_index):
+                if self.distances[neighbor] < 0:
+                    self.distances[neighbor] = distance
+                    self.next_hops[neighbor] = current_index
+                    queue.append(neighbor)
+                    if remaining is not None:
+                        remaining.discard(neighbor)
+                elif self.distances[neighbor] == distance:
+                    hop_y, hop_x = divmod(self.next_hops[neighbor], width)
+                    if preference < (abs(hop_y - goal_y) + abs(hop_x - goal_x), self.next_hops[neighbor]):
+                        self.next_hops[neighbor] = current_index
+
+    @classmethod
+    def from_arrays(cls, goal, maze, distances, next_hops):
+        """
+        Builds the field from distances and next hops computed before, e.g. by the map compiler,
+        without searching. The arrays are used as they are, read-only views work as well.
+        """
+        field = cls.__new__(cls)
+        field.grid = as_grid(maze)
+        goal_x, goal_y = as_position(goal)
+        field.goal = (goal_y, goal_x)
+        field.distances = distances
+        field.next_hops = next_hops
+        return field
+
+    def distance(self, cell):
+        """
+        :return: The number of moves from the cell (y, x) to the goal, None if it is unreachable
+        """
+        pos_y, pos_x = cell
+        if not self.grid.is_open(pos_x, pos_y):
+            return None
+        distance = self.distances[self.grid.index(pos_x, pos_y)]
+        return distance if distance >= 0 else None
+
+    def path(self, cell):
+        """
+        :return: A list of cells (y, x) from the cell to the goal, None if the goal is unreachable
+        """
+        if self.distance(cell) is None:
+            return None
+        current_index = self.grid.index(cell[1], cell[0])
+        path = [cell]
+        while self.distances[current_index] > 0:
+            current_index = self.next_hops[current_index]
+            path.append(divmod(current_index, self.grid.width))
+        return path
+
+    def path_from(self, robot):
+        """Works like a_star towards the goal: sets the path from the robot's
+        position to the goal as robot.path and returns its length,
+        or sets an empty path and returns None if the goal is unreachable."""
+        path = self.path((robot.y, robot.x))
+        if path is None:
+            robot.path = []
+            return None
+        robot.path = path
+        return len(path) - 1
+
+
 def set_diff(info, maze):
     """
     Returns a list of unvisited cells by comparing the cells in
     the maze with the visited cells in the info array.
     Args:
-        info (list): A list of visited cells.
-        maze (list): The maze grid.
+        info (ExploredCells): The visited cells, a list of cells works as well.
+        maze (Grid): The maze grid.
     Returns:
         list: A list of unvisited cells.
     """
-    visited = set(info)  # Convert the info array to a set for faster lookup
+    grid = as_grid(maze)
+    if not isinstance(info, ExploredCells):
+        visited = ExploredCells(grid)  # Convert the info list to a bitset for faster lookup
+        for cell in info:
+            visited.add(cell)
+        info = visited
     unvisited = []
-    # Iterate over each cell in the maze
-    for pos_y, row in enumerate(maze):
-        for pos_x, _ in enumerate(row):
-            current_cell = (pos_y, pos_x)
-            if current_cell not in visited and is_valid(pos_x, pos_y, maze):
-                unvisited.append(current_cell)
+    # Iterate over each free cell in the maze
+    for index, wall in enumerate(grid.walls):
+        if not wall and not info.contains_index(index):
+            unvisited.append(divmod(index, grid.width))
     return unvisited
 
 
@@ -140,14 +415,13 @@ def find_nearest_cell(robot, unvisited):
     return nearest_cell
 
 
-class Cell:
+class Cell(NamedTuple):
     """
-    Class that represents a single cell
-    Usually using for a_star algorithm
+    Class that represents a single cell as an immutable (x, y) tuple.
+    Searches take plain (x, y) tuples as well, so no Cell is needed to call them.
     """
-    def __init__(self, pos_x, pos_y):
-        self.x = pos_x
-        self.y = pos_y
+    x: int
+    y: int
 
     def pos(self):
         """
@@ -159,24 +433,76 @@ class Cell:
         return f"Cell: x:{self.x}, y: {self.y}"
 
 
+def nearest_unexplored(robot, info, maze):
+    """
+    Finds a shortest path from the robot's current position to the nearest reachable
+    unexplored cell with a breadth-first search through the explored cells that stops
+    at the first frontier cell it meets. With an ExploredCells database the search
+    returns at once when the robot's cell is unexplored or there is no frontier left.
+    Args:
+        robot (Robot): The robot object representing the current position and state of the robot.
+        info (ExploredCells): The explored cells, any container of (y, x) cells works.
+        maze (Grid): The grid representing the layout of the maze.
+    Returns:
+        list: The path from the robot to the nearest unexplored cell, None if there is none.
+    """
+    grid = as_grid(maze)
+    if not grid.is_open(robot.x, robot.y):
+        return None
+    start_index = grid.index(robot.x, robot.y)
+    if isinstance(info, ExploredCells) and info.grid.width == grid.width:
+        if not info.contains_index(start_index):
+            return [grid.cell(start_index)]
+        if not info.frontier:
+            return None
+        # the search only runs through explored cells, their unexplored neighbours are frontier cells
+        is_unexplored = info.frontier.__contains__
+    else:
+        def is_unexplored(index):
+            return grid.cell(index) not in info
+        if is_unexplored(start_index):
+            return [grid.cell(start_index)]
+    search_stats.searches += 1
+    parents = {start_index: None}
+    queue = deque([start_index])
+    found = None
+    while queue and found is None:
+        current_index = queue.popleft()
+        search_stats.nodes_expanded += 1
+        for neighbor in grid.neighbors(current_index):
+            if neighbor not in parents:
+                parents[neighbor] = current_index
+                # cells are found in the order of their distance, the first unexplored one is the nearest
+                if is_unexplored(neighbor):
+                    found = neighbor
+                    break
+                queue.append(neighbor)
+    if found is None:
+        return None
+
+    indices = []
+    index = found
+    while index is not None:
+        indices.append(index)
+        index = parents[index]
+    indices.reverse()
+    return [grid.cell(index) for index in indices]
+
+
 def prior_searching(robot, info, maze):
     """
-      Performs prior searching by finding the nearest unvisited cell to the robot's current
-      position, and executing the A* algorithm to navigate to that cell in the maze.
+      Performs prior searching by sending the robot to the nearest reachable
+      unexplored cell, see nearest_unexplored.
       Args:
       robot (Robot): The robot object representing the current position and state of the robot.
-        info (list): A list of visited cells.
-        maze (Maze): The maze object representing the layout of the maze.
+        info (ExploredCells): The explored cells, a list of cells works as well.
+        maze (Grid): The grid representing the layout of the maze.
       Returns:
-        list: A list of unvisited cells after the prior searching operation.
+        tuple: The unexplored cell the robot goes to, None if everything reachable is explored.
 
       """
-    unvisited = set_diff(info, maze)
-    nearest_cell = find_nearest_cell(robot, unvisited)
-    if nearest_cell is None:
-        nearest_cell = random.choice(unvisited)
-    nearest_cell_obj = Cell(nearest_cell[1], nearest_cell[0])
-    a_star(nearest_cell_obj, robot, maze)
-    if not robot.path:
-        robot.explored_cells.append(nearest_cell)
-    return unvisited
+    if isinstance(info, list):
+        info = set(info)  # a list is searched in O(n), a set is good enough for the search
+    path = nearest_unexplored(robot, info, maze)
+    robot.path = path if path is not None else []
+    return path[-1] if path is not None else None
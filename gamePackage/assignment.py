@@ -0,0 +1,104 @@
+"""
+This module provides strategies for assigning mazes to robots.
+Every strategy takes a robot x maze matrix of path lengths, with numpy.inf
+for mazes a robot cannot reach, and returns a list of (robot index, maze index)
+pairs. Each robot and each maze is used at most once and unreachable pairs are never returned.
+"""
+import numpy as np
+
+
+def greedy_assignment(costs):
+    """
+    Goes through the mazes in order and gives each one to the closest robot that is still free.
+    Ties are broken in favour of the robot with the lower index.
+    Args:
+        costs (numpy.ndarray): Matrix of path lengths, rows are robots and columns are mazes.
+    Returns:
+        list: A list of (robot index, maze index) pairs.
+    """
+    costs = np.array(costs, dtype=float)
+    free = np.ones(costs.shape[0], dtype=bool)
+    pairs = []
+    for maze_index in range(costs.shape[1]):
+        if not free.any():
+            break
+        column = np.where(free, costs[:, maze_index], np.inf)
+        robot_index = int(np.argmin(column))
+        if np.isinf(column[robot_index]):
+            continue
+        free[robot_index] = False
+        pairs.append((robot_index, maze_index))
+    return pairs
+
+
+def hungarian_assignment(costs):
+    """
+    Finds the assignment with the minimal sum of path lengths using the Hungarian
+    algorithm (shortest augmenting paths with potentials), O(n^2 * m) for an n x m matrix.
+    As many mazes as possible are assigned; unreachable pairs get a cost larger than
+    any complete assignment, so they are only used when nothing else is left and are
+    dropped from the result.
+    Args:
+        costs (numpy.ndarray): Matrix of path lengths, rows are robots and columns are mazes.
+    Returns:
+        list: A list of (robot index, maze index) pairs.
+    """
+    costs = np.array(costs, dtype=float)
+    if costs.size == 0:
+        return []
+    transposed = costs.shape[0] > costs.shape[1]
+    if transposed:
+        costs = costs.T
+    unreachable = np.isinf(costs)
+    finite = costs[~unreachable]
+    big = (finite.max() + 1) * (costs.shape[0] + 1) if finite.size else 1.0
+    matrix = np.where(unreachable, big, costs)
+
+    rows, columns = matrix.shape
+    # potentials of the rows and columns, index 0 is an auxiliary column
+    row_potential = np.zeros(rows + 1)
+    column_potential = np.zeros(columns + 1)
+    # row_of[j] is the row (1-based) assigned to the column j, 0 for none
+    row_of = np.zeros(columns + 1, dtype=int)
+    way = np.zeros(columns + 1, dtype=int)
+    for row in range(1, rows + 1):
+        row_of[0] = row
+        column = 0
+        min_values = np.full(columns + 1, np.inf)
+        used = np.zeros(columns + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current_row = row_of[column]
+            reduced = matrix[current_row - 1] - row_potential[current_row] - column_potential[1:]
+            improved = ~used[1:] & (reduced < min_values[1:])
+            min_values[1:][improved] = reduced[improved]
+            way[1:][improved] = column
+            candidates = np.where(used[1:], np.inf, min_values[1:])
+            next_column = int(np.argmin(candidates)) + 1
+            delta = candidates[next_column - 1]
+            row_potential[row_of[used]] += delta
+            column_potential[used] -= delta
+            min_values[~used] -= delta
+            column = next_column
+            if row_of[column] == 0:
+                break
+        # flip the assignments along the augmenting path
+        while column != 0:
+            previous_column = way[column]
+            row_of[column] = row_of[previous_column]
+            column = previous_column
+
+    pairs = []
+    for column in range(1, columns + 1):
+        row = row_of[column]
+        if row != 0 and not unreachable[row - 1, column - 1]:
+            pairs.append((column - 1, row - 1) if transposed else (row - 1, column - 1))
+    pairs.sort()
+    return pairs
+
+
+# Assignment strategies by the names accepted by InfoGame
+ASSIGNMENT_STRATEGIES = {
+    'greedy': greedy_assignment,
+    'optimal': hungarian_assignment,
+}
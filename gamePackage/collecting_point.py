@@ -1,10 +1,11 @@
+from typing import NamedTuple
 
-class CollectingPoint:
-    """CollectingPoint class represents a collecting point on the grid"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+
+class CollectingPoint(NamedTuple):
+    """CollectingPoint class represents a collecting point on the grid.
+    It never moves, so it is an immutable (x, y) tuple."""
+    x: int
+    y: int
 
     def pos(self):
         return self.x, self.y
-
@@ -0,0 +1,248 @@
+"""
+This module compiles text maps into a binary format that loads without parsing.
+A compiled map holds the dimensions, the walls (one byte per cell, the layout of Grid),
+the positions of the robots, mazes and the collecting point and optionally the
+delivery field, the distances and next hops of all cells to the collecting point.
+Compiled maps are cached next to their sources in MAP_CACHE_DIR, named after the
+content hash of the source, so editing a map compiles it again. They are memory-mapped
+when loaded: walls and fields are read straight from the page cache, which all
+processes loading the same map share.
+
+Layout, little-endian, every section starts at a multiple of 8 bytes:
+    header      HEADER, see below
+    walls       width * height bytes, 1 for a wall
+    robots      robots * 2 int32, (x, y) in the order of the source
+    mazes       mazes * 2 int32, (x, y) in the order of the source
+    distances   width * height int32, only with FLAG_DISTANCE_FIELD
+    next hops   width * height int32, only with FLAG_DISTANCE_FIELD
+"""
+import hashlib
+import mmap
+import os
+import re
+import struct
+import tempfile
+
+import numpy as np
+
+import settings
+from gamePackage.algorithm import DistanceField
+from gamePackage.grid import Grid
+from gamePackage.map_parser import CHUNK_SIZE, parse_map
+
+MAGIC = b'RMAP'
+VERSION = 3
+FLAG_DISTANCE_FIELD = 1
+# magic, version, flags, width, height, robots, mazes, collecting point x and y, sha256 of the source
+HEADER = struct.Struct('<4sHHIIIIii32s')
+EXTENSION = '.rmap'
+
+
+class CompiledMap:
+    """
+    Class that represents a compiled map read from a buffer, usually a memory-mapped file.
+    The walls, distances and next hops are read-only views of the buffer, nothing is copied.
+    A buffer that is not a whole compiled map of this version raises a ValueError.
+    """
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        if view.nbytes < HEADER.size:
+            raise ValueError("Not a compiled map, the header is cut off")
+        magic, version, flags, self.width, self.height, amount_robots, amount_mazes, \
+            point_x, point_y, self.digest = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a compiled map of version {VERSION}")
+        self.buffer = buffer  # Kept open as long as the map or its views are used
+        size = self.width * self.height
+        end = _align(_align(_align(_align(HEADER.size) + size) + amount_robots * 8) + amount_mazes * 8)
+        if flags & FLAG_DISTANCE_FIELD:
+            end += _align(size * 4) + size * 4
+        if view.nbytes < end:
+            raise ValueError("The compiled map is cut off")
+        offset = _align(HEADER.size)
+        self.walls = view[offset:offset + size]
+        offset = _align(offset + size)
+        self.robots = np.frombuffer(buffer, np.int32, amount_robots * 2, offset).reshape(-1, 2)
+        offset = _align(offset + amount_robots * 8)
+        self.mazes = np.frombuffer(buffer, np.int32, amount_mazes * 2, offset).reshape(-1, 2)
+        offset = _align(offset + amount_mazes * 8)
+        self.collecting_point = (point_x, point_y)
+        self.distances = self.next_hops = None
+        if flags & FLAG_DISTANCE_FIELD:
+            self.distances = view[offset:offset + size * 4].cast('i')
+            offset = _align(offset + size * 4)
+            self.next_hops = view[offset:offset + size * 4].cast('i')
+
+    def grid(self):
+        """
+        :return: The Grid of the walls, sharing the buffer of the map
+        """
+        return Grid(self.walls, self.width, self.height)
+
+    def delivery_field(self, grid):
+        """
+        :return: The DistanceField of the collecting point on the grid, None if it was not compiled
+        """
+        if self.distances is None:
+            return None
+        return DistanceField.from_arrays(self.collecting_point, grid, self.distances, self.next_hops)
+
+    def symbols(self, amount_robots=None):
+        """
+        :return: The maze_map of the map, a (height, width) array of one byte symbols, dtype 'S1',
+         indexed by [y, x]. The robots after the first amount_robots are left out.
+        """
+        walls = np.frombuffer(self.walls, np.uint8).reshape(self.height, self.width)
+        symbols = np.full((self.height, self.width), b' ', dtype='S1')
+        # the walls are 0 or 1, so they are a mask as they are, without an index array of their size
+        symbols[walls.view(bool)] = b'X'
+        symbols[self.mazes[:, 1], self.mazes[:, 0]] = b'M'
+        robots = self.robots[:amount_robots]
+        symbols[robots[:, 1], robots[:, 0]] = b'R'
+        symbols[self.collecting_point[1], self.collecting_point[0]] = b'0'
+        return symbols
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def source_digest(source):
+    """
+    :return: The sha256 digest of the content of the text map
+    """
+    digest = hashlib.sha256()
+    with open(source, 'rb') as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def cached_path(source, digest):
+    """
+    :return: The path of the compiled map of the source with the digest, in MAP_CACHE_DIR next to the source
+    """
+    directory, name = os.path.split(source)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(directory, settings.MAP_CACHE_DIR, f'{stem}.{digest.hex()[:16]}{EXTENSION}')
+
+
+def compile_sections(parsed_map, distance_field=True):
+    """
+    Builds the sections of the compiled map, without the padding between them.
+    Args:
+        parsed_map (ParsedMap): The map read by parse_map.
+        distance_field (bool): If True, the delivery field of the collecting point is included.
+    Returns:
+        list: The header and the sections of the compiled map.
+    """
+    flags = 0
+    sections = [parsed_map.walls, parsed_map.robots, parsed_map.mazes]
+    if distance_field:
+        flags |= FLAG_DISTANCE_FIELD
+        field = DistanceField(parsed_map.collecting_point, parsed_map.grid())
+        sections += [field.distances, field.next_hops]
+    header = HEADER.pack(MAGIC, VERSION, flags, parsed_map.width, parsed_map.height,
+                         len(parsed_map.robots) // 2, len(parsed_map.mazes) // 2,
+                         *parsed_map.collecting_point, parsed_map.digest)
+    return [header] + sections
+
+
+def compile_map(source, distance_field=True):
+    """
+    Compiles the text map into the binary format, the map is read by parse_map.
+    Args:
+        source (str): Path of the text map.
+        distance_field (bool): If True, the delivery field of the collecting point is included.
+    Returns:
+        bytes: The compiled map.
+    """
+    sections = compile_sections(parse_map(source), distance_field)
+    return b''.join(bytes(section) + _padding(section) for section in sections)
+
+
+def _padding(section):
+    size = memoryview(section).nbytes
+    return bytes(_align(size) - size)
+
+
+def load_map(source, distance_field=True, cache=None):
+    """
+    Loads the compiled version of the text map, compiling it first if it is not cached yet.
+    Old compiled versions of the map are removed from the cache. When the cache cannot be
+    written or read, e.g. the maps are read-only or another user compiled them, the map
+    is compiled into memory instead.
+    Args:
+        source (str): Path of the text map.
+        distance_field (bool): If True, the delivery field is compiled into new maps.
+        cache (bool): If False, the map is always compiled into memory, settings.CACHE_COMPILED_MAPS by default.
+    Returns:
+        CompiledMap: The memory-mapped compiled map.
+    """
+    if cache is None:
+        cache = settings.CACHE_COMPILED_MAPS
+    if not cache:
+        return CompiledMap(compile_map(source, distance_field))
+    digest = source_digest(source)
+    path = cached_path(source, digest)
+    compiled_map = _map_file(path, digest)
+    if compiled_map is None:
+        sections = compile_sections(parse_map(source), distance_field)
+        try:
+            _write_cache(path, sections)
+        except OSError:
+            pass
+        else:
+            compiled_map = _map_file(path, digest)
+        if compiled_map is None:
+            compiled_map = CompiledMap(b''.join(bytes(section) + _padding(section) for section in sections))
+    return compiled_map
+
+
+def _map_file(path, digest):
+    """
+    :return: The memory-mapped compiled map, None if there is no file, it cannot be read, it is damaged,
+     e.g. cut off by a crash, or it was compiled from another source or by another version
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        compiled_map = CompiledMap(buffer)
+    except (OSError, ValueError):
+        # unreadable and empty files cannot be mapped, cut off or foreign ones are rejected by CompiledMap
+        return None
+    return compiled_map if compiled_map.digest == digest else None
+
+
+def _umask():
+    """
+    :return: The file mode creation mask of the process, which can only be read by setting it
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _write_cache(path, sections):
+    """Writes the sections of the compiled map atomically, so other processes never see half of it."""
+    directory, name = os.path.split(path)
+    os.makedirs(directory, exist_ok=True)
+    # the versions of the map compiled before it was edited, stem.<digest>.rmap
+    old_versions = re.compile(re.escape(name[:-len(EXTENSION) - 17]) + r'\.[0-9a-f]{16}' + re.escape(EXTENSION))
+    for old_name in os.listdir(directory):
+        if old_versions.fullmatch(old_name):
+            os.remove(os.path.join(directory, old_name))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        # mkstemp creates the file readable by its owner only, the cache is shared like a file opened for writing
+        os.chmod(temporary, 0o666 & ~_umask())
+        with os.fdopen(fd, 'wb') as file:
+            for section in sections:
+                file.write(section)
+                file.write(_padding(section))
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
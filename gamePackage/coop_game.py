@@ -1,13 +1,19 @@
 from gamePackage.game import *
-from gamePackage.algorithm import a_star, prior_searching
+from gamePackage.algorithm import prior_searching
+from gamePackage.explored_cells import ExploredCells
 
 
 class CoopGame(Game):
     """CoopGame represents the cooperative mode"""
-    def __init__(self, filename, display):
-        super().__init__(filename, display)
-        self.path_info = []
-        self.found_mazes = []
+    def __init__(self, filename, display=None, renderer=None, amount_robots=None, pathfinder='a_star'):
+        super().__init__(filename, display, renderer, amount_robots, pathfinder)
+        self.path_info = None  # Common database of explored cells, created in load
+        self.found_mazes = {}  # Mazes seen by delivering robots, an insertion ordered set
+
+    def load(self):
+        """Loads the map and creates the common database of explored cells."""
+        super().load()
+        self.path_info = ExploredCells(self.grid)
 
     def step(self):
         """
@@ -19,8 +25,8 @@ class CoopGame(Game):
           - The robots are moved to their next positions by calling the 'move_robots' method.
           - The mazes are controlled by calling the 'control_mazes' method.
           - The map is updated by calling the 'update' method.
-          - The maze is drawn on the display by calling the 'draw' method
-            of the 'maze_class' object.
+          - The maze is drawn by calling the 'draw' method, which does nothing
+            for headless games.
         """
         if len(self.mazes) == 0:
             self.is_running = False
@@ -37,7 +43,7 @@ class CoopGame(Game):
         # update map
         self.update()
 
-        self.maze_class.draw()
+        self.draw()
 
     def check_state(self):
         """
@@ -49,7 +55,7 @@ class CoopGame(Game):
                   marked as collected, and the robot's state is changed to DELIVERING.
                - If the robot is in the DELIVERING state and still has a path to follow:
                    - If the robot's current position is a maze position ('M'), the maze is
-                     added to the found_mazes list.
+                     added to the found_mazes.
                - If the robot is in the DELIVERING state and has no more path to follow:
                    - The target maze is marked as delivered, the target is set to None,
                      and the robot's state is changed to WAITING.
@@ -59,62 +65,77 @@ class CoopGame(Game):
                    - The robot's state is changed to WAITING.
                - If the robot is in the WAITING state:
                    - If there are found mazes in the simulation, the robot selects the
-                     maze with the minimum path cost using the A* algorithm.
+                     maze with the minimum path cost using the pathfinder of the game.
                      The robot's state is changed to COLLECTING, and the target is
                      assigned to the selected maze.
                    - If there are no found mazes, the robot performs a prior searching using the
-                   'prior_searching' function and the path_info dictionary. The robot's state is
+                   'prior_searching' function and the path_info database. The robot's state is
                     changed to EXPLORING.
+                   - If there is nothing left to explore either, every maze left is known, so the
+                     robot goes for the closest maze not collected yet, even if it is assigned.
+           A robot collecting another maze than its assigned one or choosing a new one gives
+           the assigned maze up: it is uncollected again and goes back to the found mazes.
+           Only the robots that stand on a maze, have no path or wait are visited,
+           nothing changes for the other ones.
            """
-        for robot in self.robots:
+        fleet = self.fleet
+        attention = self.maze_flags[self.robot_cells()] | ~fleet.has_path() \
+            | (fleet.state == StateCode.WAITING)
+        for index in np.flatnonzero(attention):
+            robot = self.robots[index]
             x, y = robot.pos()
-            if self.maze_class.maze_map[y][x] == 'M' and robot.state != RobotState.DELIVERING:
-                robot.target = self.get_mazes_by_pos((y, x))
+            if self.maze_class.maze_map[y, x] == b'M' and robot.state != RobotState.DELIVERING:
+                self.retarget(robot, self.get_mazes_by_pos((y, x)))
                 robot.target.collected = True
                 robot.state = RobotState.DELIVERING
                 robot.path.clear()
             elif robot.state == RobotState.DELIVERING and robot.path:
-                if self.maze_class.maze_map[y][x] == 'M':
-                    self.found_mazes.append(self.get_mazes_by_pos((y, x)))
+                if self.maze_class.maze_map[y, x] == b'M':
+                    self.found_mazes[self.get_mazes_by_pos((y, x))] = None
             elif robot.state == RobotState.DELIVERING and not robot.path:
                 robot.target.delivered = True
                 robot.target = None
                 robot.state = RobotState.WAITING
-            elif robot.state == RobotState.EXPLORING and len(robot.path) == 0:
+            elif robot.state == RobotState.EXPLORING and not robot.path:
                 robot.state = RobotState.WAITING
             elif robot.state == RobotState.COLLECTING and not robot.path:
                 robot.state = RobotState.WAITING
             elif robot.state == RobotState.WAITING:
-                if self.found_mazes:
-                    min_mazes = None
-                    min_counter = 10000000
-                    for mazes in self.found_mazes:
-                        tmp = a_star(mazes, robot, self.maze_class.maze_map)
-                        if tmp < min_counter:
-                            min_counter = tmp
-                            min_mazes = mazes
-                    self.found_mazes.remove(min_mazes)
+                target = self.closest_maze(robot, self.found_mazes) if self.found_mazes else None
+                if target is not None:
+                    del self.found_mazes[target]
+                elif prior_searching(robot, self.path_info, self.grid) is None:
+                    target = self.closest_maze(robot, self.mazes.in_state(MazeState.UNCOLLECTED)
+                                               + self.mazes.in_state(MazeState.ASSIGNED))
+                if target is not None:
+                    self.retarget(robot, target)
+                    self.mazes.assign(target)
                     robot.state = RobotState.COLLECTING
-                    robot.target = min_mazes
                 else:
-                    prior_searching(robot, self.path_info, self.maze_class.maze_map)
                     robot.state = RobotState.EXPLORING
 
+    def retarget(self, robot, maze):
+        """Sets the maze as the target of the robot, an assigned maze it gives up is released."""
+        previous = robot.target
+        if previous is not None and previous is not maze and previous.state == MazeState.ASSIGNED:
+            self.mazes.release(previous)
+            self.found_mazes[previous] = None
+        robot.target = maze
+
     def move_robots(self):
         """
             Moves the robots according to their current state and path.
 
-            - For each robot in the simulation, the following actions are performed:
-                - If the robot is in the DELIVERING state and has no more path to follow,
-                  the A* algorithm is used to find a path from the robot's current
-                  position to the collecting point.The robot then moves cooperatively
-                  using the 'moveCoop' method with the path information.
-                - For any other state, the robot moves cooperatively using the 'moveCoop'
-                  method with the path information.
+            - Robots in the DELIVERING state without a path get the path from their
+              current position to the collecting point from the precomputed delivery field.
+            - Then all robots move cooperatively at once on the columns of the fleet,
+              with the same rules as Robot.move_coop(): the next cell of every path
+              is added to the path information and every robot with a path moves to it.
             """
-        for robot in self.robots:
-            if robot.state == RobotState.DELIVERING and robot.path == []:
-                a_star(self.collecting_point, robot, self.maze_class.maze_map)
-                robot.move_coop(self.path_info)
-            else:
-                robot.move_coop(self.path_info)
+        fleet = self.fleet
+        for index in np.flatnonzero((fleet.state == StateCode.DELIVERING) & ~fleet.has_path()):
+            self.delivery_field.path_from(self.robots[index])
+        has_path = fleet.has_path()
+        next_y, next_x = fleet.next_cells(has_path)
+        self.path_info.add_indices(next_y.astype(np.int64) * self.grid.width + next_x)
+        fleet.advance(has_path)
@@ -0,0 +1,89 @@
+import numpy as np
+
+
+class ExploredCells:
+    """
+    Class that represents a database of explored cells of one grid.
+    The cells are kept in a bitset over the flat cell indices of the grid,
+    one bit per cell, so adding and looking up a cell is O(1) and a database
+    takes width * height / 8 bytes no matter how much is explored.
+    Cells are (y, x) tuples like the cells of paths. Besides the explored
+    cells it keeps the frontier, the unexplored free cells next to an explored
+    cell, updated with every added cell. Any unexplored cell reachable from an
+    explored one is reached through the frontier, so searches for unexplored
+    cells stop at the first frontier cell and know in O(1) when there is none.
+    """
+    def __init__(self, grid):
+        self.grid = grid
+        self.bits = bytearray((grid.size + 7) // 8)  # bit i is set if the cell with flat index i is explored
+        self.count = 0  # number of explored cells
+        self.unexplored = grid.free_count  # number of free cells not explored yet
+        self.frontier = set()  # flat indices of the unexplored free cells next to an explored cell
+
+    def add(self, cell):
+        """Marks the cell (y, x) as explored. Walls and cells outside the grid are ignored."""
+        pos_y, pos_x = cell
+        if self.grid.is_open(pos_x, pos_y):
+            self.add_index(self.grid.index(pos_x, pos_y))
+
+    # list-like name, so the database can be used wherever a list of explored cells was used
+    append = add
+
+    def add_index(self, index):
+        """Marks the free cell with the flat index as explored."""
+        mask = 1 << (index & 7)
+        if not self.bits[index >> 3] & mask:
+            self.bits[index >> 3] |= mask
+            self.count += 1
+            self.unexplored -= 1
+            self._update_frontier(index)
+
+    def add_indices(self, indices):
+        """Marks the free cells with the flat indices, e.g. a NumPy array, as explored at once."""
+        indices = np.unique(np.asarray(indices, dtype=np.int64))
+        if len(indices) == 0:
+            return
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        masks = np.left_shift(1, indices & 7).astype(np.uint8)
+        new = indices[(bits[indices >> 3] & masks) == 0]
+        np.bitwise_or.at(bits, indices >> 3, masks)
+        self.count += len(new)
+        self.unexplored -= len(new)
+        for index in new.tolist():
+            self._update_frontier(index)
+
+    def _update_frontier(self, index):
+        """Moves the newly explored cell out of the frontier and its unexplored neighbours into it."""
+        self.frontier.discard(index)
+        for neighbor in self.grid.neighbors(index):
+            if not self.contains_index(neighbor):
+                self.frontier.add(neighbor)
+
+    def contains_index(self, index):
+        """
+        :return: True if the cell with the flat index is explored
+        """
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    @property
+    def nbytes(self):
+        """
+        :return: The number of bytes taken by the bitset
+        """
+        return len(self.bits)
+
+    def __contains__(self, cell):
+        pos_y, pos_x = cell
+        if not (0 <= pos_x < self.grid.width and 0 <= pos_y < self.grid.height):
+            return False
+        return self.contains_index(self.grid.index(pos_x, pos_y))
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for byte_index, byte in enumerate(self.bits):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield self.grid.cell(byte_index * 8 + bit)
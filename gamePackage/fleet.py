@@ -0,0 +1,195 @@
+"""
+Imports:
+- The 'numpy' module for the columns of the fleet.
+- The 'Path' class, whose interface is shared by the paths of the fleet.
+"""
+import numpy as np
+
+from gamePackage.path import Path
+
+
+class Fleet:
+    """
+    Class that stores the state of many robots as columns (struct of arrays):
+    positions, integer state codes, target codes and path cursors.
+    The paths of all robots are kept in one arena of cells, every robot owns
+    the segment [cursor, end) of it, so advancing all robots is a single
+    vectorized operation. Robot objects are thin views of one row of a fleet.
+    """
+    def __init__(self, capacity=16):
+        self.size = 0  # number of robots
+        self._x = np.zeros(capacity, dtype=np.int32)
+        self._y = np.zeros(capacity, dtype=np.int32)
+        self._state = np.zeros(capacity, dtype=np.int8)  # state codes, 0 is WAITING
+        self._target = np.full(capacity, -1, dtype=np.int32)  # target codes, -1 for no target
+        self._cursor = np.zeros(capacity, dtype=np.int64)  # arena index of the next cell of the path
+        self._end = np.zeros(capacity, dtype=np.int64)  # arena index after the last cell of the path
+        self.path_y = np.zeros(4 * capacity, dtype=np.int32)  # arena of the path cells
+        self.path_x = np.zeros(4 * capacity, dtype=np.int32)
+        self.arena_size = 0  # number of used cells of the arena
+        self.targets = []  # target objects by their codes
+        self._target_codes = {}
+
+    # The columns are views of the first size rows, writing to them changes the fleet
+    @property
+    def x(self):
+        return self._x[:self.size]
+
+    @property
+    def y(self):
+        return self._y[:self.size]
+
+    @property
+    def state(self):
+        return self._state[:self.size]
+
+    @property
+    def target(self):
+        return self._target[:self.size]
+
+    @property
+    def cursor(self):
+        return self._cursor[:self.size]
+
+    @property
+    def end(self):
+        return self._end[:self.size]
+
+    def append(self, pos_x, pos_y):
+        """
+        Adds a waiting robot without a path and target at (x, y).
+        :return: The index of the new robot
+        """
+        if self.size == len(self._x):
+            capacity = 2 * len(self._x)
+            self._x = np.resize(self._x, capacity)
+            self._y = np.resize(self._y, capacity)
+            self._state = np.resize(self._state, capacity)
+            self._target = np.resize(self._target, capacity)
+            self._cursor = np.resize(self._cursor, capacity)
+            self._end = np.resize(self._end, capacity)
+        index = self.size
+        self.size += 1
+        self._x[index] = pos_x
+        self._y[index] = pos_y
+        self._state[index] = 0
+        self._target[index] = -1
+        self._cursor[index] = self._end[index] = self.arena_size
+        return index
+
+    def get_target(self, index):
+        """
+        :return: The target object of the robot, None if it has none
+        """
+        code = self._target[index]
+        return self.targets[code] if code >= 0 else None
+
+    def set_target(self, index, target):
+        """Sets the target object of the robot, None removes it."""
+        self._target[index] = self.target_code(target)
+
+    def target_code(self, target):
+        """
+        :return: The code of the target object, -1 for None
+        """
+        if target is None:
+            return -1
+        if target not in self._target_codes:
+            self._target_codes[target] = len(self.targets)
+            self.targets.append(target)
+        return self._target_codes[target]
+
+    def set_path(self, index, cells):
+        """Replaces the path of the robot with the (y, x) cells."""
+        cells = np.asarray(list(cells), dtype=np.int32).reshape(-1, 2)
+        self._end[index] = self._cursor[index]  # the old path is garbage now
+        if self.arena_size + len(cells) > len(self.path_y):
+            self._compact(len(cells))
+        start = self.arena_size
+        self.path_y[start:start + len(cells)] = cells[:, 0]
+        self.path_x[start:start + len(cells)] = cells[:, 1]
+        self.arena_size += len(cells)
+        self._cursor[index] = start
+        self._end[index] = self.arena_size
+
+    def path_cell(self, position):
+        """
+        :return: The cell at the position of the arena as a (y, x) tuple
+        """
+        return int(self.path_y[position]), int(self.path_x[position])
+
+    def has_path(self):
+        """
+        :return: A boolean array, True for the robots that have cells left on their path
+        """
+        return self.cursor < self.end
+
+    def next_cells(self, mask):
+        """
+        :return: Arrays of y and x of the next cells of the selected robots, which must have paths
+        """
+        positions = self.cursor[mask]
+        return self.path_y[positions], self.path_x[positions]
+
+    def advance(self, mask):
+        """
+        Moves every selected robot that has a path to the next cell of its path.
+        :return: A boolean array of the robots that moved
+        """
+        moved = mask & self.has_path()
+        next_y, next_x = self.next_cells(moved)
+        self.y[moved] = next_y
+        self.x[moved] = next_x
+        self.cursor[moved] += 1
+        return moved
+
+    def _compact(self, extra):
+        """Moves the live parts of all paths to the front of the arena and makes room for extra cells."""
+        lengths = self.end - self.cursor
+        live = int(lengths.sum())
+        capacity = len(self.path_y)
+        while capacity < 2 * (live + extra):
+            capacity *= 2
+        starts = np.cumsum(lengths) - lengths
+        positions = np.repeat(self.cursor - starts, lengths) + np.arange(live)
+        path_y = np.zeros(capacity, dtype=np.int32)
+        path_x = np.zeros(capacity, dtype=np.int32)
+        path_y[:live] = self.path_y[positions]
+        path_x[:live] = self.path_x[positions]
+        self.path_y, self.path_x = path_y, path_x
+        self.cursor[:] = starts
+        self.end[:] = starts + lengths
+        self.arena_size = live
+
+
+class FleetPath(Path):
+    """
+    Path of one robot of a fleet, a view of its segment of the arena.
+    It behaves like a Path, changes go straight to the fleet.
+    """
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+
+    @property
+    def cursor(self):
+        return int(self.fleet.cursor[self.index])
+
+    @cursor.setter
+    def cursor(self, value):
+        self.fleet.cursor[self.index] = value
+
+    @property
+    def end(self):
+        return int(self.fleet.end[self.index])
+
+    def _cell(self, index):
+        return self.fleet.path_cell(index)
+
+    def splice(self, offset, cells):
+        if not 0 <= offset <= len(self):
+            raise IndexError("splice offset out of range")
+        self.fleet.set_path(self.index, self[:offset] + list(cells))
+
+    def clear(self):
+        self.fleet.cursor[self.index] = self.fleet.end[self.index]
@@ -1,88 +1,179 @@
+import numpy as np
+
+import settings
 from gamePackage.maze import *
 from gamePackage.collecting_point import *
 from gamePackage.mazes import *
 from gamePackage.robot import *
+from gamePackage.algorithm import DistanceField, PathCache
+from gamePackage.pathfinders import PATHFINDERS
+from gamePackage.compiled_map import load_map
 
 
 class Game:
     """Base class for different types of games."""
 
-    def __init__(self, filename, display):
+    def __init__(self, filename, display=None, renderer=None, amount_robots=None, pathfinder='a_star'):
+        if pathfinder not in PATHFINDERS:
+            raise ValueError(f"Unknown pathfinder {pathfinder}, "
+                             f"expected one of {', '.join(PATHFINDERS)}")
         self.filename = filename
-        self.robots = []  # List to store robot objects
-        self.mazes = []  # List to store maze objects
-        self.mazes_uncollected = []  # List to store mazes that have not been collected yet
+        self.amount_robots = amount_robots  # Maximal number of robots taken from the map, None for all
+        self.fleet = Fleet()  # Columns with the state of all robots
+        self.robots = []  # List to store robot objects, views of the rows of the fleet
+        self.mazes = MazeRegistry()  # Mazes by positions and states, len() counts the ones not delivered yet
         self.collecting_point = None  # Object representing the collecting point
         self.is_running = True  # Flag indicating if the game is running
-        self.maze_class = Maze(display)  # Instance of the Maze class for handling maze-related operations
+        self.maze_class = Maze()  # Instance of the Maze class for handling maze-related operations
         self.steps = 0  # Counter to keep track of the number of steps taken in the game
-        self.display = display  # The display surface for rendering the game
-        self.mazes_pos_db = {}
+        self.display = display  # The display surface for rendering the game, None when headless
+        if renderer is None and display is not None:
+            # imported here so that headless games do not need pygame at all
+            from gamePackage.renderer import RENDERERS
+            renderer = RENDERERS[settings.RENDERER](display)
+        self.renderer = renderer  # Object drawing the map after every step, None when headless
+        self.grid = None  # Static layout of the walls used for path searching, built in load
+        self.delivery_field = None  # Routes of all cells to the collecting point, built in load
+        self.maze_flags = None  # Flat grid of flags, True where the map shows an uncollected maze
+        self.maze_present = None  # Flat grid of flags, True where a maze not delivered yet lies
+        self.previous_robot_cells = None  # Flat indices of the robots written to the map by the last update
+        self.removed_maze_cells = []  # Flat indices of the mazes removed since the last update
+        self.changes = []  # (x, y, symbol) of every cell of the map changed by the last update
+        self.pathfinder = pathfinder  # Name of the pathfinder the robots search their paths to mazes with
+        self.path_cache = PathCache(settings.PATH_CACHE_SIZE)  # Paths found by the pathfinder on this map
 
     def load(self):
         """
         Load the game data from the specified file.
-        Reads the file line by line and creates robot, maze, and collecting
-        point objects.
-        Updates the maze map and related properties.
+        The map is compiled into a binary file cached next to it on the first load,
+        later loads memory-map the compiled file instead of parsing the text.
+        Creates robot, maze, and collecting point objects, robots over amount_robots
+        are left out of the map. Updates the maze map and related properties, takes
+        the static grid of walls and the delivery field of routes to the collecting point
+        from the compiled map. The abstract graph of the 'hpa' pathfinder is built by its first search,
+        so games that never search a path to a maze do not pay for it.
         """
-        # Load the game data from the specified file
-        with open(self.filename, 'r') as file:
-            for y, line in enumerate(file):
-                maze_line = []
-                for x, char in enumerate(line.strip()):
-                    maze_line.append(char)
-                    if char == "R":
-                        # Create a robot object and add it to the list of robots
-                        self.robots.append(Robot(x, y))
-                    if char == "M":
-                        # Create a maze object and add it to the list of mazes and mazes_uncollected
-                        mazer = Mazes(x, y)
-                        self.mazes.append(mazer)
-                        self.mazes_uncollected.append(mazer)
-                        self.mazes_pos_db[(y, x)] = mazer
-                    if char == "0":
-                        # Create a collecting point object
-                        self.collecting_point = CollectingPoint(x, y)
-                self.maze_class.maze_map.append(maze_line)
+        compiled_map = load_map(self.filename)
+        for pos_x, pos_y in compiled_map.robots[:self.amount_robots].tolist():
+            self.robots.append(Robot(pos_x, pos_y, self.fleet))
+        for pos_x, pos_y in compiled_map.mazes.tolist():
+            self.mazes.add(Mazes(pos_x, pos_y))
+        self.collecting_point = CollectingPoint(*compiled_map.collecting_point)
+        self.maze_class.maze_map = compiled_map.symbols(self.amount_robots)
+
+        # Walls never change, so the grid and all routes to the collecting point are computed once
+        self.grid = compiled_map.grid()
+        self.delivery_field = compiled_map.delivery_field(self.grid)
+        if self.delivery_field is None:
+            self.delivery_field = DistanceField(self.collecting_point, self.grid)
+        self.maze_flags = np.zeros(self.grid.size, dtype=bool)
+        for mazer in self.mazes:
+            self.maze_flags[self.grid.index(mazer.x, mazer.y)] = True
+        self.maze_present = self.maze_flags.copy()
+        self.previous_robot_cells = self.robot_cells()
 
         # Update the rowLength properties of the maze_class
         self.maze_class.rowLength = len(self.maze_class.maze_map)
         self.maze_class.rowLength = len(self.maze_class.maze_map[0])
 
+    def run(self, max_steps=None):
+        """
+        Run the game until all mazes are delivered or max_steps steps were made.
+        Mostly useful for headless games, returns the number of steps taken.
+        """
+        while len(self.mazes) != 0 and (max_steps is None or self.steps < max_steps):
+            self.step()
+        return self.steps
+
+    def draw(self):
+        """Draw the current map using the renderer. Does nothing for headless games.
+        Renderers with a draw_changes(maze_map, changes) method get the changes of
+        the last update as well, so they do not have to look for them."""
+        if self.renderer is None:
+            return
+        if hasattr(self.renderer, 'draw_changes'):
+            self.renderer.draw_changes(self.maze_class.maze_map, self.changes)
+        else:
+            self.renderer.draw(self.maze_class.maze_map)
+
+    def robot_cells(self):
+        """
+        :return: An array of the flat grid indices of the positions of all robots
+        """
+        return self.fleet.y.astype(np.int64) * self.grid.width + self.fleet.x
+
     def update(self):
         """
          Update the game state and map.
-         Clears the maze map and updates it with the current positions
-         of robots, mazes, and the collecting point.
+         Only the cells that may have changed since the last update are rewritten:
+         the cells the robots left or entered and the cells of removed mazes.
+         Mazes are collected by robots standing on them, so the cells of mazes
+         collected since the last update are among the cells of the robots.
+         Every cell gets the symbol of what lies on it, in the order of priority
+         collecting point '0', maze ('M' if uncollected, ' ' if collected),
+         robot 'R' and empty floor ' '. The rewritten cells are listed in changes.
+        """
+        maze_map = self.maze_class.maze_map
+        robot_cells = self.robot_cells()
+        occupied = set(robot_cells.tolist())
+        candidates = occupied.union(self.previous_robot_cells.tolist(), self.removed_maze_cells)
+        changes = []
+        for index in sorted(candidates):
+            y, x = self.grid.cell(index)
+            symbol = self.cell_symbol(index, occupied)
+            if maze_map[y, x] != symbol.encode():
+                maze_map[y, x] = symbol
+                changes.append((x, y, symbol))
+        self.previous_robot_cells = robot_cells
+        self.removed_maze_cells = []
+        self.changes = changes
+
+    def cell_symbol(self, index, occupied):
+        """
+        :return: The symbol of the map for the cell with the flat index, occupied are the flat indices of the robots
         """
-        # Clear the maze map
-        for row in self.maze_class.maze_map:
-            for i in range(len(row)):
-                if row[i] == 'R':
-                    row[i] = ' '  # Remove the previous robot symbol 'R'
-        # Update the maze map with robot positions
-        for robot in self.robots:
-            x, y = robot.pos()
-            self.maze_class.maze_map[y][x] = 'R'
-        for maze in self.mazes:
-            x, y = maze.pos()
-            if maze.collected:
-                self.maze_class.maze_map[y][x] = ' '
-            else:
-                self.maze_class.maze_map[y][x] = 'M'
-        x, y = self.collecting_point.pos()
-        self.maze_class.maze_map[y][x] = '0'
+        y, x = self.grid.cell(index)
+        if (x, y) == self.collecting_point.pos():
+            return '0'
+        if self.maze_present[index]:
+            maze = self.mazes.get((y, x))
+            self.maze_flags[index] = not maze.collected
+            return ' ' if maze.collected else 'M'
+        if index in occupied:
+            return 'R'
+        return ' '
 
     def control_mazes(self):
         """
         Control the state of the mazes.
-        Removes delivered mazes from the list of mazes.
+        Removes the mazes delivered since the last call from the map. The registry
+        drops delivered mazes from the active ones as soon as they are delivered.
+        """
+        for maze in self.mazes.take_delivered():
+            index = self.grid.index(maze.x, maze.y)
+            self.maze_flags[index] = False
+            self.maze_present[index] = False
+            self.removed_maze_cells.append(index)
+
+    def closest_maze(self, robot, mazes):
+        """
+        Finds the maze with the shortest path from the robot with the pathfinder of the game
+        and sets the path to it as robot.path. The paths are kept in the path cache of the game,
+        so the path to the closest maze is not searched twice and later queries reuse them.
+        :return: The closest maze, None if the robot reaches none of them
         """
-        for maze in self.mazes:
-            if maze.delivered:
-                self.mazes.remove(maze)
+        pathfinder = PATHFINDERS[self.pathfinder]
+        position = robot.pos()
+        closest, shortest = None, None
+        for maze in mazes:
+            # a position instead of the robot only gets the length, the path is taken from the cache below
+            length = pathfinder(maze, position, self.grid, self.path_cache)
+            if length is not None and (shortest is None or length < shortest):
+                closest, shortest = maze, length
+        if closest is not None:
+            pathfinder(closest, robot, self.grid, self.path_cache)
+        return closest
 
     def get_mazes_by_pos(self, pos):
-        """Get maze objects based on their positions."""
-        return self.mazes_pos_db[(pos[0], pos[1])]
+        """Get maze objects based on their (y, x) positions."""
+        return self.mazes.get(pos)
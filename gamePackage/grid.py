@@ -0,0 +1,79 @@
+from functools import cached_property
+
+
+class Grid:
+    """
+    Class that represents the static layout of the walls of a map.
+    Cells are addressed by flat integer indices y * width + x and stored
+    in an immutable bytes object, 1 for a wall and 0 for a free cell.
+    The grid is built once when a map is loaded and is shared by all searches,
+    it does not contain robots or mazes, which move or disappear during the game.
+    A read-only memoryview of the walls, e.g. of a memory-mapped compiled map, is used as it is.
+    """
+    def __init__(self, walls, width, height):
+        if len(walls) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(walls)}")
+        self.walls = walls if isinstance(walls, memoryview) and walls.readonly else bytes(walls)
+        self.width = width
+        self.height = height
+        self.size = width * height
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds the grid from rows of map symbols, strings or lists of characters.
+        Only 'X' is a wall, shorter rows are padded with walls.
+        """
+        rows = [''.join(row) for row in rows]
+        width = max((len(row) for row in rows), default=0)
+        walls = bytearray(width * len(rows))
+        for pos_y, row in enumerate(rows):
+            offset = pos_y * width
+            for pos_x in range(width):
+                if pos_x >= len(row) or row[pos_x] == 'X':
+                    walls[offset + pos_x] = 1
+        return cls(walls, width, len(rows))
+
+    @cached_property
+    def free_count(self):
+        """
+        :return: The number of free cells, counted on the first call and kept with the grid
+        """
+        return self.size - bytes(self.walls).count(1)
+
+    def index(self, pos_x, pos_y):
+        """
+        :return: The flat index of the cell (x, y)
+        """
+        return pos_y * self.width + pos_x
+
+    def cell(self, index):
+        """
+        :return: The cell with the flat index as a (y, x) tuple, the order used for paths
+        """
+        return divmod(index, self.width)
+
+    def is_open(self, pos_x, pos_y):
+        """
+        :return: True if (x, y) lies inside the grid and is not a wall
+        """
+        return 0 <= pos_x < self.width and 0 <= pos_y < self.height \
+            and not self.walls[pos_y * self.width + pos_x]
+
+    def neighbors(self, index):
+        """
+        :return: Flat indices of the free neighbours of the cell in the order up, right, down, left
+        """
+        walls = self.walls
+        width = self.width
+        result = []
+        pos_x = index % width
+        if index >= width and not walls[index - width]:
+            result.append(index - width)
+        if pos_x + 1 < width and not walls[index + 1]:
+            result.append(index + 1)
+        if index + width < self.size and not walls[index + width]:
+            result.append(index + width)
+        if pos_x > 0 and not walls[index - 1]:
+            result.append(index - 1)
+        return result
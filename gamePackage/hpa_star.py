@@ -0,0 +1,311 @@
+"""
+This module provides hierarchical pathfinding (HPA*), a pathfinder with the same interface as a_star.
+The map is split into square clusters. Where two clusters touch, every run of free cells
+on both sides of the border gets one or two transitions, pairs of entrance cells linked
+by a step across the border. The entrances of a cluster are linked by the lengths of the
+shortest paths between them inside the cluster. This abstract graph is built once per grid,
+queries connect the start and the goal to the entrances of their clusters, search the
+abstract graph and refine only the segments of the found route into cells.
+The paths are close to the shortest ones, but not always as short.
+"""
+import heapq
+from itertools import chain
+from weakref import WeakKeyDictionary
+
+import settings
+from gamePackage.algorithm import as_grid, as_position, cached_search, search_stats
+
+# Runs of free cells along a border at least this long get a transition at both ends
+MAX_ENTRANCE_WIDTH = 6
+
+_ABSTRACT_GRAPHS = WeakKeyDictionary()  # Grid -> AbstractGraph, see abstract_graph
+
+
+class AbstractGraph:
+    """
+    Class that represents the abstract graph of the clusters of a grid.
+    Nodes are the flat indices of the entrance cells, edges are either steps
+    across a border or the lengths of the shortest paths between two entrances
+    inside one cluster. Refined segments between entrances are kept, so routes
+    used again during a game are only searched once.
+    """
+    def __init__(self, grid, cluster_size=16):
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.columns = -(-grid.width // cluster_size)  # Number of clusters in a row
+        self.nodes = {}  # cluster -> flat indices of its entrance cells
+        self.edges = {}  # flat index of an entrance cell -> {flat index of a linked entrance cell: distance}
+        self._segments = {}  # (entrance, entrance) -> flat indices of the cells after the first one
+        self._frames = {}  # cluster -> its walls with a border, see frame
+        self._add_entrances()
+        for cluster, nodes in self.nodes.items():
+            locals_ = [self.to_local(node, cluster) for node in nodes]
+            for i, node in enumerate(nodes):
+                distances, _ = self.search_cluster(node, cluster)
+                for other, local in zip(nodes[i + 1:], locals_[i + 1:]):
+                    if distances[local] >= 0:
+                        self._link(node, other, distances[local])
+
+    def cluster(self, index):
+        """
+        :return: The number of the cluster containing the cell with the flat index
+        """
+        pos_y, pos_x = divmod(index, self.grid.width)
+        return (pos_y // self.cluster_size) * self.columns + pos_x // self.cluster_size
+
+    def bounds(self, cluster):
+        """
+        :return: The cells of the cluster as (left, top, right, bottom), right and bottom are exclusive
+        """
+        row, column = divmod(cluster, self.columns)
+        left, top = column * self.cluster_size, row * self.cluster_size
+        return left, top, min(left + self.cluster_size, self.grid.width), \
+            min(top + self.cluster_size, self.grid.height)
+
+    def frame(self, cluster):
+        """
+        :return: (left, top, stride, walls) of the cluster, its walls surrounded by a border of walls
+         in rows of stride cells, left and top are the position of the first cell of the border
+        """
+        frame = self._frames.get(cluster)
+        if frame is None:
+            left, top, right, bottom = self.bounds(cluster)
+            width, walls = self.grid.width, self.grid.walls
+            border = b'\x01' * (right - left + 2)
+            rows = (b'\x01' + walls[pos_y * width + left:pos_y * width + right] + b'\x01'
+                    for pos_y in range(top, bottom))
+            frame = self._frames[cluster] = (left - 1, top - 1, len(border), border + b''.join(rows) + border)
+        return frame
+
+    def to_local(self, index, cluster):
+        """
+        :return: The index of the cell with the flat index in the frame of the cluster
+        """
+        left, top, stride, _ = self.frame(cluster)
+        pos_y, pos_x = divmod(index, self.grid.width)
+        return (pos_y - top) * stride + pos_x - left
+
+    def to_global(self, local, cluster):
+        """
+        :return: The flat index of the cell with the index in the frame of the cluster
+        """
+        left, top, stride, _ = self.frame(cluster)
+        pos_y, pos_x = divmod(local, stride)
+        return (pos_y + top) * self.grid.width + pos_x + left
+
+    def search_cluster(self, source, cluster):
+        """
+        Breadth-first search from the cell with the flat index that never leaves the cluster.
+        The border of the frame stops it, so it needs no bounds checks.
+        :return: Lists of the distances and the parents of the cells by their indices in the frame
+         of the cluster, -1 for the cells not reached, the source is its own parent
+        """
+        _, _, stride, walls = self.frame(cluster)
+        origin = self.to_local(source, cluster)
+        distances = [-1] * len(walls)
+        parents = [-1] * len(walls)
+        distances[origin] = 0
+        parents[origin] = origin
+        queue = [origin]
+        for local in queue:
+            distance = distances[local] + 1
+            for next_local in (local - stride, local + 1, local + stride, local - 1):
+                if distances[next_local] < 0 and not walls[next_local]:
+                    distances[next_local] = distance
+                    parents[next_local] = local
+                    queue.append(next_local)
+        return distances, parents
+
+    def find_path(self, start, goal):
+        """
+        Searches the abstract graph for a route between the cells and refines it.
+        :return: The flat indices of the cells of the path from start to goal, None if there is none
+        """
+        if start == goal:
+            return [start]
+        start_cluster, goal_cluster = self.cluster(start), self.cluster(goal)
+        start_distances, start_parents = self.search_cluster(start, start_cluster)
+        goal_distances, goal_parents = self.search_cluster(goal, goal_cluster)
+        # temporary edges connecting the start and the goal to the entrances of their clusters
+        start_edges = self._distances_to(self.nodes.get(start_cluster, ()), start_distances, start_cluster)
+        if start_cluster == goal_cluster:
+            start_edges.update(self._distances_to((goal,), start_distances, start_cluster))
+        goal_edges = self._distances_to(self.nodes.get(goal_cluster, ()), goal_distances, goal_cluster)
+
+        width = self.grid.width
+        goal_y, goal_x = divmod(goal, width)
+        edges = self.edges
+        g_scores = {start: 0}
+        parents = {start: None}
+        # ties of the estimate are broken towards the longer routes, which are closer to the goal,
+        # the estimate is consistent, so entries with a longer route than the best one are outdated
+        queue = [(0, 0, start)]
+        while queue:
+            _, g_score, current = heapq.heappop(queue)
+            if -g_score > g_scores[current]:
+                continue
+            search_stats.nodes_expanded += 1
+            if current == goal:
+                route = [goal]
+                while parents[route[-1]] is not None:
+                    route.append(parents[route[-1]])
+                route.reverse()
+                return self._refine(route, (start_parents, start_cluster), (goal_parents, goal_cluster))
+
+            neighbours = edges[current].items() if current in edges else ()
+            if current == start:
+                neighbours = chain(neighbours, start_edges.items())
+            if current in goal_edges:
+                neighbours = chain(neighbours, ((goal, goal_edges[current]),))
+            current_score = g_scores[current]
+            for node, distance in neighbours:
+                g_score = current_score + distance
+                if g_score < g_scores.get(node, g_score + 1):
+                    g_scores[node] = g_score
+                    parents[node] = current
+                    node_y, node_x = divmod(node, width)
+                    heapq.heappush(queue, (g_score + abs(goal_x - node_x) + abs(goal_y - node_y), -g_score, node))
+        return None
+
+    def segment(self, first, last):
+        """
+        :return: The flat indices of the cells of a shortest path between two entrances
+         of one cluster inside it, without the first cell
+        """
+        key = (first, last)
+        if key not in self._segments:
+            cluster = self.cluster(first)
+            _, parents = self.search_cluster(first, cluster)
+            self._segments[key] = self._walk_back(parents, last, cluster)
+        return self._segments[key]
+
+    def _distances_to(self, cells, distances, cluster):
+        """
+        :return: A dictionary of the distances of a search in the cluster to the reached cells by their flat indices
+        """
+        result = {}
+        for index in cells:
+            distance = distances[self.to_local(index, cluster)]
+            if distance >= 0:
+                result[index] = distance
+        return result
+
+    def _walk_back(self, parents, last, cluster):
+        """
+        :return: The flat indices from the source of a search in the cluster to the cell, without the source
+        """
+        local = self.to_local(last, cluster)
+        cells = []
+        while parents[local] != local:
+            cells.append(self.to_global(local, cluster))
+            local = parents[local]
+        cells.reverse()
+        return cells
+
+    def _refine(self, route, start_search, goal_search):
+        """
+        :return: The flat indices of the cells of the path along the route of abstract nodes,
+         the searches from the start and the goal are given as (parents, cluster)
+        """
+        width = self.grid.width
+        start, goal = route[0], route[-1]
+        path = [start]
+        for first, last in zip(route, route[1:]):
+            if abs(first - last) == width or (abs(first - last) == 1 and first // width == last // width):
+                path.append(last)
+            elif first == start:
+                path.extend(self._walk_back(start_search[0], last, start_search[1]))
+            elif last == goal:
+                # the search from the goal leads back to it, so its parents go forward along the path
+                path.extend(reversed(self._walk_back(goal_search[0], first, goal_search[1])[:-1]))
+                path.append(goal)
+            else:
+                path.extend(self.segment(first, last))
+        return path
+
+    def _add_entrances(self):
+        size, width, height, walls = self.cluster_size, self.grid.width, self.grid.height, self.grid.walls
+        # vertical borders, the cells left of them belong to the previous cluster of the row
+        for border_x in range(size, width, size):
+            for top in range(0, height, size):
+                run = []
+                for pos_y in range(top, min(top + size, height)):
+                    index = pos_y * width + border_x
+                    if walls[index] or walls[index - 1]:
+                        self._add_transitions(run, -1)
+                        run = []
+                    else:
+                        run.append(index)
+                self._add_transitions(run, -1)
+        # horizontal borders, the cells above them belong to the previous row of clusters
+        for border_y in range(size, height, size):
+            for left in range(0, width, size):
+                run = []
+                for pos_x in range(left, min(left + size, width)):
+                    index = border_y * width + pos_x
+                    if walls[index] or walls[index - width]:
+                        self._add_transitions(run, -width)
+                        run = []
+                    else:
+                        run.append(index)
+                self._add_transitions(run, -width)
+
+    def _add_transitions(self, run, offset):
+        if not run:
+            return
+        cells = (run[0], run[-1]) if len(run) >= MAX_ENTRANCE_WIDTH else (run[len(run) // 2],)
+        for index in cells:
+            self._link(index, index + offset, 1)
+
+    def _link(self, node, other, distance):
+        for index in (node, other):
+            if index not in self.edges:
+                self.edges[index] = {}
+                self.nodes.setdefault(self.cluster(index), []).append(index)
+        self.edges[node][other] = distance
+        self.edges[other][node] = distance
+
+
+def abstract_graph(maze, cluster_size=None):
+    """
+    :return: The AbstractGraph of the grid, built on the first call for it and kept as long as the grid
+    """
+    grid = as_grid(maze)
+    graph = _ABSTRACT_GRAPHS.get(grid)
+    if graph is None:
+        graph = _ABSTRACT_GRAPHS[grid] = AbstractGraph(grid, cluster_size or settings.HPA_CLUSTER_SIZE)
+    return graph
+
+
+def hpa_star(mazer, robot, maze, cache=None):
+    """Finds a path from the robot's position to the mazer's position
+    on the abstract graph of the maze, works exactly like a_star: the path is set
+    as robot.path and its length is returned, positions may be plain (x, y) tuples as well,
+    found paths are looked up in and stored into the PathCache if one is given."""
+    path = cached_search(find_hpa_path, as_position(robot), as_position(mazer), maze, cache)
+    if not isinstance(robot, tuple):
+        robot.path = path if path is not None else []
+    return len(path) - 1 if path is not None else None
+
+
+def find_hpa_path(start, goal, maze):
+    """
+    Finds a path between two plain positions with hierarchical pathfinding.
+    Args:
+        start (tuple): The position (x, y) the path starts at.
+        goal (tuple): The position (x, y) the path ends at.
+        maze (Grid): The grid representing the layout of the maze.
+    Returns:
+        list: The cells (y, x) of the path from start to goal, None if there is none.
+    """
+    start_x, start_y = start
+    goal_x, goal_y = goal
+    grid = as_grid(maze)
+    search_stats.searches += 1
+    search_stats.a_star_calls += 1
+    if not grid.is_open(start_x, start_y) or not grid.is_open(goal_x, goal_y):
+        return None
+    indices = abstract_graph(grid).find_path(grid.index(start_x, start_y), grid.index(goal_x, goal_y))
+    if indices is None:
+        return None
+    return [divmod(index, grid.width) for index in indices]
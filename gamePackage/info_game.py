@@ -1,5 +1,6 @@
 from gamePackage.game import *
-from gamePackage.algorithm import a_star, prior_searching
+from gamePackage.algorithm import DistanceField
+from gamePackage.assignment import *
 
 
 class InfoGame(Game):
@@ -8,9 +9,20 @@ class InfoGame(Game):
     This class extends the Game class and adds additional functionality
     for managing robot movement, maze assignments,
     and game steps.
+    All paths are taken from breadth-first distance fields, see target_assign,
+    so the game uses no pathfinder and rejects one.
     """
-    def __init__(self, filename, display):
-        super().__init__(filename, display)
+    def __init__(self, filename, display=None, renderer=None, amount_robots=None, assignment='greedy',
+                 pathfinder=None):
+        if pathfinder is not None:
+            raise ValueError(f"InfoGame plans its paths with distance fields, it takes no pathfinder, "
+                             f"got {pathfinder}")
+        super().__init__(filename, display, renderer, amount_robots)
+        if assignment not in ASSIGNMENT_STRATEGIES:
+            raise ValueError(f"Unknown assignment strategy {assignment}, "
+                             f"expected one of {', '.join(ASSIGNMENT_STRATEGIES)}")
+        self.assignment = assignment  # Name of the strategy assigning mazes to free robots
+        self.pathfinder = None  # No pathfinder is used, see target_assign
 
     def step(self):
         """
@@ -24,11 +36,8 @@ class InfoGame(Game):
         if len(self.mazes) == 0:
             self.is_running = False
         self.steps += 1
-        free_robots = []
         # looking for free robots
-        for robot in self.robots:
-            if robot.target is None:
-                free_robots.append(robot)
+        free_robots = [self.robots[index] for index in np.flatnonzero(self.fleet.target < 0)]
         # assign new mazes to free robots
         self.target_assign(free_robots)
         # move robots
@@ -40,50 +49,61 @@ class InfoGame(Game):
         # update map
         self.update()
 
-        self.maze_class.draw()
+        self.draw()
 
     def move_robots(self):
         """
         Move the robots based on their current state and path.
-        Moves the robots to their target positions by utilizing the
-        A* pathfinding algorithm.
-        If a robot is in the DELIVERING state and has an empty path, a new path is
-        calculated from the collecting point to the robot's current position.
+        Moves the robots to their target positions along their paths.
+        If a robot is in the DELIVERING state and has an empty path, a new path to
+        the collecting point is taken from the precomputed delivery field.
         If a robot is not in the DELIVERING state or has a non-empty path,
         the robot is moved to the next position in its path.
-        The move_info() method is called on each robot to update its internal state.
+        All robots are moved and change their states at once on the columns of the fleet,
+        with the same rules as Robot.move_info().
         """
-        for robot in self.robots:
-            if robot.state == RobotState.DELIVERING and robot.path == []:
-                a_star(self.collecting_point, robot, self.maze_class.maze_map)
-                robot.move_info()
-            else:
-                robot.move_info()
+        fleet = self.fleet
+        delivering = fleet.state == StateCode.DELIVERING
+        for index in np.flatnonzero(delivering & ~fleet.has_path()):
+            self.delivery_field.path_from(self.robots[index])
+        collecting = fleet.state == StateCode.COLLECTING
+        moved = fleet.advance((delivering | collecting) & (fleet.target >= 0))
+        finished = moved & (fleet.cursor == fleet.end)
+        for index in np.flatnonzero(finished & delivering):
+            fleet.get_target(index).delivered = True
+        for index in np.flatnonzero(finished & collecting):
+            fleet.get_target(index).collected = True
+        fleet.state[finished & delivering] = StateCode.WAITING
+        fleet.target[finished & delivering] = -1
+        fleet.state[finished & collecting] = StateCode.DELIVERING
 
     def target_assign(self, robots):
         """Assign mazes to free robots.
         Assigns mazes from the list of uncollected mazes to the available
-        free robots.
-        The assignment is based on the result of the A* pathfinding algorithm,
-        which calculates the shortest path from each free robot to each uncollected maze."""
+        free robots using the chosen assignment strategy: 'greedy' gives each
+        maze to the closest robot that is still free, 'optimal' minimises the
+        sum of the path lengths of all assigned robots.
+        The path lengths are taken from a single breadth-first search from each
+        free robot, which stops once all uncollected mazes are reached.
+        Only the robots that get a maze get a new path and target."""
         if len(robots) == 0:
             return
-        if len(self.mazes) == 0:
+        if len(self.mazes) == 0 or self.mazes.count(MazeState.UNCOLLECTED) == 0:
             return
-        for mazer in self.mazes_uncollected:
-            min_robot = None
-            min_counter = 10000000
-            if len(robots) == 0:
-                return
-            for robot in robots:
-                result = a_star(mazer, robot, self.maze_class.maze_map)
-                if result is None:
-                    continue
-                if result < min_counter:
-                    min_counter = result
-                    min_robot = robot
-                    min_robot.target = mazer
-            if min_robot is not None:
-                robots.remove(min_robot)
-                min_robot.state = RobotState.COLLECTING
-                self.mazes_uncollected.remove(min_robot.target)
+        mazes = self.mazes.in_state(MazeState.UNCOLLECTED)
+        targets = [mazer.pos() for mazer in mazes]
+        fields = [DistanceField(robot, self.grid, targets) for robot in robots]
+        costs = np.full((len(robots), len(mazes)), np.inf)
+        for robot_index, field in enumerate(fields):
+            for maze_index, mazer in enumerate(mazes):
+                distance = field.distance((mazer.y, mazer.x))
+                if distance is not None:
+                    costs[robot_index, maze_index] = distance
+
+        for robot_index, maze_index in ASSIGNMENT_STRATEGIES[self.assignment](costs):
+            robot, mazer = robots[robot_index], mazes[maze_index]
+            # the field leads from the maze to the robot, the robot goes the other way
+            robot.path = fields[robot_index].path((mazer.y, mazer.x))[::-1]
+            robot.target = mazer
+            robot.state = RobotState.COLLECTING
+            self.mazes.assign(mazer)
@@ -0,0 +1,155 @@
+"""
+This module provides Jump Point Search, a pathfinder with the same interface as a_star.
+It is the 4-connected variant: horizontal moves stop at forced neighbours and at the
+goal, vertical moves stop there as well and at every cell from which a horizontal move
+reaches a jump point. Only jump points are put into the open list, so long straight
+corridors and open halls are crossed without expanding their cells one by one.
+The paths are shortest paths, but may differ from the ones found by a_star when there
+are several of the same length.
+"""
+import heapq
+from weakref import WeakKeyDictionary
+
+from gamePackage.algorithm import as_grid, as_position, cached_search, search_stats
+
+_PADDED_WALLS = WeakKeyDictionary()  # Grid -> walls with a border, see _padded_walls
+
+
+def jump_point_search(mazer, robot, maze, cache=None):
+    """Finds the optimal path from the robot's position to the mazer's position
+    with Jump Point Search, works exactly like a_star: the path is set as robot.path
+    and its length is returned, positions may be plain (x, y) tuples as well,
+    found paths are looked up in and stored into the PathCache if one is given."""
+    path = cached_search(find_jps_path, as_position(robot), as_position(mazer), maze, cache)
+    if not isinstance(robot, tuple):
+        robot.path = path if path is not None else []
+    return len(path) - 1 if path is not None else None
+
+
+def find_jps_path(start, goal, maze):
+    """
+    Finds a shortest path between two plain positions with Jump Point Search.
+    Args:
+        start (tuple): The position (x, y) the path starts at.
+        goal (tuple): The position (x, y) the path ends at.
+        maze (Grid): The grid representing the layout of the maze.
+    Returns:
+        list: The cells (y, x) of the path from start to goal, None if there is none.
+    """
+    start_x, start_y = start
+    goal_x, goal_y = goal
+    grid = as_grid(maze)
+    search_stats.searches += 1
+    search_stats.a_star_calls += 1
+    if not grid.is_open(start_x, start_y) or not grid.is_open(goal_x, goal_y):
+        return None
+
+    # flat indices into the walls surrounded by a border of walls, so the jumps need no bounds checks
+    walls = _padded_walls(grid)
+    width = grid.width + 2
+    goal_cell = (goal_y + 1) * width + goal_x + 1
+
+    def jump_horizontal(index, delta):
+        while True:
+            index += delta
+            if walls[index]:
+                return None
+            if index == goal_cell:
+                return index
+            # a forced neighbour: the cell above or below opens up behind a wall
+            if (not walls[index - width] and walls[index - width - delta]) or \
+                    (not walls[index + width] and walls[index + width - delta]):
+                return index
+
+    def jump_vertical(index, delta):
+        while True:
+            index += delta
+            if walls[index]:
+                return None
+            if index == goal_cell:
+                return index
+            if (not walls[index - 1] and walls[index - 1 - delta]) or \
+                    (not walls[index + 1] and walls[index + 1 - delta]):
+                return index
+            # vertical moves may turn at any cell, so they stop where a horizontal move finds something
+            if jump_horizontal(index, 1) is not None or jump_horizontal(index, -1) is not None:
+                return index
+
+    start_index = (start_y + 1) * width + start_x + 1
+    g_scores = {start_index: 0}
+    parents = {}
+    closed = set()
+    queue = [(abs(goal_x - start_x) + abs(goal_y - start_y), start_index)]
+    while queue:
+        _, current_index = heapq.heappop(queue)
+        if current_index in closed:
+            continue
+        closed.add(current_index)
+        search_stats.nodes_expanded += 1
+        if current_index == goal_cell:
+            return _expand_jumps(current_index, start_index, parents, width)
+
+        parent_index = parents.get(current_index)
+        if parent_index is None:
+            directions = (-width, 1, width, -1)
+        else:
+            delta = current_index - parent_index
+            if abs(delta) < width:
+                delta = 1 if delta > 0 else -1
+                directions = (-width, delta, width)
+            else:
+                delta = width if delta > 0 else -width
+                directions = (1, delta, -1)
+
+        pos_y, pos_x = divmod(current_index, width)
+        for delta in directions:
+            if delta == 1 or delta == -1:
+                jump = jump_horizontal(current_index, delta)
+            else:
+                jump = jump_vertical(current_index, delta)
+            if jump is None or jump in closed:
+                continue
+            jump_y, jump_x = divmod(jump, width)
+            g_score = g_scores[current_index] + abs(jump_x - pos_x) + abs(jump_y - pos_y)
+            if g_score < g_scores.get(jump, g_score + 1):
+                g_scores[jump] = g_score
+                parents[jump] = current_index
+                heapq.heappush(queue, (g_score + abs(goal_x + 1 - jump_x) + abs(goal_y + 1 - jump_y), jump))
+    return None
+
+
+def _padded_walls(grid):
+    """
+    :return: The walls of the grid surrounded by a border of walls, built once per grid
+    """
+    walls = _PADDED_WALLS.get(grid)
+    if walls is None:
+        width = grid.width
+        border = b'\x01' * (width + 2)
+        rows = (b'\x01' + grid.walls[pos_y * width:(pos_y + 1) * width] + b'\x01'
+                for pos_y in range(grid.height))
+        walls = _PADDED_WALLS[grid] = border + b''.join(rows) + border
+    return walls
+
+
+def _expand_jumps(goal_index, start_index, parents, width):
+    """
+    :return: The cells (y, x) of the path through the jump points from start to goal,
+     with the straight segments between the jump points filled in, the indices are padded ones
+    """
+    jumps = [goal_index]
+    while jumps[-1] != start_index:
+        jumps.append(parents[jumps[-1]])
+    jumps.reverse()
+    start_y, start_x = divmod(start_index, width)
+    path = [(start_y - 1, start_x - 1)]
+    for previous_index, next_index in zip(jumps, jumps[1:]):
+        pos_y, pos_x = divmod(previous_index, width)
+        next_y, next_x = divmod(next_index, width)
+        step_x = (next_x > pos_x) - (next_x < pos_x)
+        step_y = (next_y > pos_y) - (next_y < pos_y)
+        while (pos_y, pos_x) != (next_y, next_x):
+            pos_x += step_x
+            pos_y += step_y
+            path.append((pos_y - 1, pos_x - 1))
+    return path
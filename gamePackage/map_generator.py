@@ -0,0 +1,259 @@
+"""
+This module generates maps in the text format of the maps folder.
+Maps are generated from a seed, so the same arguments always give the same map.
+All free cells of a generated map are connected, every robot can reach every maze
+and the collecting point. The layouts are built with NumPy on arrays of symbols,
+one byte per cell, so maps of several thousand cells in each direction are
+generated in seconds.
+"""
+import random
+
+import numpy as np
+
+WALL, FREE, ROBOT, MAZE, COLLECTING_POINT = b'X RM0'
+
+# Rooms of the 'rooms' style are divided again while they are larger than this
+MAX_ROOM_SIZE = 12
+
+
+def _perfect_maze(width, height, rng):
+    """
+    Maze with exactly one path between any two free cells, carved by a randomized depth-first search.
+    The corridors are one cell wide and run between the cells with odd coordinates.
+    """
+    symbols = np.full((height, width), WALL, dtype=np.uint8)
+    columns, rows = (width - 1) // 2, (height - 1) // 2
+    if columns < 1 or rows < 1:
+        return symbols
+    visited = bytearray(columns * rows)
+    choices = rng.bytes(columns * rows * 2)  # random numbers for the choices of the search
+    carved = []  # flat indices of the cells between two connected nodes
+    start = int.from_bytes(rng.bytes(4), 'little') % (columns * rows)
+    visited[start] = 1
+    stack = [start]
+    step = 0
+    while stack:
+        node = stack[-1]
+        pos_y, pos_x = divmod(node, columns)
+        candidates = []
+        if pos_y > 0 and not visited[node - columns]:
+            candidates.append(node - columns)
+        if pos_x + 1 < columns and not visited[node + 1]:
+            candidates.append(node + 1)
+        if pos_y + 1 < rows and not visited[node + columns]:
+            candidates.append(node + columns)
+        if pos_x > 0 and not visited[node - 1]:
+            candidates.append(node - 1)
+        if not candidates:
+            stack.pop()
+            continue
+        next_node = candidates[choices[step] % len(candidates)] if len(candidates) > 1 else candidates[0]
+        step += 1
+        visited[next_node] = 1
+        next_y, next_x = divmod(next_node, columns)
+        # the wall cell between the two nodes, nodes (x, y) are the cells (2x + 1, 2y + 1)
+        carved.append((pos_y + next_y + 1) * width + pos_x + next_x + 1)
+        stack.append(next_node)
+    symbols[1:rows * 2:2, 1:columns * 2:2] = FREE
+    symbols.flat[np.array(carved, dtype=np.int64)] = FREE
+    return symbols
+
+
+def _rooms(width, height, rng):
+    """
+    Rooms made by recursive division: the map is split by walls with one door each
+    until the rooms are at most MAX_ROOM_SIZE cells wide or high, long walls get two doors.
+    Walls are on even coordinates and doors on odd ones, so no wall blocks a door.
+    """
+    symbols = np.full((height, width), FREE, dtype=np.uint8)
+    symbols[0, :] = symbols[:, 0] = WALL
+    right, bottom = (width - 1) // 2 * 2, (height - 1) // 2 * 2  # the last even column and row
+    symbols[:, right:] = WALL
+    symbols[bottom:, :] = WALL
+    generator = random.Random(int.from_bytes(rng.bytes(8), 'little'))
+    regions = [(0, 0, right, bottom)]  # rooms given by their surrounding walls
+    while regions:
+        left, top, right, bottom = regions.pop()
+        room_width, room_height = right - left - 1, bottom - top - 1
+        if max(room_width, room_height) <= MAX_ROOM_SIZE or min(room_width, room_height) < 3:
+            continue
+        if room_width >= room_height:
+            wall = generator.randrange(left + 2, right - 1, 2)
+            symbols[top + 1:bottom, wall] = WALL
+            for door in _doors(top, bottom, generator):
+                symbols[door, wall] = FREE
+            regions += [(left, top, wall, bottom), (wall, top, right, bottom)]
+        else:
+            wall = generator.randrange(top + 2, bottom - 1, 2)
+            symbols[wall, left + 1:right] = WALL
+            for door in _doors(left, right, generator):
+                symbols[wall, door] = FREE
+            regions += [(left, top, right, wall), (left, wall, right, bottom)]
+    return symbols
+
+
+def _doors(start, end, generator):
+    """
+    :return: The odd coordinates of the doors of a wall between the walls at start and end
+    """
+    doors = {generator.randrange(start + 1, end, 2)}
+    if end - start > 4 * MAX_ROOM_SIZE:
+        doors.add(generator.randrange(start + 1, end, 2))
+    return doors
+
+
+def _warehouse(width, height, rng):
+    """
+    Open warehouse: racks two cells deep separated by aisles one cell wide,
+    broken by a cross aisle every tenth row, with a free lane along the outer walls.
+    """
+    symbols = np.full((height, width), FREE, dtype=np.uint8)
+    pos_y, pos_x = np.ogrid[:height, :width]
+    racks = (pos_x % 3 != 1) & (pos_y % 10 != 0) & (pos_x >= 2) & (pos_x < width - 2) \
+        & (pos_y >= 2) & (pos_y < height - 2)
+    symbols[racks] = WALL
+    symbols[0, :] = symbols[-1, :] = symbols[:, 0] = symbols[:, -1] = WALL
+    return symbols
+
+
+# Layouts of the generated maps by their names
+MAP_STYLES = {
+    'maze': _perfect_maze,
+    'rooms': _rooms,
+    'warehouse': _warehouse,
+}
+
+# Places of the collecting point, the free cell closest to the given point or a random free cell
+COLLECTING_POINT_PLACEMENTS = ('corner', 'center', 'random')
+
+
+def generate_map(width, height, style='warehouse', robots=10, mazes=50, wall_density=0.0,
+                 collecting_point='corner', seed=0):
+    """
+    Generates a map.
+    Args:
+        width (int): Number of cells in a row, at least 5.
+        height (int): Number of rows, at least 5.
+        style (str): Layout of the walls, one of the MAP_STYLES keys.
+        robots (int): Number of robots placed on random free cells.
+        mazes (int): Number of mazes placed on random free cells.
+        wall_density (float): Probability of a single wall cell on every cell of an open area.
+            Such walls never touch another wall, so they never cut off a part of the map.
+        collecting_point (str): Place of the collecting point, one of COLLECTING_POINT_PLACEMENTS.
+        seed (int): Seed of the random generator.
+    Returns:
+        numpy.ndarray: The symbols of the map as bytes in an array of shape (height, width).
+    Raises:
+        ValueError: If an argument is unknown or out of range or the objects do not fit onto the map.
+    """
+    if style not in MAP_STYLES:
+        raise ValueError(f"Unknown map style {style}, expected one of {', '.join(MAP_STYLES)}")
+    if collecting_point not in COLLECTING_POINT_PLACEMENTS:
+        raise ValueError(f"Unknown collecting point placement {collecting_point}, "
+                         f"expected one of {', '.join(COLLECTING_POINT_PLACEMENTS)}")
+    if width < 5 or height < 5:
+        raise ValueError(f"Maps must be at least 5x5 cells, got {width}x{height}")
+    if not 0 <= wall_density <= 1:
+        raise ValueError(f"The wall density must be between 0 and 1, got {wall_density}")
+    rng = np.random.default_rng(seed)
+    symbols = MAP_STYLES[style](width, height, rng)
+    if wall_density > 0:
+        _scatter_walls(symbols, wall_density, rng)
+
+    free = symbols == FREE
+    point_y, point_x = _place_collecting_point(free, collecting_point, rng)
+    symbols[point_y, point_x] = COLLECTING_POINT
+    free[point_y, point_x] = False
+    cells = _random_free_cells(free, robots + mazes, rng)
+    symbols.flat[cells[:robots]] = ROBOT
+    symbols.flat[cells[robots:]] = MAZE
+    return symbols
+
+
+def _scatter_walls(symbols, wall_density, rng):
+    """
+    Turns random free cells into walls. Only cells without walls among their eight
+    neighbours are taken, and of two taken cells next to each other only the one with
+    the lower random priority stays, so every new wall is surrounded by free cells.
+    """
+    height, width = symbols.shape
+    free = np.zeros((height + 2, width + 2), dtype=bool)
+    free[1:-1, 1:-1] = symbols == FREE
+    open_area = free[1:-1, 1:-1].copy()
+    for delta_y in (0, 1, 2):
+        for delta_x in (0, 1, 2):
+            open_area &= free[delta_y:delta_y + height, delta_x:delta_x + width]
+    priorities = np.full((height + 2, width + 2), np.iinfo(np.uint32).max, dtype=np.uint32)
+    priorities[1:-1, 1:-1] = rng.integers(0, np.iinfo(np.uint32).max, (height, width), dtype=np.uint32)
+    threshold = int(wall_density * (np.iinfo(np.uint32).max - 1))
+    taken = open_area & (priorities[1:-1, 1:-1] < threshold)
+    priorities[1:-1, 1:-1][~taken] = np.iinfo(np.uint32).max
+    center = priorities[1:-1, 1:-1]
+    kept = taken.copy()
+    for delta_y in (0, 1, 2):
+        for delta_x in (0, 1, 2):
+            if delta_y != 1 or delta_x != 1:
+                kept &= priorities[delta_y:delta_y + height, delta_x:delta_x + width] > center
+    symbols[kept] = WALL
+
+
+def _place_collecting_point(free, placement, rng):
+    """
+    :return: The cell (y, x) of the collecting point, the free cell closest to the corner or the center
+     of the map, or a random free cell
+    """
+    height, width = free.shape
+    if placement == 'random':
+        return divmod(int(_random_free_cells(free, 1, rng)[0]), width)
+    target_y, target_x = (0, 0) if placement == 'corner' else (height // 2, width // 2)
+    radius = 1
+    while True:
+        # the closest free cell inside a growing window around the target
+        top, left = max(target_y - radius, 0), max(target_x - radius, 0)
+        window = free[top:target_y + radius + 1, left:target_x + radius + 1]
+        cells_y, cells_x = np.nonzero(window)
+        if len(cells_y):
+            distances = np.abs(cells_y + top - target_y) + np.abs(cells_x + left - target_x)
+            closest = np.argmin(distances)
+            if distances[closest] <= radius or window.shape == free.shape:
+                return int(cells_y[closest] + top), int(cells_x[closest] + left)
+        elif window.shape == free.shape:
+            raise ValueError("The map has no free cell for the collecting point")
+        radius *= 2
+
+
+def _random_free_cells(free, amount, rng):
+    """
+    :return: Flat indices of amount distinct random free cells in random order
+    """
+    free_flat = free.ravel()
+    amount_free = int(np.count_nonzero(free_flat))
+    if amount > amount_free:
+        raise ValueError(f"{amount} objects do not fit onto {amount_free} free cells")
+    if amount > amount_free // 4:
+        # many objects, choosing among all free cells is cheaper than drawing until enough are found
+        return rng.choice(np.flatnonzero(free_flat), amount, replace=False)
+    chosen = np.zeros(0, dtype=np.int64)
+    while len(chosen) < amount:
+        drawn = rng.integers(0, free_flat.size, amount * 2)
+        chosen = np.concatenate([chosen, drawn[free_flat[drawn]]])
+        _, first = np.unique(chosen, return_index=True)
+        chosen = chosen[np.sort(first)]
+    return chosen[:amount]
+
+
+def map_rows(symbols):
+    """
+    :return: The rows of the map as strings
+    """
+    text = symbols.tobytes().decode('ascii')
+    width = symbols.shape[1]
+    return [text[start:start + width] for start in range(0, len(text), width)]
+
+
+def save_map(symbols, path):
+    """Writes the map in the text format, row by row."""
+    with open(path, 'wb') as file:
+        for row in symbols:
+            file.write(row.tobytes())
+            file.write(b'\n')
@@ -0,0 +1,96 @@
+"""
+This module reads text maps row by row.
+The file is read in chunks of whole lines, every row goes straight into the walls
+of the grid and the positions of the objects, so no rows of symbols are kept and
+the memory needed stays close to the size of the grid, one byte per cell.
+The rows are checked while reading: all rows must be equally long and there must
+be exactly one collecting point '0'. Blank lines are only allowed after the last row.
+"""
+import hashlib
+import re
+from array import array
+from typing import NamedTuple
+
+from gamePackage.grid import Grid
+
+# Default number of bytes of the lines read at once
+CHUNK_SIZE = 1 << 20
+
+_OBJECTS = re.compile(b'[RM0]')
+_WALL_BYTES = bytes(1 if code == ord('X') else 0 for code in range(256))
+
+
+class ParsedMap(NamedTuple):
+    """The content of a text map: its walls in the layout of Grid and the positions of its objects."""
+    width: int
+    height: int
+    walls: bytearray  # 1 for a wall, 0 for a free cell, by flat cell index
+    robots: array  # x and y of every robot in the order of the rows, as int32
+    mazes: array  # x and y of every maze in the order of the rows, as int32
+    collecting_point: tuple  # (x, y) of the collecting point
+    digest: bytes  # sha256 of the content of the file
+
+    def grid(self):
+        """
+        :return: The Grid of the walls, sharing their memory
+        """
+        return Grid(memoryview(self.walls).toreadonly(), self.width, self.height)
+
+
+def parse_map(source, chunk_size=CHUNK_SIZE):
+    """
+    Reads the text map row by row. Only the line endings are removed, so spaces at the ends
+    of the rows are free cells like all symbols except 'X', which is a wall.
+    Args:
+        source (str): Path of the text map.
+        chunk_size (int): Number of bytes of the lines read at once.
+    Returns:
+        ParsedMap: The walls and objects of the map.
+    Raises:
+        ValueError: If the rows are not equally long or there is not exactly one collecting point.
+    """
+    digest = hashlib.sha256()
+    walls = bytearray()
+    robots, mazes = array('i'), array('i')
+    collecting_point = None
+    width = None
+    height = 0
+    line_number = 0
+    blank_line = None  # number of the first blank line after the last row
+    with open(source, 'rb') as file:
+        lines = file.readlines(chunk_size)
+        while lines:
+            for line in lines:
+                line_number += 1
+                digest.update(line)
+                row = line.rstrip(b'\r\n')
+                if not row:
+                    blank_line = blank_line or line_number
+                    continue
+                if blank_line is not None:
+                    raise ValueError(f"{source}, line {blank_line}: blank line inside the map")
+                if width is None:
+                    width = len(row)
+                elif len(row) != width:
+                    raise ValueError(f"{source}, line {line_number}: row of {len(row)} cells, "
+                                     f"the rows above have {width}")
+                walls += row.translate(_WALL_BYTES)
+                for match in _OBJECTS.finditer(row):
+                    symbol = match.group()
+                    if symbol == b'R':
+                        robots.extend((match.start(), height))
+                    elif symbol == b'M':
+                        mazes.extend((match.start(), height))
+                    elif collecting_point is not None:
+                        raise ValueError(f"{source}, line {line_number}: second collecting point, "
+                                         f"the first one is at x: {collecting_point[0]} y: {collecting_point[1]}")
+                    else:
+                        collecting_point = (match.start(), height)
+                height += 1
+            lines = file.readlines(chunk_size)
+
+    if width is None:
+        raise ValueError(f"{source}: the map is empty")
+    if collecting_point is None:
+        raise ValueError(f"{source}: the map has no collecting point '0'")
+    return ParsedMap(width, height, walls, robots, mazes, collecting_point, digest.digest())
@@ -1,10 +1,47 @@
+class MazeState:
+    """Integer codes of the states a maze goes through, in this order."""
+    UNCOLLECTED = 0
+    ASSIGNED = 1  # a robot is on its way to the maze
+    COLLECTED = 2  # a robot carries the maze to the collecting point
+    DELIVERED = 3
+
+
 class Mazes:
-    """This class represents a maze object."""
+    """This class represents a maze object.
+    Maps may hold many thousands of mazes, so the attributes are kept in slots
+    instead of a dictionary per instance.
+    A maze added to a MazeRegistry reports every change of its state to it."""
+    __slots__ = ('x', 'y', 'state', 'registry')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.collected = False
-        self.delivered = False
+        self.state = MazeState.UNCOLLECTED
+        self.registry = None  # the MazeRegistry the maze belongs to, if any
+
+    @property
+    def collected(self):
+        """True once a robot picked the maze up, delivered mazes stay collected."""
+        return self.state >= MazeState.COLLECTED
+
+    @collected.setter
+    def collected(self, value):
+        self.set_state(MazeState.COLLECTED if value else MazeState.UNCOLLECTED)
+
+    @property
+    def delivered(self):
+        return self.state == MazeState.DELIVERED
+
+    @delivered.setter
+    def delivered(self, value):
+        self.set_state(MazeState.DELIVERED if value else MazeState.COLLECTED)
+
+    def set_state(self, state):
+        """Changes the state of the maze, through its registry if it has one."""
+        if self.registry is not None:
+            self.registry.set_state(self, state)
+        else:
+            self.state = state
 
     def pos(self):
         """The pos method returns the current position of the maze as a tuple of x and y coordinates."""
@@ -12,3 +49,93 @@ class Mazes:
 
     def __str__(self):
         return f"Maze x: {self.x} y: {self.y}"
+
+
+class MazeRegistry:
+    """
+    Class that keeps the mazes of a game indexed by their positions and states.
+    Every state has an insertion ordered set of its mazes, so changing the state
+    of a maze, counting the mazes of a state and looking a maze up by its position
+    are O(1), and iterating over the mazes of a state visits only them.
+    len() and iteration cover the active mazes, the ones not delivered yet,
+    in the order they were added.
+    """
+    def __init__(self):
+        self._by_pos = {}  # (y, x) -> maze
+        self._by_state = [{} for _ in range(MazeState.DELIVERED + 1)]  # state -> ordered set of mazes
+        self._active = {}  # ordered set of the mazes not delivered yet
+        self._delivered_queue = []  # mazes delivered since the last take_delivered
+
+    def add(self, maze):
+        """Adds the maze in its current state, its position must be free."""
+        if (maze.y, maze.x) in self._by_pos:
+            raise ValueError(f"There is already a maze at x: {maze.x} y: {maze.y}")
+        maze.registry = self
+        self._by_pos[(maze.y, maze.x)] = maze
+        self._by_state[maze.state][maze] = None
+        if maze.state != MazeState.DELIVERED:
+            self._active[maze] = None
+
+    def set_state(self, maze, state):
+        """Moves the maze to the state."""
+        if state == maze.state:
+            return
+        del self._by_state[maze.state][maze]
+        self._by_state[state][maze] = None
+        if state == MazeState.DELIVERED:
+            del self._active[maze]
+            self._delivered_queue.append(maze)
+        elif maze.state == MazeState.DELIVERED:
+            self._active[maze] = None
+        maze.state = state
+
+    def assign(self, maze):
+        """Marks the maze as assigned to a robot, if it is not collected yet."""
+        if maze.state == MazeState.UNCOLLECTED:
+            self.set_state(maze, MazeState.ASSIGNED)
+
+    def release(self, maze):
+        """Marks the maze as uncollected again when its robot gave it up, if it is still assigned."""
+        if maze.state == MazeState.ASSIGNED:
+            self.set_state(maze, MazeState.UNCOLLECTED)
+
+    def get(self, pos):
+        """
+        :return: The maze at the (y, x) position, None if there is none
+        """
+        return self._by_pos.get((pos[0], pos[1]))
+
+    def in_state(self, state):
+        """
+        :return: A list of the mazes in the state, in the order they got into it
+        """
+        return list(self._by_state[state])
+
+    def count(self, state):
+        """
+        :return: The number of mazes in the state
+        """
+        return len(self._by_state[state])
+
+    def counts(self):
+        """
+        :return: A dictionary with the number of mazes of every state by the names of MazeState
+        """
+        return {name.lower(): len(self._by_state[getattr(MazeState, name)])
+                for name in ('UNCOLLECTED', 'ASSIGNED', 'COLLECTED', 'DELIVERED')}
+
+    def take_delivered(self):
+        """
+        :return: The mazes delivered since the last call, they are forgotten afterwards
+        """
+        delivered, self._delivered_queue = self._delivered_queue, []
+        return delivered
+
+    def __len__(self):
+        return len(self._active)
+
+    def __iter__(self):
+        return iter(list(self._active))
+
+    def __contains__(self, maze):
+        return maze in self._active
@@ -1,5 +1,6 @@
 from gamePackage.game import *
-from gamePackage.algorithm import a_star, prior_searching
+from gamePackage.algorithm import prior_searching
+from gamePackage.explored_cells import ExploredCells
 
 
 class MuteGame(Game):
@@ -9,8 +10,14 @@ class MuteGame(Game):
     functionality specific to the mute mode of the game.
     """
 
-    def __init__(self, filename, display):
-        super().__init__(filename, display)
+    def __init__(self, filename, display=None, renderer=None, amount_robots=None, pathfinder='a_star'):
+        super().__init__(filename, display, renderer, amount_robots, pathfinder)
+
+    def load(self):
+        """Loads the map and gives every robot its own database of explored cells."""
+        super().load()
+        for robot in self.robots:
+            robot.explored_cells = ExploredCells(self.grid)
 
     def step(self):
         """
@@ -37,7 +44,7 @@ class MuteGame(Game):
         # update map
         self.update()
 
-        self.maze_class.draw()
+        self.draw()
 
     def check_state(self):
         """
@@ -52,23 +59,27 @@ class MuteGame(Game):
         explore new cells.
         Robots in the DELIVERING state will update their target maze as delivered and
         collect any new mazes found.
+        Only the robots that stand on a maze, explore without a path or wait are
+        visited, nothing changes for the other ones.
         """
-
-        for robot in self.robots:
+        fleet = self.fleet
+        attention = self.maze_flags[self.robot_cells()] | (fleet.state == StateCode.WAITING) \
+            | ((fleet.state == StateCode.EXPLORING) & ~fleet.has_path())
+        for index in np.flatnonzero(attention):
+            robot = self.robots[index]
             x, y = robot.pos()
-            if self.maze_class.maze_map[y][x] == 'M' and robot.state != RobotState.DELIVERING:
+            if self.maze_class.maze_map[y, x] == b'M' and robot.state != RobotState.DELIVERING:
                 robot.target = self.get_mazes_by_pos((y, x))
                 robot.target.collected = True
                 robot.state = RobotState.DELIVERING
                 robot.path.clear()
             elif robot.state == RobotState.DELIVERING:
-                if self.maze_class.maze_map[y][x] == 'M':
+                if self.maze_class.maze_map[y, x] == b'M':
                     robot.mazes_found.append(self.get_mazes_by_pos((y, x)))
-                    print(self.get_mazes_by_pos((y, x)))
-            elif robot.state == RobotState.EXPLORING and len(robot.path) == 0:
+            elif robot.state == RobotState.EXPLORING and not robot.path:
                 robot.state = RobotState.WAITING
             elif robot.state == RobotState.WAITING:
-                prior_searching(robot, robot.explored_cells, self.maze_class.maze_map)
+                prior_searching(robot, robot.explored_cells, self.grid)
                 robot.state = RobotState.EXPLORING
 
     def move_robots(self):
@@ -76,25 +87,36 @@ class MuteGame(Game):
         Move the robots in the mute mode.
         Moves the robots based on their current state and path in the mute mode.
         If a robot is in the DELIVERING state and has an empty path, a new path
-        is calculated from the collecting point to the robot's current position.
+        to the collecting point is taken from the precomputed delivery field.
         If a robot is in the COLLECTING state and has an empty path but has found new mazes,
         the robot will select the maze with the shortest path and move towards it.
         Robots in the EXPLORING or WAITING state will move without a target.
-        The move_mute() method is called on each robot to update its internal state.
+        After the paths are planned all robots move and change their states at once
+        on the columns of the fleet, with the same rules as Robot.move_mute().
         """
-        for robot in self.robots:
-            if robot.state == RobotState.DELIVERING and robot.path == []:
-                a_star(self.collecting_point, robot, self.maze_class.maze_map)
-                robot.move_mute()
-            elif robot.state == RobotState.COLLECTING and robot.path == [] and robot.mazes_found:
-                min_mazes = None
-                min_counter = 10000000
-                for mazes in robot.mazes_found:
-                    tmp = a_star(mazes, robot, self.maze_class.maze_map)
-                    if tmp < min_counter:
-                        min_counter = tmp
-                        min_mazes = mazes
-                robot.mazes_found.remove(min_mazes)
-                robot.move_mute()
-            else:
-                robot.move_mute()
+        fleet = self.fleet
+        for index in np.flatnonzero(~fleet.has_path()):
+            robot = self.robots[index]
+            if fleet.state[index] == StateCode.DELIVERING:
+                self.delivery_field.path_from(robot)
+            elif fleet.state[index] == StateCode.COLLECTING and robot.mazes_found:
+                closest = self.closest_maze(robot, robot.mazes_found)
+                if closest is not None:
+                    robot.mazes_found.remove(closest)
+
+        has_path = fleet.has_path()
+        # every robot adds the next cell of its path to its own database
+        next_y, next_x = fleet.next_cells(has_path)
+        for index, pos_y, pos_x in zip(np.flatnonzero(has_path), next_y, next_x):
+            self.robots[index].explored_cells.add_index(self.grid.index(int(pos_x), int(pos_y)))
+
+        delivering = fleet.state == StateCode.DELIVERING
+        collecting = fleet.state == StateCode.COLLECTING
+        exploring = fleet.state == StateCode.EXPLORING
+        fleet.state[collecting & ~has_path] = StateCode.WAITING
+        moved = fleet.advance(delivering | collecting | exploring)
+        for index in np.flatnonzero(moved & delivering & (fleet.cursor == fleet.end)):
+            robot = self.robots[index]
+            robot.target.delivered = True
+            robot.state = RobotState.COLLECTING if robot.mazes_found else RobotState.WAITING
+            robot.target = None
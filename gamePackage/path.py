@@ -0,0 +1,88 @@
+class Path:
+    """
+    Class that represents the path of a robot: a list of (y, x) cells with a
+    cursor pointing at the next cell to visit.
+    Advancing moves the cursor instead of deleting the first cell of the list,
+    so following a path of length n costs O(n) and not O(n^2).
+    Indexing, len() and comparisons only see the cells that are still ahead.
+    Subclasses may keep the cells elsewhere by overriding cursor, end, _cell,
+    splice and clear.
+    """
+    def __init__(self, cells=()):
+        # a list is taken over without copying, it must not be changed by the caller afterwards
+        self.cells = cells if isinstance(cells, list) else list(cells)
+        self.cursor = 0  # index of the next cell in cells
+
+    @property
+    def end(self):
+        """
+        :return: The index after the last cell of the path
+        """
+        return len(self.cells)
+
+    def _cell(self, index):
+        return self.cells[index]
+
+    def peek(self):
+        """
+        :return: The next cell of the path without advancing
+        """
+        if self.cursor >= self.end:
+            raise IndexError("peek on an empty path")
+        return self._cell(self.cursor)
+
+    def advance(self):
+        """
+        Moves the cursor to the following cell.
+        :return: The cell that was next
+        """
+        cell = self.peek()
+        self.cursor += 1
+        return cell
+
+    def splice(self, offset, cells):
+        """
+        Replaces the part of the path starting offset cells ahead with the given cells,
+        e.g. when a route is replanned from a cell on the current path.
+        Only the replaced part is touched, the cells before it stay as they are.
+        """
+        if not 0 <= offset <= len(self):
+            raise IndexError("splice offset out of range")
+        del self.cells[self.cursor + offset:]
+        self.cells.extend(cells)
+
+    def clear(self):
+        """Removes all remaining cells."""
+        self.cells = []
+        self.cursor = 0
+
+    def __len__(self):
+        return self.end - self.cursor
+
+    def __bool__(self):
+        return self.cursor < self.end
+
+    def __iter__(self):
+        for index in range(self.cursor, self.end):
+            yield self._cell(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("path index out of range")
+        return self._cell(self.cursor + index)
+
+    def __eq__(self, other):
+        if isinstance(other, Path):
+            other = other[:]
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self[:]})"
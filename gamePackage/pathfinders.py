@@ -0,0 +1,18 @@
+"""
+This module collects the pathfinders the games can choose from.
+Every pathfinder works like a_star: it takes (mazer, robot, maze, cache=None),
+sets the shortest path from the robot to the mazer as robot.path and returns
+its length, or sets an empty path and returns None if there is no path.
+The paths are looked up in and stored into the PathCache if one is given.
+"""
+from gamePackage.algorithm import a_star
+from gamePackage.jump_point_search import jump_point_search
+from gamePackage.hpa_star import hpa_star
+
+
+# Pathfinders by the names accepted by the games
+PATHFINDERS = {
+    'a_star': a_star,
+    'jps': jump_point_search,
+    'hpa': hpa_star,
+}
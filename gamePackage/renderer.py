@@ -0,0 +1,329 @@
+"""
+Imports:
+- The 're' module for finding the objects in the rows of a map.
+- The 'numpy' module for rasterizing the map with array operations.
+- The 'pygame' module for creating games and graphics.
+- The 'settings' module for accessing game settings.
+- The 'Viewport' class for the window of the map shown on the screen.
+"""
+
+import re
+import numpy as np
+import pygame
+import settings
+from gamePackage.viewport import Viewport
+
+# Matches the symbols of the objects drawn over the static layer: robots, mazes and the collecting point
+DYNAMIC = re.compile('[RM0]')
+
+
+def visible_row(maze_map, pos_y, left, right):
+    """
+    :return: The symbols of the cells from left up to right of the row pos_y of the maze_map as a string
+    """
+    return maze_map[pos_y, left:right].tobytes().decode('ascii')
+
+
+class PygameRenderer:
+    """Class PygameRenderer draws the maze map of a game onto a pygame surface.
+    Games only talk to it through the draw method, so any object providing
+    draw(maze_map) can be plugged in instead. The maze_map is a (height, width)
+    NumPy array of one byte symbols, see Maze.
+    Only the cells inside the window of its viewport are drawn. The viewport is
+    created on the first frame, when the size of the map is known, with cells
+    as large as possible for the whole map to fit onto the display, and can be
+    zoomed and panned afterwards."""
+
+    def __init__(self, display):
+        self.display = display
+        self.viewport = None  # window of the map shown on the display, created on the first frame
+        self.images = {}  # unscaled textures by their names
+        self.texture_cache = {}  # cell size -> textures scaled to it by their names
+        self.texture_wall = None
+        self.texture_robot = None
+        self.texture_house = None
+        self.texture_mazer = None
+        self.previous_rows = None  # visible parts of the rows drawn last, None if everything has to be drawn
+        self.static_map = None  # walls and floor of the whole map with one pixel per cell
+        self.static_layer = None  # visible part of the static map scaled to the size of the cells
+        self.static_layer_key = None  # viewport state the static layer was made for
+        self.dirty_rects = []  # rectangles of the display drawn since take_dirty_rects was called
+        self.textures_load()
+
+    @property
+    def cell_size(self):
+        """The size of a cell on the display in pixels."""
+        return self.viewport.cell_size
+
+    def draw(self, maze_map):
+        """
+           Draws the visible cells of the maze_map that changed since the last frame.
+
+           The first frame, every frame after the size of the map changed and every
+           frame after invalidate(), zoom() or pan() blits the static layer of walls
+           and floor and draws the robots, mazes and the collecting point on top of it.
+           Later frames compare the visible part of every row with the one drawn
+           before and draw only the cells whose symbol differs.
+           The rectangles of the drawn cells are collected in dirty_rects, so only
+           they have to be pushed to the screen, see take_dirty_rects.
+           """
+        self.update_viewport(maze_map)
+        left, top, right, bottom = self.viewport.visible()
+        rows = [visible_row(maze_map, pos_y, left, right) for pos_y in range(top, bottom)]
+        previous_rows = self.previous_rows
+        if previous_rows is None:
+            self.update_static_layer()
+            self.display.fill(settings.BLACK)
+            self.display.blit(self.static_layer, (0, 0))
+            for pos_y, row in enumerate(rows, top):
+                for match in DYNAMIC.finditer(row):
+                    self.draw_object(left + match.start(), pos_y, match.group())
+            self.dirty_rects.append(self.display.get_rect())
+        else:
+            for pos_y, (row, previous_row) in enumerate(zip(rows, previous_rows), top):
+                if row == previous_row:
+                    continue
+                for pos_x, (symbol, previous_symbol) in enumerate(zip(row, previous_row), left):
+                    if symbol != previous_symbol:
+                        self.dirty_rects.append(self.draw_cell(pos_x, pos_y, symbol))
+        self.previous_rows = rows
+
+    def draw_changes(self, maze_map, changes):
+        """
+           Draws the visible cells listed in changes, (x, y, symbol) tuples of the cells
+           of the maze_map changed since the last frame, e.g. the changes of Game.update.
+           Nothing else of the map is looked at, unless everything has to be drawn.
+           """
+        self.update_viewport(maze_map)
+        if self.previous_rows is None:
+            self.draw(maze_map)
+            return
+        left, top, right, bottom = self.viewport.visible()
+        changed_rows = set()
+        for pos_x, pos_y, symbol in changes:
+            if left <= pos_x < right and top <= pos_y < bottom:
+                self.dirty_rects.append(self.draw_cell(pos_x, pos_y, symbol))
+                changed_rows.add(pos_y)
+        # keep the rows drawn last up to date for the next call of draw
+        for pos_y in changed_rows:
+            self.previous_rows[pos_y - top] = visible_row(maze_map, pos_y, left, right)
+
+    def update_viewport(self, maze_map):
+        """Creates the viewport and the static map for the first map and whenever the size of the map changes."""
+        height, width = maze_map.shape
+        viewport = self.viewport
+        if viewport is not None and (viewport.map_width, viewport.map_height) == (width, height):
+            return
+        self.viewport = Viewport(*self.display.get_size(), width, height, settings.MAX_CELL_SIZE)
+        self.static_map = self.build_static_map(maze_map, width, height)
+        self.static_layer_key = None
+        self.previous_rows = None
+        self.textures_load()
+
+    @staticmethod
+    def build_static_map(maze_map, width, height):
+        """
+           Renders the parts of the map that never change after a game is loaded:
+           'X' cells are black walls, every other cell is white floor.
+           :return: A surface with one pixel per cell
+           """
+        walls = np.ones((width, max(height, 1)), dtype=bool)
+        walls[:, :height] = (maze_map == b'X').T
+        colours = np.where(walls[..., None], np.array(settings.BLACK, dtype=np.uint8),
+                           np.array(settings.WHITE, dtype=np.uint8))
+        return pygame.surfarray.make_surface(colours)
+
+    def update_static_layer(self):
+        """Scales the visible part of the static map to the size of the cells if the viewport changed since."""
+        key = self.viewport.state()
+        if key == self.static_layer_key:
+            return
+        left, top, right, bottom = self.viewport.visible()
+        window = self.static_map.subsurface(pygame.Rect(left, top, right - left, bottom - top))
+        self.static_layer = pygame.transform.scale(window, ((right - left) * self.cell_size,
+                                                            (bottom - top) * self.cell_size))
+        self.static_layer_key = key
+
+    def cell_rect(self, pos_x, pos_y):
+        """
+        :return: The rectangle of the cell (x, y) on the display
+        """
+        return pygame.Rect(*self.viewport.screen_pos(pos_x, pos_y), self.cell_size, self.cell_size)
+
+    def draw_cell(self, pos_x, pos_y, symbol):
+        """
+           Draws one cell of the maze: the cell of the static layer and the object on it, if any.
+           :return: The rectangle of the cell on the display
+           """
+        rect = self.cell_rect(pos_x, pos_y)
+        self.display.blit(self.static_layer, rect, rect)
+        if DYNAMIC.match(symbol):
+            self.draw_object(pos_x, pos_y, symbol)
+        return rect
+
+    def draw_object(self, pos_x, pos_y, symbol):
+        """
+           Draws the object on the cell over the static layer.
+           - 'R' is drawn with the texture_robot image.
+           - 'M' is drawn with the texture_mazer image.
+           - '0' is drawn as a blue rectangle.
+           """
+        rect = self.cell_rect(pos_x, pos_y)
+        if symbol == 'R':
+            self.display.blit(self.texture_robot, rect)
+        elif symbol == 'M':
+            self.display.blit(self.texture_mazer, rect)
+        elif symbol == '0':
+            pygame.draw.rect(self.display, settings.BLUE, rect)
+
+    def zoom(self, factor):
+        """Zooms the viewport by the factor, see Viewport.zoom."""
+        if self.viewport is not None and self.viewport.zoom(factor):
+            self.textures_load()
+            self.invalidate()
+
+    def pan(self, delta_x, delta_y):
+        """Moves the viewport by the given number of cells."""
+        if self.viewport is not None:
+            self.viewport.pan(delta_x, delta_y)
+            self.invalidate()
+
+    def invalidate(self):
+        """Makes the next frame draw all visible cells, e.g. after something else was drawn over the display."""
+        self.previous_rows = None
+
+    def take_dirty_rects(self):
+        """
+        :return: The rectangles drawn since the last call, they are forgotten afterwards
+        """
+        rects, self.dirty_rects = self.dirty_rects, []
+        return rects
+
+    def textures_load(self):
+        """Loads the textures for walls, robot, house, and mazer in the maze and scales them
+        to the size of the cells. Scaled textures are cached for every cell size."""
+        if not self.images:
+            self.images = {'wall': pygame.image.load("./images/wall.jpg"),
+                           'robot': pygame.image.load("./images/robot1.jpg"),
+                           'house': pygame.image.load("./images/house.png"),
+                           'mazer': pygame.image.load("./images/box.png")}
+        if self.viewport is None:
+            return
+        size = self.cell_size
+        if size not in self.texture_cache:
+            self.texture_cache[size] = {name: pygame.transform.scale(image, (size, size))
+                                        for name, image in self.images.items()}
+        textures = self.texture_cache[size]
+        self.texture_wall = textures['wall']
+        self.texture_robot = textures['robot']
+        self.texture_house = textures['house']
+        self.texture_mazer = textures['mazer']
+
+
+class ArrayRenderer(PygameRenderer):
+    """Class ArrayRenderer is a render backend that rasterizes the visible map with NumPy.
+    The visible cells are kept as a small array of palette indices, one per cell.
+    Every frame the indices are turned into pixel values, upscaled to the size of the
+    cells with array operations, the robot and maze sprites are copied into the cells
+    where they are present, and the result is pushed with a single
+    pygame.surfarray.blit_array call. The cost of a frame does not depend on how many
+    cells changed, which makes full redraws of very large maps cheap."""
+    # Palette indices of the cells
+    FLOOR, WALL, COLLECTING_POINT, ROBOT, MAZE = range(5)
+
+    def __init__(self, display):
+        super().__init__(display)
+        # map symbol byte -> palette index, unknown symbols are floor
+        self.symbol_codes = np.full(256, self.FLOOR, dtype=np.uint8)
+        for symbol, code in (('X', self.WALL), ('0', self.COLLECTING_POINT),
+                             ('R', self.ROBOT), ('M', self.MAZE)):
+            self.symbol_codes[ord(symbol)] = code
+        # frames are rasterized as mapped 32 bit pixel values of this format
+        self.pixel_format = pygame.Surface((1, 1), depth=32)
+        # palette index -> pixel value, robots and mazes are covered by their sprites
+        self.palette = np.array([self.pixel_format.map_rgb(colour) for colour in
+                                 (settings.WHITE, settings.BLACK, settings.BLUE,
+                                  settings.WHITE, settings.WHITE)], dtype=np.uint32)
+        self.sprite_cache = {}  # cell size -> sprite arrays by palette indices
+        self.cells = None  # palette indices of the visible cells drawn last, rows are y
+        self.cells_key = None  # viewport state the cells were drawn for
+        self.surface = None  # surface of the size of the visible cells the frames are rasterized into
+
+    def sprite_array(self, texture):
+        """
+        :return: The mapped pixels of the texture as a (width, height) array, transparent parts blended with the floor
+        """
+        pixels = pygame.surfarray.array3d(texture).astype(np.float32)
+        if texture.get_flags() & pygame.SRCALPHA:
+            alpha = pygame.surfarray.array_alpha(texture)[..., None] / 255.0
+            pixels = pixels * alpha + np.array(settings.WHITE, dtype=np.float32) * (1 - alpha)
+        return pygame.surfarray.map_array(self.pixel_format, pixels.astype(np.uint8)).astype(np.uint32)
+
+    def sprites(self):
+        """
+        :return: The sprite arrays of robots and mazes for the current cell size by their palette indices
+        """
+        if self.cell_size not in self.sprite_cache:
+            self.sprite_cache[self.cell_size] = {self.ROBOT: self.sprite_array(self.texture_robot),
+                                                 self.MAZE: self.sprite_array(self.texture_mazer)}
+        return self.sprite_cache[self.cell_size]
+
+    def cell_codes(self, maze_map):
+        """
+        :return: A (height, width) array of palette indices of the visible cells
+        """
+        left, top, right, bottom = self.viewport.visible()
+        return self.symbol_codes[maze_map[top:bottom, left:right].view(np.uint8)]
+
+    def rasterize(self, cells):
+        """
+        :return: The pixels of the cells as a (width, height) array, the layout surfarray uses
+        """
+        height, width = cells.shape
+        size = self.cell_size
+        frame = np.repeat(np.repeat(self.palette[cells.T], size, axis=0), size, axis=1)
+        # axes of the view: cell x, pixel x in the cell, cell y, pixel y in the cell
+        blocks = frame.reshape(width, size, height, size)
+        for code, sprite in self.sprites().items():
+            pos_y, pos_x = np.nonzero(cells == code)
+            if len(pos_x):
+                blocks[pos_x, :, pos_y, :] = sprite
+        return frame
+
+    def draw(self, maze_map):
+        """
+           Rasterizes the visible cells of the maze_map and blits them onto the display.
+           Frames in which no visible cell changed are skipped.
+           """
+        self.update_viewport(maze_map)
+        cells = self.cell_codes(maze_map)
+        key = self.viewport.state()
+        if self.cells is not None and key == self.cells_key and np.array_equal(cells, self.cells):
+            return
+        pixels = self.rasterize(cells)
+        if self.surface is None or self.surface.get_size() != pixels.shape:
+            self.surface = pygame.Surface(pixels.shape, depth=32)
+        pygame.surfarray.blit_array(self.surface, pixels)
+        if self.cells is None or key != self.cells_key:
+            self.display.fill(settings.BLACK)
+            self.dirty_rects.append(self.display.get_rect())
+        else:
+            self.dirty_rects.append(self.surface.get_rect())
+        self.display.blit(self.surface, (0, 0))
+        self.cells = cells
+        self.cells_key = key
+
+    def draw_changes(self, maze_map, changes):
+        """Rasterizes the visible cells like draw, frames are always drawn whole."""
+        self.draw(maze_map)
+
+    def invalidate(self):
+        """Makes the next frame be drawn even if no cell changed."""
+        self.cells = None
+
+
+# Render backends by the names accepted in settings.RENDERER
+RENDERERS = {
+    'cells': PygameRenderer,
+    'array': ArrayRenderer,
+}
@@ -1,3 +1,6 @@
+from gamePackage.fleet import Fleet, FleetPath
+from gamePackage.path import Path
+
 
 class RobotState:
     """This class defines different states that a
@@ -7,19 +10,64 @@ class RobotState:
     WAITING = "WAITING"
     EXPLORING = "EXPLORING"
 
+    # Names of the states by their integer codes, see StateCode
+    NAMES = [WAITING, COLLECTING, DELIVERING, EXPLORING]
+
+
+class StateCode:
+    """Integer codes of the robot states, stored in the state column of a Fleet."""
+    WAITING = 0
+    COLLECTING = 1
+    DELIVERING = 2
+    EXPLORING = 3
+
 
 class Robot:
-    """This class represents a robot and its current state."""
-
-    def __init__(self, pos_x, pos_y):
-        self.x = pos_x
-        self.y = pos_y
-        self.path = []
-        self.target = None
-        self.state = RobotState.WAITING
+    """This class represents a robot and its current state.
+    The position, state, target and path live in the columns of a Fleet,
+    a Robot is a thin view of one row of it. A robot created without a
+    fleet gets its own fleet."""
+    __slots__ = ('fleet', 'index', 'explored_cells', 'mazes_found')
+
+    def __init__(self, pos_x, pos_y, fleet=None):
+        self.fleet = fleet if fleet is not None else Fleet(capacity=1)
+        self.index = self.fleet.append(pos_x, pos_y)  # row of the robot in the fleet
         self.explored_cells = []
         self.mazes_found = []
 
+    @property
+    def x(self):
+        return int(self.fleet.x[self.index])
+
+    @x.setter
+    def x(self, value):
+        self.fleet.x[self.index] = value
+
+    @property
+    def y(self):
+        return int(self.fleet.y[self.index])
+
+    @y.setter
+    def y(self, value):
+        self.fleet.y[self.index] = value
+
+    @property
+    def state(self):
+        """One of the RobotState names."""
+        return RobotState.NAMES[self.fleet.state[self.index]]
+
+    @state.setter
+    def state(self, value):
+        self.fleet.state[self.index] = RobotState.NAMES.index(value)
+
+    @property
+    def target(self):
+        return self.fleet.get_target(self.index)
+
+    @target.setter
+    def target(self, value):
+        self.fleet.set_target(self.index, value)
+
     def move_info(self):
         """The Info move method is responsible for updating the robot's
          position based on its current state. If the robot is in the DELIVERING
@@ -32,9 +80,7 @@ class Robot:
         if self.state == RobotState.DELIVERING:
             if self.target is None:
                 return
-            self.x = self.path[0][1]
-            self.y = self.path[0][0]
-            del self.path[0]
+            self.y, self.x = self.path.advance()
             if len(self.path) == 0:
                 self.target.delivered = True
                 self.state = RobotState.WAITING
@@ -42,9 +88,7 @@ class Robot:
         elif self.state == RobotState.COLLECTING:
             if self.target is None:
                 return
-            self.x = self.path[0][1]
-            self.y = self.path[0][0]
-            del self.path[0]
+            self.y, self.x = self.path.advance()
             if len(self.path) == 0:
                 self.target.collected = True
                 self.state = RobotState.DELIVERING
@@ -53,17 +97,18 @@ class Robot:
 
     def add_cell(self, info):
         """
-         Adds the first cell of the path to the given list 'info'.
+         Adds the first cell of the path to the given database 'info'.
          Parameters:
-            - info: The list to which the first cell of the path will be added.
+            - info: The ExploredCells database (or a list) to which the first
+              cell of the path will be added.
          Note:
-            The 'path' attribute is assumed to be a list containing cells
+            The 'path' attribute is assumed to be a Path containing cells
             representing a path in the maze.
             """
         if not self.path:
             return
-        if self.path[0] not in info:
-            info.append(self.path[0])
+        if self.path.peek() not in info:
+            info.append(self.path.peek())
 
     def move_mute(self):
         """
@@ -91,9 +136,7 @@ class Robot:
         """
         self.add_cell(self.explored_cells)
         if self.state == RobotState.DELIVERING:
-            self.x = self.path[0][1]
-            self.y = self.path[0][0]
-            del self.path[0]
+            self.y, self.x = self.path.advance()
             if len(self.path) == 0:
                 self.target.delivered = True
                 if self.mazes_found:
@@ -107,15 +150,11 @@ class Robot:
                 self.state = RobotState.WAITING
                 self.path.clear()
                 return
-            self.x = self.path[0][1]
-            self.y = self.path[0][0]
-            del self.path[0]
+            self.y, self.x = self.path.advance()
         elif self.state == RobotState.EXPLORING:
             if not self.path:
                 return
-            self.x = self.path[0][1]
-            self.y = self.path[0][0]
-            del self.path[0]
+            self.y, self.x = self.path.advance()
 
     def move_coop(self, info):
         """
@@ -132,9 +171,17 @@ class Robot:
         self.add_cell(info)
         if not self.path:
             return
-        self.x = self.path[0][1]
-        self.y = self.path[0][0]
-        del self.path[0]
+        self.y, self.x = self.path.advance()
+
+    @property
+    def path(self):
+        """The cells the robot still has to visit, as a Path.
+        Cells assigned to it are copied into the fleet."""
+        return FleetPath(self.fleet, self.index)
+
+    @path.setter
+    def path(self, cells):
+        self.fleet.set_path(self.index, cells)
 
     def pos(self):
         """The pos method returns the current position of
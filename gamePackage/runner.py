@@ -0,0 +1,77 @@
+"""
+Imports:
+- The 'random' module for seeding the random generator of a run.
+- The 'time' module for measuring the wall-clock time of the runs.
+- The game modes and the search counters of the 'algorithm' module.
+"""
+import random
+import time
+
+from gamePackage.algorithm import search_stats
+from gamePackage.info_game import InfoGame
+from gamePackage.coop_game import CoopGame
+from gamePackage.mute_game import MuteGame
+
+# Game modes by the names used in the menu
+GAME_MODES = {
+    'Information': InfoGame,
+    'Cooperation': CoopGame,
+    'Mute': MuteGame,
+}
+
+# Keys of the dictionaries returned by run_episode, in the order used for reports
+RESULT_FIELDS = ['map', 'mode', 'assignment', 'pathfinder', 'robots', 'seed', 'steps', 'completed', 'mazes_left',
+                 'load_time', 'run_time', 'time_per_step', 'searches', 'a_star_calls', 'nodes_expanded',
+                 'cache_hits', 'cache_misses']
+
+
+def run_episode(map_path, mode, amount_robots=None, seed=0, max_steps=10000, assignment=None,
+                pathfinder='a_star'):
+    """
+    Runs one headless game until all mazes are delivered or max_steps steps were made.
+    Args:
+        map_path (str): Path to the map file.
+        mode (str): Name of the game mode, one of the GAME_MODES keys.
+        amount_robots (int): Maximal number of robots taken from the map, None for all.
+        seed (int): Seed of the random generator. The game modes make no random choices,
+            so runs differing only in their seed give the same steps.
+        max_steps (int): Maximal number of steps of the game.
+        assignment (str): Assignment strategy of the Information mode, ignored by the other modes.
+        pathfinder (str): Name of the pathfinder of the game, one of the PATHFINDERS keys,
+            ignored by the Information mode, which uses no pathfinder.
+    Returns:
+        dict: Measurements of the run with keys from RESULT_FIELDS.
+    """
+    random.seed(seed)
+
+    start = time.perf_counter()
+    if mode == 'Information':
+        game = InfoGame(map_path, amount_robots=amount_robots, assignment=assignment or 'greedy')
+    else:
+        game = GAME_MODES[mode](map_path, amount_robots=amount_robots, pathfinder=pathfinder)
+    game.load()
+    load_time = time.perf_counter() - start
+    # only the searches of the run are counted, loading may or may not find its map compiled
+    search_stats.reset()
+
+    start = time.perf_counter()
+    steps = game.run(max_steps)
+    run_time = time.perf_counter() - start
+
+    return {
+        'map': map_path,
+        'mode': mode,
+        'assignment': getattr(game, 'assignment', None),
+        'pathfinder': game.pathfinder,
+        'robots': len(game.robots),
+        'seed': seed,
+        'steps': steps,
+        'completed': len(game.mazes) == 0,
+        'mazes_left': len(game.mazes),
+        'load_time': load_time,
+        'run_time': run_time,
+        'time_per_step': run_time / steps if steps else 0.0,
+        **search_stats.as_dict(),
+        'cache_hits': game.path_cache.hits,
+        'cache_misses': game.path_cache.misses,
+    }
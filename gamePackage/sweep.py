@@ -0,0 +1,161 @@
+"""
+This module runs sweeps of headless games in parallel.
+A sweep is every combination of maps, modes, amounts of robots, seeds, assignment strategies
+and pathfinders. The runs are fanned out over a process pool, the workers get only the
+map paths and parameters and load the maps themselves, memory-mapping the compiled maps,
+so the maps are never copied between processes. Results come back as soon as a run
+finishes and are appended to a JSON Lines file, a sweep started again with the same
+file skips the runs already in it, so an interrupted sweep resumes where it stopped.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from gamePackage.compiled_map import load_map
+from gamePackage.runner import run_episode
+
+# Parameters of a run, they identify it in the results file
+RUN_FIELDS = ['map', 'mode', 'assignment', 'pathfinder', 'robots', 'seed', 'max_steps']
+
+# Keys of the rows returned by summarize, in the order used for reports
+SUMMARY_FIELDS = ['map', 'mode', 'assignment', 'pathfinder', 'robots', 'runs', 'completed',
+                  'mean_steps', 'mean_time_per_step', 'mean_nodes_expanded']
+
+
+def sweep_runs(paths, modes, robots=(None,), seeds=(0,), assignments=('greedy',), pathfinders=('a_star',),
+               max_steps=10000):
+    """
+    Lists the runs of a sweep. The assignment strategies are only combined with the Information mode,
+    the pathfinders only with the other modes, the Information mode uses no pathfinder.
+    Args:
+        paths (list): Paths of the map files.
+        modes (list): Names of the game modes, GAME_MODES keys.
+        robots (list): Maximal numbers of robots taken from the map, None for all.
+        seeds (list): Seeds of the random generator. The games are deterministic,
+            more than one seed only repeats the runs, e.g. to average their times.
+        assignments (list): Assignment strategies of the Information mode.
+        pathfinders (list): Names of the pathfinders, PATHFINDERS keys.
+        max_steps (int): Maximal number of steps of one game.
+    Returns:
+        list: Dictionaries of the parameters of the runs with the keys of RUN_FIELDS.
+    """
+    runs = []
+    for path in paths:
+        for mode in modes:
+            for assignment in (assignments if mode == 'Information' else [None]):
+                for pathfinder in (pathfinders if mode != 'Information' else [None]):
+                    for amount_robots in robots:
+                        for seed in seeds:
+                            runs.append({'map': path, 'mode': mode, 'assignment': assignment,
+                                         'pathfinder': pathfinder, 'robots': amount_robots,
+                                         'seed': seed, 'max_steps': max_steps})
+    return runs
+
+
+def run_key(run):
+    """
+    :return: A tuple of the parameters of the run, the same for the same run in every process
+    """
+    return tuple(run[field] for field in RUN_FIELDS)
+
+
+def execute_run(run):
+    """
+    Runs the game of one run of a sweep, called in the worker processes.
+    :return: The run and the result dictionary of run_episode
+    """
+    return run, run_episode(run['map'], run['mode'], run['robots'], run['seed'], run['max_steps'],
+                            run['assignment'], run['pathfinder'])
+
+
+def completed_runs(results_path):
+    """
+    Reads the results file of a sweep, a line written only partly when the sweep was interrupted is ignored.
+    :return: A dictionary of the results of the finished runs by their run_key
+    """
+    completed = {}
+    if results_path is None or not os.path.isfile(results_path):
+        return completed
+    with open(results_path) as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            completed[run_key(record['run'])] = record['result']
+    return completed
+
+
+def run_sweep(runs, results_path=None, workers=None):
+    """
+    Runs the games in a pool of processes and yields their results in the order they finish.
+    Each result is appended to the results file before it is yielded, the runs
+    already in the file are skipped.
+    Args:
+        runs (list): Parameters of the runs, see sweep_runs.
+        results_path (str): JSON Lines file of the results, None to keep no file.
+        workers (int): Number of processes, the number of processors by default.
+    Yields:
+        tuple: The parameters and the result dictionary of every run not in the file.
+    """
+    completed = completed_runs(results_path)
+    pending = [run for run in runs if run_key(run) not in completed]
+    if not pending:
+        return
+    # the maps are compiled here once, instead of by every worker loading them first
+    for path in dict.fromkeys(run['map'] for run in pending):
+        load_map(path)
+    results_file = None
+    if results_path is not None:
+        _drop_partial_line(results_path)
+        results_file = open(results_path, 'a')
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(execute_run, run) for run in pending]
+            try:
+                for future in as_completed(futures):
+                    run, result = future.result()
+                    if results_file is not None:
+                        results_file.write(json.dumps({'run': run, 'result': result}) + '\n')
+                        results_file.flush()
+                    yield run, result
+            finally:
+                # the runs not started yet are dropped when the sweep is interrupted
+                for future in futures:
+                    future.cancel()
+    finally:
+        if results_file is not None:
+            results_file.close()
+
+
+def _drop_partial_line(results_path):
+    """Cuts a line written only partly off the end of the results file, so new lines start on their own."""
+    if not os.path.isfile(results_path):
+        return
+    with open(results_path, 'rb+') as file:
+        content = file.read()
+        if content and not content.endswith(b'\n'):
+            file.truncate(content.rfind(b'\n') + 1)
+
+
+def summarize(results):
+    """
+    Aggregates the results of the runs over their seeds.
+    :return: A list of dictionaries with the keys of SUMMARY_FIELDS, one per combination
+     of map, mode, assignment, pathfinder and robots in the order of their first results
+    """
+    groups = {}
+    for result in results:
+        key = tuple(result[field] for field in SUMMARY_FIELDS[:5])
+        groups.setdefault(key, []).append(result)
+    rows = []
+    for key, group in groups.items():
+        rows.append({
+            **dict(zip(SUMMARY_FIELDS[:5], key)),
+            'runs': len(group),
+            'completed': sum(result['completed'] for result in group),
+            'mean_steps': sum(result['steps'] for result in group) / len(group),
+            'mean_time_per_step': sum(result['time_per_step'] for result in group) / len(group),
+            'mean_nodes_expanded': sum(result['nodes_expanded'] for result in group) / len(group),
+        })
+    return rows
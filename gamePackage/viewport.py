@@ -0,0 +1,83 @@
+class Viewport:
+    """
+    Class that represents the window of a map shown on the screen.
+    The window is given by the size of the cells in pixels (the zoom) and by
+    the cell of the map in the top left corner of the screen (the pan).
+    The initial cell size is the largest one that fits the whole map onto the
+    screen, but at least one pixel, so maps larger than the screen in pixels
+    start zoomed out as far as possible and are explored by panning.
+    Renderers only draw the cells inside the window, so the cost of a frame
+    depends on the size of the screen and not on the size of the map.
+    """
+    def __init__(self, screen_width, screen_height, map_width, map_height, max_cell_size=64):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.map_width = map_width
+        self.map_height = map_height
+        self.max_cell_size = max_cell_size
+        self.fit_cell_size = max(1, min(max_cell_size,
+                                        screen_width // max(map_width, 1),
+                                        screen_height // max(map_height, 1)))
+        self.cell_size = self.fit_cell_size  # size of a cell on the screen in pixels
+        self.left = 0  # x of the map cell in the top left corner of the screen
+        self.top = 0  # y of the map cell in the top left corner of the screen
+
+    @property
+    def columns(self):
+        """
+        :return: The number of map columns shown on the screen
+        """
+        return min(self.map_width, -(-self.screen_width // self.cell_size))
+
+    @property
+    def rows(self):
+        """
+        :return: The number of map rows shown on the screen
+        """
+        return min(self.map_height, -(-self.screen_height // self.cell_size))
+
+    def visible(self):
+        """
+        :return: The window of visible cells as (left, top, right, bottom), right and bottom are exclusive
+        """
+        return self.left, self.top, self.left + self.columns, self.top + self.rows
+
+    def state(self):
+        """
+        :return: A tuple that changes whenever the visible cells or their size change
+        """
+        return self.cell_size, self.left, self.top
+
+    def pan(self, delta_x, delta_y):
+        """Moves the window by the given number of cells, it never leaves the map."""
+        self.left += delta_x
+        self.top += delta_y
+        self.clamp()
+
+    def zoom(self, factor):
+        """
+        Multiplies the size of the cells by the factor, the size stays between one pixel
+        and max_cell_size. The cell in the middle of the screen stays in the middle.
+        :return: True if the size of the cells changed
+        """
+        cell_size = max(1, min(self.max_cell_size, int(self.cell_size * factor)))
+        if cell_size == self.cell_size:
+            return False
+        center_x = self.left + self.columns / 2
+        center_y = self.top + self.rows / 2
+        self.cell_size = cell_size
+        self.left = int(center_x - self.columns / 2)
+        self.top = int(center_y - self.rows / 2)
+        self.clamp()
+        return True
+
+    def clamp(self):
+        """Moves the window back onto the map."""
+        self.left = max(0, min(self.left, self.map_width - self.columns))
+        self.top = max(0, min(self.top, self.map_height - self.rows))
+
+    def screen_pos(self, pos_x, pos_y):
+        """
+        :return: The position of the top left corner of the cell (x, y) on the screen in pixels
+        """
+        return (pos_x - self.left) * self.cell_size, (pos_y - self.top) * self.cell_size
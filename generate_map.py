@@ -0,0 +1,42 @@
+"""
+Command line generator of maps for scaling benchmarks.
+
+Writes a seeded map in the text format of the maps folder, the same
+arguments always give the same map.
+Example:
+    $ python3 generate_map.py --width 500 --height 500 --style rooms --robots 20 --mazes 500 --output big.txt
+"""
+import argparse
+import time
+
+from gamePackage.map_generator import COLLECTING_POINT_PLACEMENTS, MAP_STYLES, generate_map, save_map
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a map for benchmarks.')
+    parser.add_argument('--width', type=int, default=100, help='number of cells in a row')
+    parser.add_argument('--height', type=int, default=100, help='number of rows')
+    parser.add_argument('--style', choices=list(MAP_STYLES), default='warehouse', help='layout of the walls')
+    parser.add_argument('--robots', type=int, default=10, help='amount of robots')
+    parser.add_argument('--mazes', type=int, default=50, help='amount of mazes')
+    parser.add_argument('--wall-density', type=float, default=0.0,
+                        help='probability of a single wall on every cell of an open area')
+    parser.add_argument('--collecting-point', choices=COLLECTING_POINT_PLACEMENTS, default='corner',
+                        help='place of the collecting point')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random generator')
+    parser.add_argument('--output', required=True, help='path of the written map')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.perf_counter()
+    symbols = generate_map(args.width, args.height, args.style, args.robots, args.mazes,
+                           args.wall_density, args.collecting_point, args.seed)
+    save_map(symbols, args.output)
+    print(f'{args.output}: {args.width}x{args.height} {args.style} map generated in '
+          f'{time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
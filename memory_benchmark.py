@@ -0,0 +1,92 @@
+"""
+Memory benchmark of the game objects.
+
+Generates a large warehouse map with many mazes, loads it into a
+headless game and reports the memory taken by loading it, together with
+the memory of many instances of the small value types of the game,
+measured with tracemalloc.
+Example:
+    $ python3 memory_benchmark.py --width 400 --height 300 --mazes 20000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import settings
+from gamePackage.algorithm import Cell
+from gamePackage.collecting_point import CollectingPoint
+from gamePackage.fleet import Fleet
+from gamePackage.info_game import InfoGame
+from gamePackage.map_generator import generate_map, save_map
+from gamePackage.mazes import Mazes
+from gamePackage.robot import Robot
+
+
+def measure(create):
+    """
+    :return: The bytes still allocated after create() and the peak during it, the result of create is kept alive
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = create()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current - before, peak - before
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Measure the memory of the game objects.')
+    parser.add_argument('--width', type=int, default=400, help='width of the generated map')
+    parser.add_argument('--height', type=int, default=300, help='height of the generated map')
+    parser.add_argument('--mazes', type=int, default=20000, help='amount of mazes on the generated map')
+    parser.add_argument('--robots', type=int, default=1000, help='amount of robots on the generated map')
+    parser.add_argument('--objects', type=int, default=100000,
+                        help='amount of instances created of every value type')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated map')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # the generated map is removed afterwards, so it is compiled into memory instead of the cache
+    settings.CACHE_COMPILED_MAPS = False
+    symbols = generate_map(args.width, args.height, 'warehouse', args.robots, args.mazes, seed=args.seed)
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        save_map(symbols, path)
+
+        def load_game():
+            game = InfoGame(path)
+            game.load()
+            return game
+
+        results = {'map': f'{args.width}x{args.height}', 'mazes': args.mazes, 'robots': args.robots}
+        results['load_bytes'], results['load_peak_bytes'] = measure(load_game)
+    finally:
+        os.remove(path)
+
+    amount = args.objects
+    fleet = Fleet(capacity=amount)
+    value_types = {
+        'Robot': lambda: [Robot(i, i, fleet) for i in range(amount)],
+        'Mazes': lambda: [Mazes(i, i) for i in range(amount)],
+        'Cell': lambda: [Cell(i, i) for i in range(amount)],
+        'CollectingPoint': lambda: [CollectingPoint(i, i) for i in range(amount)],
+    }
+    for name, create in value_types.items():
+        fleet.size = 0
+        # the list holding the instances is counted as well, it is the same for every type
+        results[f'{name}_bytes_per_object'] = round(measure(create)[0] / amount, 1)
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
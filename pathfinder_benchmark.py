@@ -0,0 +1,97 @@
+"""
+Benchmark of the pathfinders.
+
+Searches paths between the same random pairs of free cells of every chosen
+map with every pathfinder and reports the nodes
+expanded, the time taken and whether the paths are as long as the ones
+found by a_star, as JSON or CSV. hpa paths may be longer, length_ratio is their total length
+over the total length of the a_star paths and max_length_ratio the largest ratio of a single pair.
+Example:
+    $ python3 pathfinder_benchmark.py --maps Athens --pairs 500 --format csv
+"""
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+
+from benchmark import map_paths
+from gamePackage.algorithm import search_stats
+from gamePackage.compiled_map import load_map
+from gamePackage.hpa_star import abstract_graph
+from gamePackage.pathfinders import PATHFINDERS
+
+RESULT_FIELDS = ['map', 'pathfinder', 'pairs', 'found', 'nodes_expanded', 'seconds', 'same_length',
+                 'length_ratio', 'max_length_ratio']
+
+
+def random_pairs(grid, amount, seed=0):
+    """
+    :return: A list of amount pairs of random free cells ((x, y), (x, y)) of the grid
+    """
+    free = [grid.cell(index)[::-1] for index in range(grid.size) if not grid.walls[index]]
+    rng = random.Random(seed)
+    return [(rng.choice(free), rng.choice(free)) for _ in range(amount)]
+
+
+def run_pathfinders(path, pathfinders, amount_pairs, seed=0):
+    """
+    Searches the same pairs with every pathfinder.
+    :return: A list of result dictionaries with the keys of RESULT_FIELDS, one per pathfinder
+    """
+    grid = load_map(path).grid()
+    pairs = random_pairs(grid, amount_pairs, seed)
+    reference = [PATHFINDERS['a_star'](goal, start, grid) for start, goal in pairs]
+    # the first search of a game builds the abstract graph, here it is built before the timing
+    abstract_graph(grid)
+    results = []
+    for name in pathfinders:
+        search_stats.reset()
+        start_time = time.perf_counter()
+        lengths = [PATHFINDERS[name](goal, start, grid) for start, goal in pairs]
+        seconds = time.perf_counter() - start_time
+        results.append({
+            'map': path,
+            'pathfinder': name,
+            'pairs': amount_pairs,
+            'found': sum(length is not None for length in lengths),
+            'nodes_expanded': search_stats.nodes_expanded,
+            'seconds': round(seconds, 4),
+            'same_length': lengths == reference,
+            'length_ratio': round(sum(filter(None, lengths)) / max(sum(filter(None, reference)), 1), 4),
+            'max_length_ratio': round(max((length / best for length, best in zip(lengths, reference)
+                                           if length and best), default=1.0), 4),
+        })
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the pathfinders on the maps.')
+    parser.add_argument('--maps', nargs='*', default=[],
+                        help='names or paths of the maps, all maps by default')
+    parser.add_argument('--pathfinders', nargs='*', default=list(PATHFINDERS), choices=list(PATHFINDERS),
+                        help='pathfinders to compare, all by default')
+    parser.add_argument('--pairs', type=int, default=1000, help='amount of random pairs of cells per map')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random pairs')
+    parser.add_argument('--format', choices=['json', 'csv'], default='json', help='output format')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = []
+    for path in map_paths(args.maps):
+        results.extend(run_pathfinders(path, args.pathfinders, args.pairs, args.seed))
+
+    if args.format == 'csv':
+        writer = csv.DictWriter(sys.stdout, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -8,14 +8,27 @@ YELLOW = (255,255,0)
 # OBJECTS SIZES
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
-MAZE_WIDTH = 60
-MAZE_HEIGHT = 60
-CELL_WIDTH = SCREEN_WIDTH // MAZE_WIDTH
-CELL_HEIGHT = SCREEN_HEIGHT // MAZE_HEIGHT
+# the cells fit the whole map onto the screen, but are never larger than this
+MAX_CELL_SIZE = 64
+
+# RENDERING
+# 'cells' draws the changed cells one by one, 'array' rasterizes the whole map with NumPy
+RENDERER = 'cells'
 
 # FONTS
 F8_BIT_FONT_NAME = 'fonts/8-BIT WONDER.TTF'
 
+# PATHFINDING
+# number of paths kept by the path cache of a game
+PATH_CACHE_SIZE = 4096
+# width and height in cells of the clusters of the hierarchical pathfinder
+HPA_CLUSTER_SIZE = 16
+
+# COMPILED MAPS
+# maps are compiled into a binary format and cached in this directory next to them
+MAP_CACHE_DIR = '__mapcache__'
+# False compiles the maps into memory on every load instead
+CACHE_COMPILED_MAPS = True
 
 # FILE PATH
 MAPS_PATH = 'maps/'
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Command line sweep of the game modes over a process pool.
+
+Runs headless games for every combination of the chosen maps, modes, amounts of
+robots, seeds, assignment strategies and pathfinders in parallel, one game per
+process at a time. Every finished run is appended to the results file, running the
+same sweep again skips the runs already in it, so an interrupted sweep resumes.
+The results of all runs, or with --summary their means over the seeds, are
+reported in one table as JSON or CSV.
+Example:
+    $ python3 sweep.py --maps Race Athens --robots 1 2 4 --seeds 0 1 2 --workers 4 --format csv
+"""
+import argparse
+import sys
+
+from benchmark import add_run_arguments, map_paths, write_report
+from gamePackage.runner import RESULT_FIELDS
+from gamePackage.sweep import SUMMARY_FIELDS, completed_runs, run_key, run_sweep, summarize, sweep_runs
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Run the game modes on the maps in parallel.')
+    add_run_arguments(parser)
+    parser.add_argument('--workers', type=int, help='number of processes, the number of processors by default')
+    parser.add_argument('--results', default='sweep_results.jsonl',
+                        help='JSON Lines file the finished runs are appended to and resumed from')
+    parser.add_argument('--summary', action='store_true',
+                        help='report the means over the seeds instead of every run')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    runs = sweep_runs(map_paths(args.maps), args.modes, args.robots, args.seeds, args.assignments,
+                      args.pathfinders, args.max_steps)
+    results = completed_runs(args.results)
+    done = sum(run_key(run) in results for run in runs)
+    if done:
+        print(f"Resuming, {done} of {len(runs)} runs are in {args.results}", file=sys.stderr)
+    for run, result in run_sweep(runs, args.results, args.workers):
+        results[run_key(run)] = result
+        done += 1
+        print(f"[{done}/{len(runs)}] {run['map']} {run['mode']} robots: {result['robots']} "
+              f"seed: {run['seed']} steps: {result['steps']}", file=sys.stderr)
+
+    # one table in the order of the sweep, whatever order the runs finished in
+    table = [results[run_key(run)] for run in runs]
+    fields = RESULT_FIELDS
+    if args.summary:
+        table, fields = summarize(table), SUMMARY_FIELDS
+    if args.output:
+        with open(args.output, 'w', newline='') as file:
+            write_report(table, args.format, file, fields)
+    else:
+        write_report(table, args.format, sys.stdout, fields)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,11 @@
+import copy
+
 import pytest
 
 from gamePackage.algorithm import *
 from gamePackage.robot import *
 from gamePackage.mazes import *
+from gamePackage.explored_cells import ExploredCells
 
 
 def test_manhattan_distance():
@@ -85,6 +88,178 @@ def test_aStar():
     assert len(robot.path) == expected_path_length + 1  # Include the start cell in the path
 
 
+def test_distance_field():
+    maze = [
+        [' ', ' ', ' ', ' '],
+        [' ', 'X', ' ', ' '],
+        [' ', ' ', ' ', 'X'],
+        [' ', ' ', ' ', 'X']
+    ]
+    field = DistanceField(Mazes(0, 0), maze)
+
+    # Test case 1: Distances agree with a_star
+    for pos_y, pos_x in [(3, 2), (2, 2), (0, 3), (1, 0)]:
+        robot = Robot(pos_x, pos_y)
+        expected_path_length = a_star(Mazes(0, 0), Robot(pos_x, pos_y), maze)
+        assert field.distance((pos_y, pos_x)) == expected_path_length
+        assert field.path_from(robot) == expected_path_length
+        assert robot.path[0] == (pos_y, pos_x)
+        assert robot.path[-1] == (0, 0)
+
+    # Test case 2: Walls are unreachable
+    robot = Robot(3, 3)
+    assert field.distance((3, 3)) is None
+    assert field.path_from(robot) is None
+    assert robot.path == []
+
+    # Test case 3: The search stops once all targets are reached
+    field = DistanceField(Mazes(0, 0), maze, targets=[(1, 0), (0, 2)])
+    assert field.distance((0, 1)) == 1
+    assert field.distance((2, 0)) == 2
+    assert field.path((2, 0)) == [(2, 0), (1, 0), (0, 0)]
+    assert field.distance((3, 2)) is None
+
+    # Test case 4: On an open map ties are broken like a_star breaks them
+    open_maze = [[' '] * 6 for _ in range(5)]
+    open_maze[2][3] = 'X'
+    field = DistanceField(Mazes(4, 1), open_maze)
+    for pos_y in range(5):
+        for pos_x in range(6):
+            if open_maze[pos_y][pos_x] == ' ':
+                robot, a_star_robot = Robot(pos_x, pos_y), Robot(pos_x, pos_y)
+                a_star(Mazes(4, 1), a_star_robot, open_maze)
+                field.path_from(robot)
+                assert list(robot.path) == list(a_star_robot.path)
+
+
+def test_path_cache():
+    maze = [
+        [' ', ' ', ' ', ' '],
+        [' ', 'X', ' ', ' '],
+        [' ', ' ', ' ', 'X'],
+        [' ', ' ', ' ', ' ']
+    ]
+    cache = PathCache(maxsize=2)
+
+    # Test case 1: The first query is a miss, the same query is a hit
+    robot = Robot(0, 0)
+    search_stats.reset()
+    assert a_star(Mazes(3, 3), robot, maze, cache) == 6
+    path = list(robot.path)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert a_star(Mazes(3, 3), Robot(0, 0), maze, cache) == 6
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert search_stats.a_star_calls == 1
+
+    # Test case 2: A robot on the stored path reuses its tail and its head
+    assert cache.get(path[2], (3, 3)) == path[2:]
+    assert cache.get((0, 0), path[4]) == path[:5]
+    assert cache.hits == 3
+
+    # Test case 3: Returned paths are copies
+    robot.path.clear()
+    assert cache.get((0, 0), (3, 3)) == path
+
+    # Test case 4: The least recently used path is evicted
+    cache.put((3, 0), (3, 1), [(3, 0), (3, 1)])
+    cache.put((0, 3), (0, 2), [(0, 3), (0, 2)])
+    assert len(cache) == 2
+    assert cache.get((0, 0), (3, 3)) is None
+
+
+def test_aStar_on_grid():
+    maze = [
+        [' ', ' ', ' ', ' '],
+        [' ', 'X', ' ', ' '],
+        [' ', ' ', ' ', 'X'],
+        [' ', ' ', ' ', ' ']
+    ]
+    grid = Grid.from_rows(maze)
+
+    # Test case 1: The grid gives the same paths as the rows of the maze
+    for target in [(3, 3), (2, 1), (0, 3)]:
+        robot_rows, robot_grid = Robot(0, 0), Robot(0, 0)
+        assert a_star(Mazes(*target), robot_rows, maze) == a_star(Mazes(*target), robot_grid, grid)
+        assert robot_rows.path == robot_grid.path
+
+    # Test case 2: The maze is not modified
+    assert maze[0] == [' ', ' ', ' ', ' ']
+
+    # Test case 3: Walls are unreachable
+    robot = Robot(0, 0)
+    assert a_star(Mazes(1, 1), robot, grid) is None
+    assert robot.path == []
+
+
+def test_aStar_on_coordinates():
+    maze = [
+        [' ', ' ', ' ', ' '],
+        [' ', 'X', ' ', ' '],
+        [' ', ' ', ' ', 'X'],
+        [' ', ' ', ' ', ' ']
+    ]
+    grid = Grid.from_rows(maze)
+    robot = Robot(0, 0)
+    expected_length = a_star(Mazes(3, 3), robot, grid)
+
+    # Test case 1: Plain (x, y) positions work without wrapper objects
+    assert a_star((3, 3), (0, 0), grid) == expected_length
+    assert a_star(Cell(3, 3), Cell(0, 0), grid) == expected_length
+    assert find_path((0, 0), (3, 3), grid) == robot.path
+
+    # Test case 2: Unreachable positions
+    assert a_star((1, 1), (0, 0), grid) is None
+    assert find_path((0, 0), (1, 1), grid) is None
+
+
+def test_prior_searching():
+    maze = [
+        [' ', ' ', ' ', ' '],
+        [' ', 'X', 'X', ' '],
+        [' ', ' ', ' ', 'X'],
+        ['X', 'X', ' ', 'X']
+    ]
+    grid = Grid.from_rows(maze)
+    explored = ExploredCells(grid)
+    for cell in [(0, 0), (0, 1), (1, 0)]:
+        explored.add(cell)
+
+    # Test case 1: The robot goes to the nearest unexplored cell
+    robot = Robot(0, 0)
+    assert prior_searching(robot, explored, grid) == (0, 2)
+    assert robot.path == [(0, 0), (0, 1), (0, 2)]
+
+    # Test case 2: A list of explored cells works as well
+    robot = Robot(0, 1)
+    assert prior_searching(robot, [(1, 0), (0, 0)], maze) == (2, 0)
+    assert robot.path == [(1, 0), (2, 0)]
+
+    # Test case 3: A robot on an unexplored cell explores it first
+    robot = Robot(2, 2)
+    assert prior_searching(robot, explored, grid) == (2, 2)
+    assert robot.path == [(2, 2)]
+
+    # Test case 4: Nothing is left to explore
+    for cell in [(0, 2), (0, 3), (1, 3), (2, 0), (2, 1), (2, 2), (3, 2)]:
+        explored.add(cell)
+    assert explored.unexplored == 0
+    assert prior_searching(robot, explored, grid) is None
+    assert robot.path == []
+
+
+def test_set_diff():
+    maze = [
+        [' ', 'X', ' '],
+        [' ', ' ', 'X']
+    ]
+    grid = Grid.from_rows(maze)
+    explored = ExploredCells(grid)
+    explored.add((0, 0))
+
+    assert set_diff(explored, grid) == [(0, 2), (1, 0), (1, 1)]
+    assert set_diff([(0, 0), (1, 1)], maze) == [(0, 2), (1, 0)]
+
+
 test_is_valid()
 test_manhattan_distance()
 test_getNeighbors()
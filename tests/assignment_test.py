@@ -0,0 +1,57 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from gamePackage.assignment import *
+
+
+def test_greedy_assignment():
+    costs = np.array([[4, 1, 2],
+                      [1, 5, 9]])
+
+    # Test case 1: Mazes go in order to the closest free robot
+    assert greedy_assignment(costs) == [(1, 0), (0, 1)]
+
+    # Test case 2: Unreachable mazes are skipped
+    costs = np.array([[np.inf, 3],
+                      [np.inf, 2]])
+    assert greedy_assignment(costs) == [(1, 1)]
+
+
+def test_hungarian_assignment():
+    costs = np.array([[4, 1, 2],
+                      [1, 5, 9]])
+
+    # Test case 1: Greedy is not optimal here
+    assert hungarian_assignment(costs) == [(0, 1), (1, 0)]
+    costs = np.array([[1, 2],
+                      [2, 10]])
+    assert greedy_assignment(costs) == [(0, 0), (1, 1)]
+    assert hungarian_assignment(costs) == [(0, 1), (1, 0)]
+
+    # Test case 2: More robots than mazes and unreachable mazes
+    costs = np.array([[np.inf, 3],
+                      [np.inf, 2],
+                      [7, np.inf]])
+    assert hungarian_assignment(costs) == [(1, 1), (2, 0)]
+    assert hungarian_assignment(np.full((2, 2), np.inf)) == []
+    assert hungarian_assignment(np.zeros((0, 3))) == []
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_hungarian_assignment_is_optimal(seed):
+    rng = np.random.default_rng(seed)
+    costs = rng.integers(0, 20, size=(rng.integers(1, 6), rng.integers(1, 6))).astype(float)
+    pairs = hungarian_assignment(costs)
+
+    robots, mazes = costs.shape
+    best = min(sum(costs[i, j] for i, j in zip(rows, columns))
+               for rows in itertools.permutations(range(robots), min(robots, mazes))
+               for columns in itertools.permutations(range(mazes), min(robots, mazes)))
+    assert len(pairs) == min(robots, mazes)
+    assert sum(costs[i, j] for i, j in pairs) == best
+
+
+def test_strategies():
+    assert set(ASSIGNMENT_STRATEGIES) == {'greedy', 'optimal'}
@@ -0,0 +1,100 @@
+"""
+Benchmarks of the searches of the algorithm module and of single steps of the game modes,
+on the bundled maps and on large generated ones. Run with pytest-benchmark, see the README.
+"""
+import random
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from gamePackage.algorithm import *
+from gamePackage.compiled_map import load_map
+from gamePackage.explored_cells import ExploredCells
+from gamePackage.robot import Robot
+from gamePackage.runner import GAME_MODES
+from pathfinder_benchmark import random_pairs
+
+# Searches per round of the path benchmarks
+PAIRS = 20
+# Cells per round of the neighbour benchmark
+CELLS = 10000
+# Steps made before the measured one, so the robots are busy like in the middle of a game
+WARMUP_STEPS = 20
+
+
+def free_indices(grid):
+    return [index for index in range(grid.size) if not grid.walls[index]]
+
+
+def half_explored(grid):
+    """
+    :return: ExploredCells with the upper half of the free cells explored
+    """
+    info = ExploredCells(grid)
+    indices = free_indices(grid)
+    info.add_indices(indices[:len(indices) // 2])
+    return info
+
+
+def test_a_star(benchmark, map_path):
+    grid = load_map(map_path).grid()
+    pairs = random_pairs(grid, PAIRS)
+
+    lengths = benchmark(lambda: [a_star(goal, start, grid) for start, goal in pairs])
+
+    assert any(length is not None for length in lengths)
+
+
+def test_get_neighbors(benchmark, map_path):
+    grid = load_map(map_path).grid()
+    indices = free_indices(grid)
+    cells = [grid.cell(index) for index in random.Random(0).sample(indices, min(CELLS, len(indices)))]
+
+    neighbors = benchmark(lambda: [get_neighbors(cell, grid) for cell in cells])
+
+    assert len(neighbors) == len(cells)
+
+
+def test_set_diff(benchmark, map_path):
+    grid = load_map(map_path).grid()
+    info = half_explored(grid)
+
+    unvisited = benchmark(set_diff, info, grid)
+
+    assert len(unvisited) == info.unexplored
+
+
+def test_find_nearest_cell(benchmark, map_path):
+    compiled_map = load_map(map_path)
+    grid = compiled_map.grid()
+    unvisited = set_diff(half_explored(grid), grid)
+    robots = [Robot(pos_x, pos_y) for pos_x, pos_y in compiled_map.robots.tolist()]
+
+    cells = benchmark(lambda: [find_nearest_cell(robot, unvisited) for robot in robots])
+
+    assert None not in cells
+
+
+def test_prior_searching(benchmark, map_path):
+    compiled_map = load_map(map_path)
+    grid = compiled_map.grid()
+    info = half_explored(grid)
+    robots = [Robot(pos_x, pos_y) for pos_x, pos_y in compiled_map.robots.tolist()]
+
+    cells = benchmark(lambda: [prior_searching(robot, info, grid) for robot in robots])
+
+    assert any(cell is not None for cell in cells)
+
+
+@pytest.mark.parametrize('mode', list(GAME_MODES))
+def test_step(benchmark, map_path, mode):
+    def setup():
+        random.seed(0)
+        game = GAME_MODES[mode](map_path)
+        game.load()
+        for _ in range(WARMUP_STEPS):
+            game.step()
+        return (game,), {}
+
+    benchmark.pedantic(lambda game: game.step(), setup=setup, rounds=10)
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from gamePackage.map_generator import generate_map, save_map
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'maps')
+
+BUNDLED_MAPS = ['Anapa', 'Athens', 'Ephesus', 'Race', 'soch']
+
+# Large maps generated for the suite, name -> arguments of generate_map
+GENERATED_MAPS = {
+    'maze-301': dict(width=301, height=301, style='maze', robots=20, mazes=200),
+    'rooms-300': dict(width=300, height=300, style='rooms', robots=20, mazes=200, wall_density=0.02),
+    'warehouse-400': dict(width=400, height=400, style='warehouse', robots=20, mazes=200),
+}
+
+MAP_NAMES = BUNDLED_MAPS + list(GENERATED_MAPS)
+
+# Slowdown of a benchmark against the compared baseline that fails the run,
+# used with --benchmark-compare when no --benchmark-compare-fail is given
+REGRESSION_THRESHOLD = 'min:10%'
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # runs before pytest-benchmark reads its options
+    if config.pluginmanager.hasplugin('benchmark') and config.getoption('benchmark_compare', None) \
+            and not config.getoption('benchmark_compare_fail', None):
+        from pytest_benchmark.utils import parse_compare_fail
+        config.option.benchmark_compare_fail = [parse_compare_fail(REGRESSION_THRESHOLD)]
+
+
+@pytest.fixture(scope='session')
+def generated_maps_dir(tmp_path_factory):
+    """The directory the large maps are generated into, once per run of the suite."""
+    directory = tmp_path_factory.mktemp('maps')
+    for name, arguments in GENERATED_MAPS.items():
+        save_map(generate_map(**arguments, seed=0), directory / f'{name}.txt')
+    return directory
+
+
+@pytest.fixture(scope='session', params=MAP_NAMES)
+def map_path(request, generated_maps_dir):
+    """Path of every bundled and generated map, the tests using it run once per map."""
+    name = request.param
+    if name in GENERATED_MAPS:
+        return str(generated_maps_dir / f'{name}.txt')
+    return os.path.join(MAPS_DIR, f'{name}.txt')
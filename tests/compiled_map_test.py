@@ -0,0 +1,131 @@
+import os
+import shutil
+import stat
+
+import pytest
+
+import settings
+from gamePackage.algorithm import DistanceField
+from gamePackage.compiled_map import *
+from gamePackage.info_game import InfoGame
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', 'maps')
+
+
+@pytest.fixture
+def map_copy(tmp_path):
+    # compiled maps are cached next to the source, so the tests compile copies of the bundled maps
+    def copy(name):
+        path = str(tmp_path / name)
+        shutil.copy(os.path.join(MAPS_DIR, name), path)
+        return path
+    return copy
+
+
+@pytest.mark.parametrize('map_name', ['Anapa.txt', 'Athens.txt', 'Ephesus.txt', 'Race.txt', 'soch.txt'])
+def test_compiled_map_matches_text(map_copy, map_name):
+    path = map_copy(map_name)
+    with open(path) as file:
+        rows = [line.strip() for line in file if line.strip()]
+    compiled_map = load_map(path)
+
+    # Test case 1: Walls, objects in the order of the text and the collecting point
+    grid = Grid.from_rows(rows)
+    assert (compiled_map.width, compiled_map.height) == (grid.width, grid.height)
+    assert bytes(compiled_map.walls) == grid.walls
+    symbols = {(x, y): char for y, row in enumerate(rows) for x, char in enumerate(row)}
+    assert [tuple(pos) for pos in compiled_map.robots.tolist()] == \
+        [pos for pos in sorted(symbols, key=lambda pos: (pos[1], pos[0])) if symbols[pos] == 'R']
+    assert sorted(map(tuple, compiled_map.mazes.tolist())) == sorted(pos for pos in symbols if symbols[pos] == 'M')
+    assert symbols[compiled_map.collecting_point] == '0'
+
+    # Test case 2: The precompiled delivery field is the one searched on the text
+    field = DistanceField(compiled_map.collecting_point, grid)
+    compiled_field = compiled_map.delivery_field(compiled_map.grid())
+    assert list(compiled_field.distances) == list(field.distances)
+    assert list(compiled_field.next_hops) == list(field.next_hops)
+
+
+def test_compiled_maps_are_cached_by_content(map_copy):
+    path = map_copy('Race.txt')
+    cache_dir = os.path.join(os.path.dirname(path), settings.MAP_CACHE_DIR)
+
+    # Test case 1: The first load compiles the map, later loads map the same file
+    first = load_map(path)
+    assert os.listdir(cache_dir) == [os.path.basename(cached_path(path, source_digest(path)))]
+    assert isinstance(first.buffer, mmap.mmap)
+    modified = os.path.getmtime(cached_path(path, source_digest(path)))
+    second = load_map(path)
+    assert os.path.getmtime(cached_path(path, source_digest(path))) == modified
+    assert second.digest == first.digest
+
+    # Test case 2: Editing the map compiles it again and removes the old version
+    with open(path) as file:
+        content = file.read().rstrip('\n')
+    with open(path, 'w') as file:
+        file.write(content + '\n' + 'X' * first.width + '\n')
+    third = load_map(path)
+    assert third.height == first.height + 1
+    assert os.listdir(cache_dir) == [os.path.basename(cached_path(path, source_digest(path)))]
+
+    # Test case 3: Damaged cache files are compiled again
+    target = cached_path(path, source_digest(path))
+    with open(target, 'rb') as file:
+        content = file.read()
+    for damaged in (b'', content[:HEADER.size // 2], content[:HEADER.size], content[:-4]):
+        with open(target, 'wb') as file:
+            file.write(damaged)
+        assert load_map(path).height == third.height
+        assert os.path.getsize(target) == len(content)
+
+    # Test case 4: Without the cache the map is compiled into memory
+    assert isinstance(load_map(path, cache=False).buffer, bytes)
+
+
+def test_compiled_map_cache_is_shared(map_copy, monkeypatch):
+    path = map_copy('Race.txt')
+    umask = os.umask(0o022)
+    try:
+        load_map(path)
+    finally:
+        os.umask(umask)
+
+    # Test case 1: Other users can read the cached file
+    assert stat.S_IMODE(os.stat(cached_path(path, source_digest(path))).st_mode) == 0o644
+
+    # Test case 2: A cached file that cannot be read is compiled into memory
+    def unreadable(file, *args, **kwargs):
+        if str(file).endswith(EXTENSION):
+            raise PermissionError('Permission denied')
+        return open(file, *args, **kwargs)
+    monkeypatch.setattr('gamePackage.compiled_map.open', unreadable, raising=False)
+    compiled_map = load_map(path)
+    assert isinstance(compiled_map.buffer, bytes)
+    assert compiled_map.digest == source_digest(path)
+
+
+def test_compiled_map_without_distance_field(map_copy):
+    compiled_map = CompiledMap(compile_map(map_copy('Ephesus.txt'), distance_field=False))
+
+    assert compiled_map.distances is None
+    assert compiled_map.delivery_field(compiled_map.grid()) is None
+    with pytest.raises(ValueError):
+        CompiledMap(b'TEXT' + bytes(HEADER.size))
+
+
+def test_game_loads_compiled_map(map_copy):
+    path = map_copy('Race.txt')
+    with open(path) as file:
+        rows = [line.strip() for line in file]
+    game = InfoGame(path, amount_robots=1)
+    game.load()
+
+    # the robots left out are not on the map, everything else is as in the text
+    assert len(game.robots) == 1
+    assert sum(row.count('R') for row in rows) > 1
+    expected = [list(row.replace('R', ' ')) for row in rows]
+    expected[game.robots[0].y][game.robots[0].x] = 'R'
+    assert game.maze_class.maze_map.dtype == np.dtype('S1')
+    assert game.maze_class.maze_map.tolist() == [[symbol.encode() for symbol in row] for row in expected]
+    assert isinstance(game.grid.walls, memoryview)
+    assert game.run(max_steps=1000) > 0
@@ -0,0 +1,77 @@
+from gamePackage.explored_cells import *
+from gamePackage.grid import Grid
+
+
+def test_explored_cells():
+    grid = Grid.from_rows(['  X', '   '])
+    explored = ExploredCells(grid)
+    assert explored.unexplored == 5
+
+    # Test case 1: Free cells are counted once
+    explored.add((0, 0))
+    explored.append((0, 0))
+    explored.append((1, 2))
+    assert (0, 0) in explored
+    assert (0, 1) not in explored
+    assert len(explored) == 2
+    assert explored.unexplored == 3
+
+    # Test case 2: Walls and cells outside the grid are ignored
+    explored.add((0, 2))
+    explored.add((5, 5))
+    assert len(explored) == 2
+    assert sorted(explored) == [(0, 0), (1, 2)]
+
+
+def test_explored_cells_bitset():
+    grid = Grid.from_rows([' ' * 10] * 3)
+    explored = ExploredCells(grid)
+
+    # Test case 1: One bit per cell
+    assert explored.nbytes == 4
+
+    # Test case 2: Flat indices and cells address the same bits
+    explored.add_index(grid.index(9, 2))
+    explored.add((1, 3))
+    assert explored.contains_index(grid.index(3, 1))
+    assert (2, 9) in explored
+    assert (2, 10) not in explored
+    assert list(explored) == [(1, 3), (2, 9)]
+    assert explored.unexplored == 28
+
+
+def test_explored_cells_add_indices():
+    grid = Grid.from_rows([' ' * 10] * 3)
+    explored = ExploredCells(grid)
+    explored.add_index(3)
+
+    # Test case 1: Duplicates and explored cells are counted once
+    explored.add_indices([3, 3, 9, 17])
+    assert len(explored) == 3
+    assert explored.unexplored == 27
+    assert sorted(explored) == [(0, 3), (0, 9), (1, 7)]
+
+    # Test case 2: Nothing to add
+    explored.add_indices([])
+    assert len(explored) == 3
+
+
+def test_explored_cells_frontier():
+    grid = Grid.from_rows(['  X ', '    '])
+    explored = ExploredCells(grid)
+    assert explored.frontier == set()
+
+    # Test case 1: The unexplored free neighbours of explored cells form the frontier
+    explored.add((0, 0))
+    assert explored.frontier == {grid.index(1, 0), grid.index(0, 1)}
+
+    # Test case 2: Explored cells leave it, walls never enter it
+    explored.add((0, 1))
+    assert explored.frontier == {grid.index(0, 1), grid.index(1, 1)}
+
+    # Test case 3: Flat indices added at once update it as well
+    explored.add_indices([grid.index(0, 1), grid.index(1, 1), grid.index(2, 1), grid.index(3, 1)])
+    assert explored.frontier == {grid.index(3, 0)}
+    explored.add_index(grid.index(3, 0))
+    assert explored.frontier == set()
+    assert explored.unexplored == 0
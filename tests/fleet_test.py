@@ -0,0 +1,54 @@
+import numpy as np
+
+from gamePackage.fleet import *
+from gamePackage.robot import *
+
+
+def test_fleet_columns():
+    fleet = Fleet(capacity=1)
+    robots = [Robot(x, 0, fleet) for x in range(3)]
+
+    # Test case 1: The columns grow with the robots
+    assert fleet.size == 3
+    assert list(fleet.x) == [0, 1, 2]
+    assert list(fleet.target) == [-1, -1, -1]
+
+    # Test case 2: Robots are views of the rows
+    robots[1].state = RobotState.DELIVERING
+    robots[2].target = 'maze'
+    fleet.y[0] = 4
+    assert list(fleet.state) == [StateCode.WAITING, StateCode.DELIVERING, StateCode.WAITING]
+    assert fleet.get_target(2) == 'maze'
+    assert robots[0].pos() == (0, 4)
+
+
+def test_fleet_advance():
+    fleet = Fleet(capacity=2)
+    robots = [Robot(0, 0, fleet), Robot(5, 5, fleet), Robot(9, 9, fleet)]
+    robots[0].path = [(0, 1), (0, 2)]
+    robots[1].path = [(5, 6)]
+
+    # Test case 1: Only the selected robots with paths move
+    moved = fleet.advance(np.array([True, True, True]))
+    assert list(moved) == [True, True, False]
+    assert [robot.pos() for robot in robots] == [(1, 0), (6, 5), (9, 9)]
+    assert robots[0].path == [(0, 2)]
+    assert not robots[1].path
+
+    # Test case 2: Masked robots stay
+    fleet.advance(np.array([False, True, True]))
+    assert robots[0].pos() == (1, 0)
+
+
+def test_fleet_compact():
+    fleet = Fleet(capacity=1)
+    robots = [Robot(0, 0, fleet), Robot(0, 0, fleet)]
+    robots[0].path = [(0, x) for x in range(10)]
+    for _ in range(100):
+        robots[1].path = [(1, x) for x in range(10)]
+        robots[1].path.advance()
+
+    # the arena is compacted instead of growing with every new path
+    assert len(fleet.path_y) < 100
+    assert robots[0].path == [(0, x) for x in range(10)]
+    assert robots[1].path == [(1, x) for x in range(1, 10)]
@@ -0,0 +1,140 @@
+import os
+
+import numpy as np
+import pytest
+
+from gamePackage.info_game import *
+from gamePackage.coop_game import *
+from gamePackage.mute_game import *
+from gamePackage.algorithm import a_star
+from gamePackage.map_generator import generate_map, save_map
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', 'maps')
+
+
+@pytest.mark.parametrize('game_class', [InfoGame, CoopGame, MuteGame])
+def test_headless_game_delivers_all_mazes(game_class):
+    game = game_class(os.path.join(MAPS_DIR, 'Race.txt'))
+    game.load()
+
+    assert game.renderer is None
+    steps = game.run(max_steps=1000)
+
+    assert len(game.mazes) == 0
+    assert 0 < steps < 1000
+
+
+def test_headless_game_uses_given_renderer():
+    class RecordingRenderer:
+        def __init__(self):
+            self.frames = []
+
+        def draw(self, maze_map):
+            self.frames.append([row.tobytes().decode() for row in maze_map])
+
+    renderer = RecordingRenderer()
+    game = InfoGame(os.path.join(MAPS_DIR, 'Race.txt'), renderer=renderer)
+    game.load()
+    game.step()
+    game.step()
+
+    assert len(renderer.frames) == 2
+    assert 'R' in ''.join(renderer.frames[-1])
+
+
+def test_info_game_assigns_each_maze_to_one_robot():
+    game = InfoGame(os.path.join(MAPS_DIR, 'Anapa.txt'))
+    game.load()
+    game.step()
+
+    busy_robots = [robot for robot in game.robots if robot.target is not None]
+    assert len(busy_robots) == len(game.robots)
+    assert len({robot.target for robot in busy_robots}) == len(busy_robots)
+    for robot in busy_robots:
+        assert robot.state == RobotState.COLLECTING
+        assert robot.path[-1] == (robot.target.y, robot.target.x)
+
+
+@pytest.mark.parametrize('assignment', ['greedy', 'optimal'])
+def test_info_game_assignment_strategies(assignment):
+    game = InfoGame(os.path.join(MAPS_DIR, 'Anapa.txt'), assignment=assignment)
+    game.load()
+
+    game.run(max_steps=1000)
+    assert len(game.mazes) == 0
+
+
+def test_info_game_rejects_unknown_assignment():
+    with pytest.raises(ValueError):
+        InfoGame(os.path.join(MAPS_DIR, 'Anapa.txt'), assignment='random')
+
+
+def test_game_objects_are_compact():
+    game = InfoGame(os.path.join(MAPS_DIR, 'Race.txt'))
+    game.load()
+
+    # Robots and mazes keep their attributes in slots, the collecting point is a tuple
+    assert not hasattr(game.robots[0], '__dict__')
+    assert not hasattr(next(iter(game.mazes)), '__dict__')
+    assert game.collecting_point == game.collecting_point.pos()
+
+
+def full_update(game, maze_map):
+    """The map as it is after rewriting every robot, maze and the collecting point."""
+    maze_map = np.where(maze_map == b'R', b' ', maze_map)
+    for robot in game.robots:
+        maze_map[robot.y, robot.x] = b'R'
+    for maze in game.mazes:
+        maze_map[maze.y, maze.x] = b' ' if maze.collected else b'M'
+    maze_map[game.collecting_point.y, game.collecting_point.x] = b'0'
+    return maze_map
+
+
+@pytest.mark.parametrize('game_class', [InfoGame, CoopGame, MuteGame])
+@pytest.mark.parametrize('map_name', ['Race.txt', 'Ephesus.txt'])
+def test_update_changes_only_changed_cells(game_class, map_name):
+    game = game_class(os.path.join(MAPS_DIR, map_name))
+    game.load()
+
+    while game.mazes and game.steps < 1000:
+        previous_map = game.maze_class.maze_map.copy()
+        game.step()
+        # the incremental update gives the same map as rewriting everything
+        assert np.array_equal(game.maze_class.maze_map, full_update(game, previous_map))
+        changed = [(x, y, game.maze_class.maze_map[y, x].decode())
+                   for y, x in zip(*np.nonzero(game.maze_class.maze_map != previous_map))]
+        assert sorted(game.changes) == sorted(changed)
+
+
+@pytest.mark.parametrize('seed', [0, 7, 13])
+def test_coop_game_collects_assigned_mazes(tmp_path, seed):
+    # on these maps robots used to collect other mazes on the way to their assigned ones,
+    # which stayed assigned to nobody and were never collected
+    path = tmp_path / 'warehouse.txt'
+    save_map(generate_map(30, 30, 'warehouse', 10, 60, seed=seed), path)
+    game = CoopGame(str(path))
+    game.load()
+
+    game.run(max_steps=3000)
+
+    assert game.mazes.counts() == {'uncollected': 0, 'assigned': 0, 'collected': 0, 'delivered': 60}
+
+
+def test_closest_maze_sets_path_to_it():
+    game = CoopGame(os.path.join(MAPS_DIR, 'Ephesus.txt'))
+    game.load()
+    robot = game.robots[0]
+    mazes = list(game.mazes)
+
+    closest = game.closest_maze(robot, mazes)
+
+    # Test case 1: The path leads to the closest maze, not to the last one searched
+    assert robot.path[-1] == (closest.y, closest.x)
+    assert len(robot.path) - 1 == min(a_star(maze, robot.pos(), game.grid) for maze in mazes)
+
+    # Test case 2: The path to the closest maze is taken from the path cache of the game
+    assert game.path_cache.hits + game.path_cache.misses == len(mazes) + 1
+    assert game.path_cache.hits >= 1
+
+    # Test case 3: No maze to choose from
+    assert game.closest_maze(robot, []) is None
@@ -0,0 +1,42 @@
+import pytest
+
+from gamePackage.grid import *
+
+
+def test_from_rows():
+    grid = Grid.from_rows(['X X', ' 0', 'R M'])
+
+    # Test case 1: Shorter rows are padded with walls
+    assert (grid.width, grid.height, grid.size) == (3, 3, 9)
+    assert grid.walls == bytes([1, 0, 1,
+                                0, 0, 1,
+                                0, 0, 0])
+
+    # Test case 2: Only walls are blocked
+    assert grid.is_open(1, 1) is True
+    assert grid.is_open(0, 2) is True
+    assert grid.is_open(2, 1) is False
+    assert grid.is_open(3, 0) is False
+    assert grid.is_open(0, -1) is False
+
+    # Test case 3: Free cells are counted once
+    assert grid.free_count == 6
+    assert grid.__dict__['free_count'] == 6
+
+
+def test_index_and_neighbors():
+    grid = Grid.from_rows(['   ', ' X ', '   '])
+
+    assert grid.index(2, 1) == 5
+    assert grid.cell(5) == (1, 2)
+    assert grid.neighbors(grid.index(1, 0)) == [2, 0]
+    assert grid.neighbors(grid.index(0, 1)) == [0, 6]
+    assert grid.neighbors(grid.index(2, 2)) == [5, 7]
+
+
+def test_walls_are_immutable():
+    grid = Grid.from_rows(['  '])
+    with pytest.raises(TypeError):
+        grid.walls[0] = 1
+    with pytest.raises(ValueError):
+        Grid(bytes(3), 2, 2)
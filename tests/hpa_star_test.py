@@ -0,0 +1,80 @@
+import os
+import random
+
+import pytest
+
+from gamePackage.algorithm import *
+from gamePackage.hpa_star import *
+from gamePackage.hpa_star import _ABSTRACT_GRAPHS
+from gamePackage.compiled_map import load_map
+from gamePackage.info_game import *
+from gamePackage.coop_game import *
+from gamePackage.mute_game import *
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', 'maps')
+
+
+def load_grid(name):
+    return load_map(os.path.join(MAPS_DIR, name)).grid()
+
+
+def test_abstract_graph_links_entrances():
+    # two clusters of 3x3 cells, the wall between them is open in the middle row only
+    grid = Grid.from_rows(['   X  ', '      ', '   X  '])
+    graph = AbstractGraph(grid, cluster_size=3)
+
+    # Test case 1: One transition across the border, a step between (2, 1) and (3, 1)
+    assert graph.nodes == {0: [grid.index(2, 1)], 1: [grid.index(3, 1)]}
+    assert graph.edges[grid.index(2, 1)] == {grid.index(3, 1): 1}
+
+    # Test case 2: The path from corner to corner goes through the transition
+    path = graph.find_path(grid.index(0, 0), grid.index(5, 2))
+    assert len(path) - 1 == 7
+    assert grid.index(2, 1) in path and grid.index(3, 1) in path
+
+    # Test case 3: Cells of the same cluster and cells that cannot be reached
+    path = graph.find_path(grid.index(0, 0), grid.index(2, 2))
+    assert len(path) == 5 and path[0] == grid.index(0, 0) and path[-1] == grid.index(2, 2)
+    closed = Grid.from_rows(['  X  ', '  X  '])
+    assert AbstractGraph(closed, cluster_size=2).find_path(closed.index(0, 0), closed.index(4, 1)) is None
+
+
+@pytest.mark.parametrize('map_name', ['Anapa.txt', 'Athens.txt', 'Ephesus.txt', 'Race.txt', 'soch.txt'])
+def test_hpa_star_finds_valid_paths(map_name):
+    grid = load_grid(map_name)
+    free = [(index % grid.width, index // grid.width) for index in range(grid.size) if not grid.walls[index]]
+    rng = random.Random(0)
+    total, shortest = 0, 0
+    for _ in range(100):
+        start, goal = rng.choice(free), rng.choice(free)
+        path = find_hpa_path(start, goal, grid)
+        assert path[0] == (start[1], start[0]) and path[-1] == (goal[1], goal[0])
+        for (pos_y, pos_x), (next_y, next_x) in zip(path, path[1:]):
+            assert abs(next_y - pos_y) + abs(next_x - pos_x) == 1
+            assert grid.is_open(next_x, next_y)
+        total += len(path) - 1
+        shortest += a_star(goal, start, grid)
+
+    # the paths are not always the shortest, but close to them
+    assert shortest <= total <= shortest * 1.05
+
+
+def test_abstract_graph_is_built_once_per_grid():
+    grid = load_grid('Athens.txt')
+    graph = abstract_graph(grid)
+
+    assert abstract_graph(grid) is graph
+    robot = Robot(1, 1)
+    assert hpa_star((grid.width - 2, grid.height - 2), robot, grid) == len(robot.path) - 1
+    assert abstract_graph(grid) is graph
+
+
+@pytest.mark.parametrize('game_class', [CoopGame, MuteGame])
+def test_games_run_with_hpa_star(game_class):
+    game = game_class(os.path.join(MAPS_DIR, 'Race.txt'), pathfinder='hpa')
+    game.load()
+
+    # the abstract graph is only built by the first search
+    assert game.grid not in _ABSTRACT_GRAPHS
+    game.run(max_steps=1000)
+    assert len(game.mazes) == 0
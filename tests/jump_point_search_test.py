@@ -0,0 +1,110 @@
+import os
+import random
+
+import pytest
+
+from gamePackage.algorithm import *
+from gamePackage.jump_point_search import *
+from gamePackage.compiled_map import load_map
+from gamePackage.pathfinders import PATHFINDERS
+from gamePackage.info_game import *
+from gamePackage.coop_game import *
+from gamePackage.mute_game import *
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', 'maps')
+
+
+def load_grid(name):
+    return load_map(os.path.join(MAPS_DIR, name)).grid()
+
+
+def assert_valid_path(path, start, goal, grid):
+    assert path[0] == (start[1], start[0])
+    assert path[-1] == (goal[1], goal[0])
+    for (pos_y, pos_x), (next_y, next_x) in zip(path, path[1:]):
+        assert abs(next_y - pos_y) + abs(next_x - pos_x) == 1
+        assert grid.is_open(next_x, next_y)
+
+
+def test_jump_point_search_on_small_maze():
+    maze = [
+        [' ', ' ', ' ', ' '],
+        [' ', 'X', 'X', ' '],
+        [' ', ' ', 'X', ' '],
+        ['X', ' ', ' ', ' ']
+    ]
+    grid = Grid.from_rows(maze)
+
+    # Test case 1: The path goes around the walls and is as short as the one of a_star
+    path = find_jps_path((0, 2), (3, 2), grid)
+    assert len(path) - 1 == a_star((3, 2), (0, 2), grid) == 5
+    assert_valid_path(path, (0, 2), (3, 2), grid)
+
+    # Test case 2: Start and goal are the same cell
+    assert find_jps_path((1, 2), (1, 2), grid) == [(2, 1)]
+
+    # Test case 3: The goal is a wall or cannot be reached
+    assert find_jps_path((0, 0), (1, 1), grid) is None
+    assert find_jps_path((0, 0), (0, 3), Grid.from_rows([' X', 'X ', '  ', 'X '])) is None
+
+
+@pytest.mark.parametrize('map_name', ['Anapa.txt', 'Athens.txt', 'Ephesus.txt', 'Race.txt', 'soch.txt'])
+def test_jump_point_search_finds_shortest_paths(map_name):
+    grid = load_grid(map_name)
+    free = [(index % grid.width, index // grid.width) for index in range(grid.size) if not grid.walls[index]]
+    rng = random.Random(0)
+    for _ in range(100):
+        start, goal = rng.choice(free), rng.choice(free)
+        path = find_jps_path(start, goal, grid)
+        assert len(path) - 1 == a_star(goal, start, grid)
+        assert_valid_path(path, start, goal, grid)
+
+
+def test_jump_point_search_expands_fewer_nodes():
+    grid = load_grid('Athens.txt')
+    search_stats.reset()
+    a_star((grid.width - 2, grid.height - 2), (1, 1), grid)
+    a_star_nodes = search_stats.nodes_expanded
+
+    search_stats.reset()
+    jump_point_search((grid.width - 2, grid.height - 2), (1, 1), grid)
+    assert search_stats.nodes_expanded < a_star_nodes
+
+
+def test_jump_point_search_uses_cache():
+    grid = Grid.from_rows(['    ', ' XX ', '    '])
+    cache = PathCache()
+    robot = Robot(0, 0)
+
+    # Test case 1: The found path is set as the path of the robot and stored
+    assert jump_point_search((3, 2), robot, grid, cache) == 5
+    assert robot.path[-1] == (2, 3)
+    assert len(cache) == 1
+
+    # Test case 2: A part of it is answered by the cache
+    second_y, second_x = robot.path[1]
+    assert jump_point_search((3, 2), (second_x, second_y), grid, cache) == 4
+    assert cache.hits == 1
+
+
+@pytest.mark.parametrize('game_class', [CoopGame, MuteGame])
+def test_games_run_with_jump_point_search(game_class):
+    game = game_class(os.path.join(MAPS_DIR, 'Race.txt'), pathfinder='jps')
+    game.load()
+
+    assert game.pathfinder == 'jps'
+    game.run(max_steps=1000)
+    assert len(game.mazes) == 0
+
+
+def test_game_rejects_unknown_pathfinder():
+    assert set(PATHFINDERS) >= {'a_star', 'jps'}
+    with pytest.raises(ValueError):
+        CoopGame(os.path.join(MAPS_DIR, 'Race.txt'), pathfinder='dijkstra')
+
+
+def test_info_game_takes_no_pathfinder():
+    game = InfoGame(os.path.join(MAPS_DIR, 'Race.txt'))
+    assert game.pathfinder is None
+    with pytest.raises(ValueError):
+        InfoGame(os.path.join(MAPS_DIR, 'Race.txt'), pathfinder='jps')
@@ -0,0 +1,65 @@
+import pytest
+
+from gamePackage.algorithm import DistanceField
+from gamePackage.info_game import InfoGame
+from gamePackage.map_generator import *
+from gamePackage.map_parser import parse_map
+
+
+def test_generate_map_is_seeded():
+    # Test case 1: The same seed gives the same map
+    assert (generate_map(40, 30, seed=1) == generate_map(40, 30, seed=1)).all()
+
+    # Test case 2: Another seed gives another one
+    assert not (generate_map(40, 30, 'maze', seed=1) == generate_map(40, 30, 'maze', seed=2)).all()
+
+
+@pytest.mark.parametrize('style', list(MAP_STYLES))
+@pytest.mark.parametrize('collecting_point', COLLECTING_POINT_PLACEMENTS)
+def test_generated_maps_are_valid_and_connected(tmp_path, style, collecting_point):
+    symbols = generate_map(61, 41, style, robots=7, mazes=30, wall_density=0.2,
+                           collecting_point=collecting_point, seed=5)
+    path = str(tmp_path / 'map.txt')
+    save_map(symbols, path)
+
+    parsed_map = parse_map(path)
+    assert (parsed_map.width, parsed_map.height) == (61, 41)
+    assert len(parsed_map.robots) // 2 == 7 and len(parsed_map.mazes) // 2 == 30
+
+    # every free cell reaches the collecting point
+    grid = parsed_map.grid()
+    field = DistanceField(parsed_map.collecting_point, grid)
+    assert all(field.distances[index] >= 0 for index in range(grid.size) if not grid.walls[index])
+
+
+def test_collecting_point_placement():
+    # Test case 1: The free cell closest to the corner or the center
+    assert generate_map(21, 21, 'warehouse', collecting_point='corner')[1, 1] == COLLECTING_POINT
+    assert generate_map(21, 21, 'warehouse', robots=0, mazes=0, collecting_point='center')[10, 10] \
+        == COLLECTING_POINT
+
+    # Test case 2: The rows as strings contain exactly one collecting point
+    assert sum(row.count('0') for row in map_rows(generate_map(30, 20, collecting_point='random'))) == 1
+
+
+def test_generate_map_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        generate_map(20, 20, style='cave')
+    with pytest.raises(ValueError):
+        generate_map(20, 20, collecting_point='top')
+    with pytest.raises(ValueError):
+        generate_map(4, 20)
+    with pytest.raises(ValueError):
+        generate_map(20, 20, wall_density=1.5)
+    with pytest.raises(ValueError):
+        generate_map(9, 9, 'maze', robots=20, mazes=20)
+
+
+def test_game_runs_on_generated_map(tmp_path):
+    path = str(tmp_path / 'map.txt')
+    save_map(generate_map(30, 30, 'rooms', robots=3, mazes=10, seed=2), path)
+    game = InfoGame(path)
+    game.load()
+
+    game.run(max_steps=2000)
+    assert len(game.mazes) == 0
@@ -0,0 +1,66 @@
+import os
+import tracemalloc
+
+import pytest
+
+from gamePackage.map_parser import *
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', 'maps')
+
+
+def write_map(tmp_path, text):
+    path = tmp_path / 'map.txt'
+    path.write_bytes(text.encode())
+    return str(path)
+
+
+def test_parse_map(tmp_path):
+    parsed_map = parse_map(write_map(tmp_path, ' R X\r\nM0  \n\n'))
+
+    # Test case 1: Spaces at the ends of the rows are free cells, blank lines at the end are ignored
+    assert (parsed_map.width, parsed_map.height) == (4, 2)
+    assert bytes(parsed_map.walls) == bytes([0, 0, 0, 1, 0, 0, 0, 0])
+
+    # Test case 2: Objects in the order of the rows
+    assert list(parsed_map.robots) == [1, 0]
+    assert list(parsed_map.mazes) == [0, 1]
+    assert parsed_map.collecting_point == (1, 1)
+    assert parsed_map.grid().is_open(2, 0) and not parsed_map.grid().is_open(3, 0)
+
+
+def test_parse_map_in_chunks():
+    path = os.path.join(MAPS_DIR, 'Athens.txt')
+    parsed_map = parse_map(path)
+
+    # reading a few lines at a time gives the same map
+    assert parse_map(path, chunk_size=100) == parsed_map
+    with open(path) as file:
+        assert parsed_map.grid().walls == Grid.from_rows(file.read().split('\n')).walls
+
+
+@pytest.mark.parametrize('text, message', [
+    ('X0X\nXX\nXXX\n', 'line 2: row of 2 cells, the rows above have 3'),
+    ('X0X\n\nXXX\n', 'line 2: blank line inside the map'),
+    ('X0X\nX0X\n', 'line 2: second collecting point, the first one is at x: 1 y: 0'),
+    ('XRX\nXMX\n', "no collecting point '0'"),
+    ('\n\n', 'the map is empty'),
+])
+def test_parse_map_rejects_invalid_maps(tmp_path, text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_map(write_map(tmp_path, text))
+
+
+def test_parse_map_memory_stays_near_the_grid(tmp_path):
+    width, height = 1000, 1000
+    rows = ['X' + ' ' * (width - 2) + 'X'] * height
+    rows[0] = '0' + 'M' * (width - 1)
+    path = write_map(tmp_path, '\n'.join(rows) + '\n')
+
+    tracemalloc.start()
+    parsed_map = parse_map(path, chunk_size=1 << 16)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert parsed_map.height == height
+    # one byte per cell, the objects and a chunk of lines
+    assert peak < width * height * 1.5
@@ -0,0 +1,53 @@
+import pytest
+
+from gamePackage.mazes import *
+
+
+def test_maze_registry_transitions():
+    registry = MazeRegistry()
+    mazes = [Mazes(x, 0) for x in range(3)]
+    for maze in mazes:
+        registry.add(maze)
+    assert len(registry) == 3
+    assert registry.get((0, 1)) is mazes[1]
+    assert registry.get((1, 1)) is None
+
+    # Test case 1: Assigning and collecting moves the mazes between the states
+    registry.assign(mazes[1])
+    mazes[2].collected = True
+    assert registry.in_state(MazeState.UNCOLLECTED) == [mazes[0]]
+    assert registry.counts() == {'uncollected': 1, 'assigned': 1, 'collected': 1, 'delivered': 0}
+
+    # Test case 2: Collected mazes are not assigned again
+    registry.assign(mazes[2])
+    assert mazes[2].state == MazeState.COLLECTED
+
+    # Test case 3: Delivered mazes leave the active ones and are reported once
+    mazes[2].delivered = True
+    assert len(registry) == 2
+    assert list(registry) == mazes[:2]
+    assert mazes[2] not in registry
+    assert mazes[2].collected
+    assert registry.take_delivered() == [mazes[2]]
+    assert registry.take_delivered() == []
+
+    # Test case 4: Released mazes are uncollected again, collected ones stay collected
+    registry.release(mazes[1])
+    registry.release(mazes[2])
+    assert registry.in_state(MazeState.UNCOLLECTED) == [mazes[0], mazes[1]]
+    assert mazes[2].delivered
+
+
+def test_maze_registry_rejects_two_mazes_on_one_cell():
+    registry = MazeRegistry()
+    registry.add(Mazes(1, 1))
+    with pytest.raises(ValueError):
+        registry.add(Mazes(1, 1))
+
+
+def test_maze_without_registry():
+    maze = Mazes(0, 0)
+    maze.collected = True
+    assert maze.state == MazeState.COLLECTED
+    maze.delivered = True
+    assert maze.delivered and maze.collected
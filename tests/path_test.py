@@ -0,0 +1,49 @@
+import pytest
+
+from gamePackage.path import *
+from gamePackage.robot import *
+
+
+def test_advance_and_peek():
+    path = Path([(0, 0), (0, 1), (1, 1)])
+
+    assert path.peek() == (0, 0)
+    assert path.advance() == (0, 0)
+    assert path.advance() == (0, 1)
+    assert len(path) == 1
+    assert path == [(1, 1)]
+    assert path[0] == path[-1] == (1, 1)
+    assert path.advance() == (1, 1)
+    assert not path
+    assert path == []
+    with pytest.raises(IndexError):
+        path.peek()
+
+
+def test_splice():
+    path = Path([(0, 0), (0, 1), (0, 2), (0, 3)])
+    path.advance()
+
+    # Test case 1: The route is replanned from the second cell ahead
+    path.splice(2, [(1, 2), (2, 2)])
+    assert path == [(0, 1), (0, 2), (1, 2), (2, 2)]
+
+    # Test case 2: The whole route is replaced
+    path.splice(0, [(5, 5)])
+    assert list(path) == [(5, 5)]
+    with pytest.raises(IndexError):
+        path.splice(3, [])
+
+
+def test_robot_path():
+    robot = Robot(0, 0)
+
+    # Test case 1: Lists are wrapped into paths
+    robot.path = [(0, 0), (0, 1)]
+    assert isinstance(robot.path, Path)
+
+    # Test case 2: Moving consumes the path
+    robot.move_coop([])
+    robot.move_coop([])
+    assert robot.pos() == (1, 0)
+    assert robot.path == []
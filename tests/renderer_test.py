@@ -0,0 +1,151 @@
+import os
+
+import numpy as np
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+import settings
+from gamePackage.renderer import PygameRenderer, ArrayRenderer
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+def symbol_map(*rows):
+    """The maze_map of the rows as games keep it, one byte per cell."""
+    return np.array([list(row) for row in rows], dtype='S1')
+
+
+MAZE_MAP = symbol_map('X 0', 'MR ')
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    # the textures are loaded relative to the root of the project
+    monkeypatch.chdir(ROOT_DIR)
+    return PygameRenderer(pygame.Surface([120, 80]))
+
+
+@pytest.fixture
+def array_renderer(monkeypatch):
+    monkeypatch.chdir(ROOT_DIR)
+    return ArrayRenderer(pygame.Surface([120, 80]))
+
+
+def test_first_frame_draws_everything(renderer):
+    renderer.draw(MAZE_MAP)
+
+    # the cells are as large as possible for the map to fit onto the display
+    assert renderer.cell_size == 40
+    assert renderer.take_dirty_rects() == [pygame.Rect(0, 0, 120, 80)]
+    assert renderer.display.get_at((0, 0))[:3] == settings.BLACK
+    assert renderer.display.get_at((80, 0))[:3] == settings.BLUE
+    assert renderer.take_dirty_rects() == []
+
+
+def test_only_changed_cells_are_drawn(renderer):
+    renderer.draw(MAZE_MAP)
+    renderer.take_dirty_rects()
+
+    # Test case 1: Nothing changed
+    renderer.draw(MAZE_MAP)
+    assert renderer.take_dirty_rects() == []
+
+    # Test case 2: The robot moved one cell to the right
+    renderer.draw(symbol_map('X 0', 'M R'))
+    assert renderer.take_dirty_rects() == [pygame.Rect(40, 40, 40, 40), pygame.Rect(80, 40, 40, 40)]
+    assert renderer.display.get_at((40, 40))[:3] == settings.WHITE
+
+    # Test case 3: Invalidating draws everything again
+    renderer.invalidate()
+    renderer.draw(symbol_map('X 0', 'M R'))
+    assert len(renderer.take_dirty_rects()) == 1
+
+
+def test_static_map_is_cached(renderer):
+    renderer.draw(MAZE_MAP)
+    static_map = renderer.static_map
+
+    # Test case 1: Objects moving over the floor keep the static map
+    renderer.invalidate()
+    renderer.draw(symbol_map('X R', 'M 0'))
+    assert renderer.static_map is static_map
+    assert static_map.get_at((2, 0))[:3] == settings.WHITE
+
+    # Test case 2: Another map rebuilds it
+    renderer.draw(symbol_map('XX0 ', 'MR  '))
+    assert renderer.static_map is not static_map
+    assert renderer.display.get_at((renderer.cell_size, 0))[:3] == settings.BLACK
+
+
+def test_zoom_and_pan_draw_only_visible_cells(renderer):
+    maze_map = np.full((20, 30), b' ', dtype='S1')
+    maze_map[19, 29] = b'0'
+    renderer.draw(maze_map)
+    assert renderer.cell_size == 4
+
+    # Test case 1: Zooming in keeps the middle of the map on the screen
+    renderer.zoom(4)
+    assert renderer.cell_size == 16
+    assert renderer.viewport.visible() == (11, 7, 19, 12)
+    renderer.draw(maze_map)
+    assert renderer.texture_robot.get_size() == (16, 16)
+
+    # Test case 2: Panning stops at the border of the map and shows the collecting point
+    renderer.pan(100, 100)
+    renderer.draw(maze_map)
+    assert renderer.viewport.visible() == (22, 15, 30, 20)
+    assert renderer.display.get_at((7 * 16, 4 * 16))[:3] == settings.BLUE
+
+    # Test case 3: Changes outside the window are not drawn
+    renderer.take_dirty_rects()
+    maze_map[0, 0] = b'R'
+    renderer.draw(maze_map)
+    assert renderer.take_dirty_rects() == []
+
+
+def test_array_renderer_matches_cell_renderer(renderer, array_renderer):
+    maze_map = symbol_map('X 0', 'MR ', '  R')
+    renderer.draw(maze_map)
+    array_renderer.draw(maze_map)
+
+    expected = pygame.surfarray.array3d(renderer.display)
+    actual = pygame.surfarray.array3d(array_renderer.display)
+    # the sprites are blended with the floor slightly differently where they are transparent
+    assert (abs(expected.astype(int) - actual.astype(int)) > 2).mean() < 0.01
+    assert array_renderer.take_dirty_rects() == [pygame.Rect(0, 0, 120, 80)]
+
+
+def test_array_renderer_skips_unchanged_frames(array_renderer):
+    array_renderer.draw(MAZE_MAP)
+    array_renderer.take_dirty_rects()
+
+    # Test case 1: Nothing changed
+    array_renderer.draw(MAZE_MAP)
+    assert array_renderer.take_dirty_rects() == []
+
+    # Test case 2: Changed and invalidated frames are drawn
+    array_renderer.draw(symbol_map('X 0', 'M R'))
+    assert array_renderer.take_dirty_rects() == [pygame.Rect(0, 0, 120, 80)]
+    array_renderer.invalidate()
+    array_renderer.draw(symbol_map('X 0', 'M R'))
+    assert len(array_renderer.take_dirty_rects()) == 1
+
+    # Test case 3: Zooming draws the window again with smaller sprites
+    array_renderer.zoom(0.5)
+    array_renderer.draw(symbol_map('X 0', 'M R'))
+    assert array_renderer.cell_size == 20
+    assert len(array_renderer.take_dirty_rects()) == 1
+
+
+def test_draw_changes(renderer):
+    maze_map = symbol_map('X 0', 'MR ')
+    renderer.draw_changes(maze_map, [])
+    assert renderer.take_dirty_rects() == [pygame.Rect(0, 0, 120, 80)]
+
+    # only the listed cells are drawn, the rows drawn last are kept up to date
+    maze_map[1, 1], maze_map[1, 2] = b' ', b'R'
+    renderer.draw_changes(maze_map, [(1, 1, ' '), (2, 1, 'R')])
+    assert renderer.take_dirty_rects() == [pygame.Rect(40, 40, 40, 40), pygame.Rect(80, 40, 40, 40)]
+    renderer.draw(maze_map)
+    assert renderer.take_dirty_rects() == []
@@ -0,0 +1,34 @@
+import os
+
+from gamePackage.runner import *
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', 'maps')
+
+
+def test_run_episode_reports_measurements():
+    result = run_episode(os.path.join(MAPS_DIR, 'Race.txt'), 'Cooperation', seed=3)
+
+    assert list(result) == RESULT_FIELDS
+    assert result['completed'] is True
+    assert result['mazes_left'] == 0
+    assert result['steps'] > 0
+    assert result['searches'] > 0
+    assert result['nodes_expanded'] >= result['searches']
+    assert result['a_star_calls'] <= result['searches']
+    assert result['a_star_calls'] == result['cache_misses']
+
+
+def test_run_episode_limits_robots_and_steps():
+    result = run_episode(os.path.join(MAPS_DIR, 'Race.txt'), 'Mute', amount_robots=1, max_steps=5)
+
+    assert result['robots'] == 1
+    assert result['steps'] == 5
+    assert result['completed'] is False
+
+
+def test_run_episode_is_deterministic():
+    for mode in GAME_MODES:
+        results = [run_episode(os.path.join(MAPS_DIR, 'Ephesus.txt'), mode, seed=seed) for seed in (0, 1)]
+
+        assert results[0]['steps'] == results[1]['steps']
+        assert results[0]['nodes_expanded'] == results[1]['nodes_expanded']
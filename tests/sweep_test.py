@@ -0,0 +1,77 @@
+import json
+import os
+
+from gamePackage.sweep import *
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), '..', 'maps')
+RACE = os.path.join(MAPS_DIR, 'Race.txt')
+
+
+def test_sweep_runs():
+    runs = sweep_runs([RACE], ['Information', 'Mute'], robots=[1, 2], seeds=[0, 1],
+                      assignments=['greedy', 'optimal'], max_steps=50)
+
+    # Test case 1: Assignments are only combined with the Information mode
+    assert len(runs) == 2 * 2 * 2 + 2 * 2
+    assert {run['assignment'] for run in runs if run['mode'] == 'Mute'} == {None}
+
+    # Test case 2: Pathfinders are only combined with the other modes
+    pathfinder_runs = sweep_runs([RACE], ['Information', 'Mute'], pathfinders=['a_star', 'jps'])
+    assert [run['pathfinder'] for run in pathfinder_runs] == [None, 'a_star', 'jps']
+
+    # Test case 3: Runs are plain parameters, identified by their keys
+    assert all(list(run) == RUN_FIELDS for run in runs)
+    assert len({run_key(run) for run in runs}) == len(runs)
+
+
+def test_run_sweep_streams_results_into_file(tmp_path):
+    results_path = str(tmp_path / 'results.jsonl')
+    runs = sweep_runs([RACE], ['Cooperation', 'Mute'], robots=[1], seeds=[0, 1], max_steps=50)
+
+    finished = list(run_sweep(runs, results_path, workers=2))
+
+    # Test case 1: Every run is executed once, the results match a run in this process
+    assert sorted(run_key(run) for run, _ in finished) == sorted(run_key(run) for run in runs)
+    for run, result in finished:
+        assert result['steps'] == execute_run(run)[1]['steps']
+
+    # Test case 2: The file holds every finished run
+    assert set(completed_runs(results_path)) == {run_key(run) for run in runs}
+
+
+def test_run_sweep_resumes(tmp_path):
+    results_path = str(tmp_path / 'results.jsonl')
+    runs = sweep_runs([RACE], ['Mute'], robots=[1], seeds=[0, 1, 2], max_steps=50)
+    list(run_sweep(runs[:1], results_path, workers=1))
+    # an interrupted sweep leaves a line written only partly
+    with open(results_path, 'a') as file:
+        file.write(json.dumps({'run': runs[1]})[:20])
+
+    # Test case 1: The partly written run is not completed
+    assert set(completed_runs(results_path)) == {run_key(runs[0])}
+
+    # Test case 2: Only the missing runs are executed, the file stays readable
+    finished = list(run_sweep(runs, results_path, workers=1))
+    assert sorted(run['seed'] for run, _ in finished) == [1, 2]
+    assert set(completed_runs(results_path)) == {run_key(run) for run in runs}
+    with open(results_path) as file:
+        assert len(file.readlines()) == 3
+
+    # Test case 3: A finished sweep runs nothing
+    assert list(run_sweep(runs, results_path, workers=1)) == []
+
+
+def test_summarize():
+    results = [
+        {'map': 'a', 'mode': 'Mute', 'assignment': None, 'pathfinder': 'a_star', 'robots': 1,
+         'steps': steps, 'completed': steps < 30, 'time_per_step': 0.5, 'nodes_expanded': 10}
+        for steps in (10, 20, 30)
+    ]
+
+    rows = summarize(results)
+
+    assert len(rows) == 1
+    assert list(rows[0]) == SUMMARY_FIELDS
+    assert rows[0]['runs'] == 3
+    assert rows[0]['completed'] == 2
+    assert rows[0]['mean_steps'] == 20
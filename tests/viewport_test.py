@@ -0,0 +1,35 @@
+from gamePackage.viewport import *
+
+
+def test_cell_size_fits_the_map():
+    # Test case 1: Small maps get large cells, limited by the maximal size
+    assert Viewport(800, 800, 20, 10).cell_size == 40
+    assert Viewport(800, 800, 5, 5, max_cell_size=64).cell_size == 64
+
+    # Test case 2: Maps larger than the screen get one pixel per cell and only a part is visible
+    viewport = Viewport(800, 600, 1000, 1000)
+    assert viewport.cell_size == 1
+    assert viewport.visible() == (0, 0, 800, 600)
+
+
+def test_zoom_and_pan():
+    viewport = Viewport(100, 100, 50, 50)
+    assert viewport.cell_size == 2
+
+    # Test case 1: Zooming in keeps the middle cell in the middle
+    assert viewport.zoom(5)
+    assert viewport.cell_size == 10
+    assert viewport.visible() == (20, 20, 30, 30)
+    assert viewport.screen_pos(25, 20) == (50, 0)
+
+    # Test case 2: The window never leaves the map
+    viewport.pan(-100, 3)
+    assert viewport.visible() == (0, 23, 10, 33)
+    viewport.pan(100, 100)
+    assert viewport.visible() == (40, 40, 50, 50)
+
+    # Test case 3: Zooming out to the smallest size shows the whole map again
+    assert viewport.zoom(0.01)
+    assert viewport.cell_size == 1
+    assert viewport.visible() == (0, 0, 50, 50)
+    assert not viewport.zoom(0.5)